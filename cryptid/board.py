@@ -1,32 +1,170 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Annotated, Optional
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Annotated, Any, Iterable, Iterator, MutableMapping, Optional
 
-from cryptid.board_sections import BOARD_SECTION_OFFSETS, BOARD_SECTIONS
-from cryptid.hex import FixedLength, Hex
+import numpy as np
+import numpy.typing as npt
+
+from cryptid.board_layouts import BOARD_HEXES, LAYOUTS, LayoutTable, hex_to_slot, layout_arrays, layout_index
+from cryptid.clue_engine import (
+    ANIMAL_TERRITORIES,
+    NO_FEATURE,
+    TERRAINS,
+    BoardArrays,
+    Feature,
+    distance_transform,
+    feature_mask,
+    is_structure_feature,
+    neighborhood_indices,
+    read_only,
+    slot_distances,
+    to_mask,
+)
+from cryptid.hex import FixedLength, Hex, key_range_stencil
+from cryptid.hex_set import HexSet
+from cryptid.pathing import PathTable, TerrainCosts, cost_codes
+from cryptid.regions import RegionFeature, Regions
 from cryptid.setup_card import SetupCard
 from cryptid.tile import Structure, Tile
+from cryptid.tile_storage import DenseTiles, TileDict, TileStore
+
+if TYPE_CHECKING:
+    from cryptid.clue import Clue
 
 
 @dataclass
 class Board:
-    tiles: Annotated[dict[Hex, Tile], FixedLength(108)]
+    # writes to the tiles (assigning or deleting entries, or setting attributes of a compact board's TileView) drop
+    # the caches below through tiles_changed, set attributes of the plain Tiles of other boards with set_tile or
+    # place_structure instead. A plain dict is wrapped in a TileDict to hook its writes
+    tiles: Annotated[MutableMapping[Hex, Tile], FixedLength(108)]
+    _slots: Optional[tuple[Hex, ...]] = field(default=None, init=False, repr=False, compare=False)
+    _slot_index: Optional[dict[Hex, int]] = field(default=None, init=False, repr=False, compare=False)
+    _tiles_by_key: Optional[dict[int, Tile]] = field(default=None, init=False, repr=False, compare=False)
+    # keyed on (type, clue) so value equal clues share an entry without comparing clues of different types
+    _clue_masks: dict[tuple[type, Clue], int] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _arrays: Optional[BoardArrays] = field(default=None, init=False, repr=False, compare=False)
+    _distances: dict[Feature, npt.NDArray[np.int16]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    # keyed on pathing.cost_codes, terrain never changes so these are never invalidated
+    _path_tables: dict[tuple[float, ...], PathTable] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    # keyed on Terrain or AnimalTerritory, placing structures changes neither so these are kept by place_structure
+    _regions: dict[type[RegionFeature], Regions] = field(default_factory=dict, init=False, repr=False, compare=False)
 
     @classmethod
     def from_board_sections(
         cls,
         order: Annotated[list[int], FixedLength(6)],
         orientation: Optional[Annotated[list[bool], FixedLength(6)]] = None,
+        dense: bool = False,
+        compact: bool = False,
+    ) -> Board:
+        if sorted(order) == [1, 2, 3, 4, 5, 6]:
+            return cls.from_layout(layout_index(order, orientation), dense=dense, compact=compact)
+        return cls.from_layout_arrays(*layout_arrays(order, orientation), dense=dense, compact=compact)
+
+    @classmethod
+    def from_layout(cls, index: int, table: LayoutTable = LAYOUTS, dense: bool = False, compact: bool = False) -> Board:
+        """
+        build a board from the precomputed layout table
+        :param index: layout index, see board_layouts.layout_index
+        :param table: the layout table to read from
+        :param dense: store the tiles in a DenseTiles array instead of a dict
+        :param compact: store the tiles as feature code arrays in a TileStore, takes precedence over dense
+        """
+        return cls.from_layout_arrays(*table.layout(index), dense=dense, compact=compact)
+
+    @classmethod
+    def from_layout_arrays(
+        cls,
+        terrain: npt.NDArray[np.int8],
+        animal_territory: npt.NDArray[np.int8],
+        dense: bool = False,
+        compact: bool = False,
     ) -> Board:
-        tiles: dict[Hex, Tile] = dict()
-        orientation = orientation if orientation is not None else [False] * 6
-        for offset, (board_section, inverted) in enumerate(zip(order, orientation)):
-            tiles |= BOARD_SECTIONS[board_section - 1].invert(inverted).offset(BOARD_SECTION_OFFSETS[offset]).tiles
-        return cls(tiles=tiles)
+        """
+        build a standard board from terrain and animal territory codes in slot order (see board_layouts.BOARD_HEXES)
+        the codes are kept as the board's feature arrays so clues never rebuild them
+        the dict and DenseTiles storages build one Tile per slot, only compact boards are built without any
+        :param dense: store the tiles in a DenseTiles array instead of a dict
+        :param compact: store the tiles as feature code arrays in a TileStore, takes precedence over dense
+        """
+        if compact:
+            board = cls(tiles=TileStore.from_codes(terrain, animal_territory))
+            board._slots = BOARD_HEXES
+            return board
+        slot_tiles = [
+            Tile(
+                hex=hex,
+                terrain=TERRAINS[terrain_code],
+                animal_territory=None if animal_code == NO_FEATURE else ANIMAL_TERRITORIES[animal_code],
+            )
+            for hex, terrain_code, animal_code in zip(BOARD_HEXES, terrain.tolist(), animal_territory.tolist())
+        ]
+        tiles: MutableMapping[Hex, Tile]
+        if dense:
+            tiles = DenseTiles.from_slots(slot_tiles)
+        else:
+            tiles = TileDict((tile.hex, tile) for tile in slot_tiles)
+        board = cls(tiles=tiles)
+        board._slots = BOARD_HEXES
+        # read only so writes through the arrays can't reach the tiles, the caller's arrays or each other
+        no_shapes = np.full(len(BOARD_HEXES), NO_FEATURE, dtype=np.int8)
+        no_colors = no_shapes.copy()
+        no_shapes.setflags(write=False)
+        no_colors.setflags(write=False)
+        board._arrays = BoardArrays(read_only(terrain), read_only(animal_territory), no_shapes, no_colors)
+        return board
+
+    def __post_init__(self) -> None:
+        if type(self.tiles) is dict:
+            self.tiles = TileDict(self.tiles)
+        if isinstance(self.tiles, (TileDict, DenseTiles, TileStore)):
+            self.tiles.on_write = self.tiles_changed
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        # unpickled tile storage comes back without the write hook
+        self.__dict__.update(state)
+        self.__post_init__()
+
+    def tiles_changed(self, structures_only: bool = False) -> None:
+        """
+        drop every cache derived from the tiles, called by the tile storage after every write
+        :param structures_only: only structures changed, so caches of terrain and animal territory (regions, path
+            tables and the matching distances and clue masks) are kept
+        """
+        self._arrays = None
+        if structures_only:
+            self._distances = {
+                feature: distances
+                for feature, distances in self._distances.items()
+                if not is_structure_feature(feature)
+            }
+            self._clue_masks = {key: mask for key, mask in self._clue_masks.items() if not key[1].depends_on_structures}
+            return
+        self._distances = dict()
+        self._clue_masks = dict()
+        self._path_tables = dict()
+        self._regions = dict()
+        self._tiles_by_key = None
+        if self._slots is not None and len(self._slots) != len(self.tiles):
+            self._slots = None
+            self._slot_index = None
+
+    def set_tile(self, tile: Tile) -> None:
+        """
+        put tile on the board at tile.hex, replacing the tile there
+        """
+        self.tiles[tile.hex] = tile
+        self.tiles_changed()
 
     def place_structure(self, structure: Structure, location: Hex) -> None:
         self.tiles[location].structure = structure
+        self.tiles_changed(structures_only=True)
 
     @classmethod
     def from_setup_card(cls, card: SetupCard) -> Board:
@@ -36,10 +174,156 @@ class Board:
         return board
 
     def get_tiles_in_range(self, loc: Tile | Hex, range: int) -> list[Tile]:
-        tiles = []
+        return list(self.iter_tiles_in_range(loc, range))
+
+    def iter_tiles_in_range(self, loc: Tile | Hex, range: int) -> Iterator[Tile]:
+        """
+        lazily yield the board's tiles within range of loc, nearest first, so callers can stop at the closest match
+        """
         if isinstance(loc, Tile):
             loc = loc.hex
-        for possible_hex in loc.hexes_within_range(range):
-            if (possible_tile := self.tiles.get(possible_hex, None)) is not None:
-                tiles.append(possible_tile)
-        return tiles
+        key = loc.key
+        tiles_by_key = self.tiles_by_key
+        for offset in key_range_stencil(range):
+            if (possible_tile := tiles_by_key.get(key + offset, None)) is not None:
+                yield possible_tile
+
+    @property
+    def tiles_by_key(self) -> dict[int, Tile]:
+        """
+        the board's tiles keyed by Hex.key, so range lookups probe ints instead of hashing hexes
+        built on first use, tiles are never added to or removed from a board after it is made
+        """
+        if self._tiles_by_key is None:
+            self._tiles_by_key = {hex.key: tile for hex, tile in self.tiles.items()}
+        return self._tiles_by_key
+
+    @property
+    def slots(self) -> tuple[Hex, ...]:
+        """
+        fixed ordering of the board's hexes (sorted by axial q then r) used to index HexSet bits
+        for a standard board this is column major over the doubled height coordinates
+        """
+        if self._slots is None:
+            self._slots = tuple(sorted(self.tiles, key=lambda h: h.key))
+        return self._slots
+
+    @property
+    def slot_index(self) -> dict[Hex, int]:
+        if self._slot_index is None:
+            self._slot_index = {hex: index for index, hex in enumerate(self.slots)}
+        return self._slot_index
+
+    def slot_of(self, hex: Hex) -> Optional[int]:
+        """
+        slot index of a hex, or None if it is not on the board
+        standard boards compute it arithmetically so the hex is never hashed
+        """
+        if self.slots is BOARD_HEXES:
+            return hex_to_slot(hex)
+        return self.slot_index.get(hex, None)
+
+    @property
+    def full_mask(self) -> int:
+        return (1 << len(self.slots)) - 1
+
+    def empty_hex_set(self) -> HexSet:
+        return HexSet(self, 0)
+
+    def full_hex_set(self) -> HexSet:
+        return HexSet(self, self.full_mask)
+
+    def hex_set(self, locations: Iterable[Tile | Hex]) -> HexSet:
+        bits = 0
+        for loc in locations:
+            if isinstance(loc, Tile):
+                loc = loc.hex
+            if (slot := self.slot_of(loc)) is None:
+                raise KeyError(loc)
+            bits |= 1 << slot
+        return HexSet(self, bits)
+
+    @property
+    def arrays(self) -> BoardArrays:
+        """
+        feature codes of every tile in slot order, used for whole board clue evaluation
+        """
+        if self._arrays is None:
+            if isinstance(self.tiles, TileStore):
+                self._arrays = self.tiles.arrays()
+            else:
+                self._arrays = BoardArrays.from_board(self)
+        return self._arrays
+
+    def fingerprint(self, canonical: bool = False) -> int:
+        """
+        stable 128 bit hash of every tile's terrain, animal territory and structure, usable as an on disk cache key
+        :param canonical: give a board and the same board turned 180 degrees the same fingerprint, standard boards only
+        """
+        fingerprint = self.arrays.fingerprint()
+        if canonical:
+            if self.slots != BOARD_HEXES:
+                raise ValueError("only a standard 12 x 9 board can be canonicalized")
+            fingerprint = min(fingerprint, self.arrays.reversed().fingerprint())
+        return fingerprint
+
+    def neighborhood(self, radius: int) -> npt.NDArray[np.intp]:
+        """
+        slot indices within radius of every slot, off board hexes point at the padding index len(self.slots)
+        """
+        return neighborhood_indices(self.slots, radius)
+
+    @property
+    def distance_matrix(self) -> npt.NDArray[np.int16]:
+        """
+        hex distance between every pair of slots, computed once and shared by every board with the same slots
+        """
+        return slot_distances(self.slots)
+
+    def distance_to(self, feature: Feature) -> npt.NDArray[np.int16]:
+        """
+        hex distance from every slot to the nearest tile with the feature, memoized per feature
+        :param feature: a terrain, animal territory, shape or color, or one of those classes to match any of that kind
+        :return: array over board slots, clue_engine.UNREACHABLE where the board has no such feature
+        """
+        if (distances := self._distances.get(feature, None)) is None:
+            sources = feature_mask(self.arrays, feature)
+            distances = self._distances[feature] = distance_transform(sources, self.neighborhood(1))
+        return distances
+
+    def within_distance_mask(self, feature: Feature, radius: int) -> int:
+        """
+        bitmask over board slots of every tile within radius spaces of the feature
+        """
+        return to_mask(self.distance_to(feature) <= radius)
+
+    def path_table(self, costs: Optional[TerrainCosts] = None) -> PathTable:
+        """
+        cheapest paths between every pair of tiles, built once per board and set of terrain costs
+        :param costs: cost of stepping onto each terrain, see pathing.TerrainCosts
+        """
+        key = cost_codes(costs)
+        if (table := self._path_tables.get(key, None)) is None:
+            table = self._path_tables[key] = PathTable.build(self, costs)
+        return table
+
+    def regions(self, feature_type: type[RegionFeature]) -> Regions:
+        """
+        connected regions of every terrain or animal territory with their sizes, perimeters and adjacency
+        :param feature_type: Terrain or AnimalTerritory
+        """
+        if (regions := self._regions.get(feature_type, None)) is None:
+            regions = self._regions[feature_type] = Regions.from_board(self, feature_type)
+        return regions
+
+    def clue_mask(self, clue: Clue) -> HexSet:
+        """
+        every tile the cryptid can be on according to the clue
+        evaluated once per board and memoized until a structure is placed
+        :param clue: the clue to check
+        :return: HexSet of the tiles where clue.check_space is true
+        """
+        key = (type(clue), clue)
+        if (mask := self._clue_masks.get(key, None)) is None:
+            mask = self._clue_masks[key] = clue.check_mask(self)
+        return HexSet(self, mask)
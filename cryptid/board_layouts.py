@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from itertools import permutations
+from os import PathLike
+from typing import Annotated, Final, Optional
+
+import numpy as np
+import numpy.typing as npt
+
+from cryptid.board_sections import BOARD_SECTION_OFFSETS, BOARD_SECTIONS
+from cryptid.clue_engine import ANIMAL_TERRITORY_CODES, NO_FEATURE, TERRAIN_CODES
+from cryptid.hex import DoubledHeightCoordinateHex, FixedLength, Hex
+
+# Board layouts are every ordering of the 6 board sections combined with every inversion pattern.
+# A layout index packs both as order_index * NUM_ORIENTATIONS + orientation_bits, where order_index is the
+# position of the order in ORDERS and bit i of orientation_bits is set when the section in position i is inverted
+
+BOARD_COLUMNS: Final[int] = 12
+BOARD_ROWS: Final[int] = 9
+SECTION_COLUMNS: Final[int] = 6
+SECTION_ROWS: Final[int] = 3
+
+ORDERS: Final[tuple[tuple[int, ...], ...]] = tuple(permutations(range(1, 7)))
+NUM_ORDERS: Final[int] = len(ORDERS)
+NUM_ORIENTATIONS: Final[int] = 2**6
+NUM_LAYOUTS: Final[int] = NUM_ORDERS * NUM_ORIENTATIONS
+
+_ORDER_INDICES: Final[dict[tuple[int, ...], int]] = {order: index for index, order in enumerate(ORDERS)}
+
+# the hexes of a standard board in slot order (column major), matching Board.slots
+BOARD_HEXES: Final[tuple[DoubledHeightCoordinateHex, ...]] = tuple(
+    DoubledHeightCoordinateHex.from_compact_2d_coordinates(col, half_row).interned()
+    for col in range(BOARD_COLUMNS)
+    for half_row in range(BOARD_ROWS)
+)
+
+
+def hex_to_slot(hex: Hex) -> Optional[int]:
+    """
+    board slot of any hex on a standard board, computed arithmetically from its doubled height coordinates
+    :return: slot index, or None if the hex is off the board
+    """
+    if type(hex) is DoubledHeightCoordinateHex:
+        col, half_row = hex.to_compact_2d_coordinates()
+    else:
+        col, half_row = hex.to_axial_coordinate_hex().to_double_height_coordinate_hex().to_compact_2d_coordinates()
+    if 0 <= col < BOARD_COLUMNS and 0 <= half_row < BOARD_ROWS:
+        return col * BOARD_ROWS + half_row
+    return None
+
+
+def slot_to_hex(slot: int) -> DoubledHeightCoordinateHex:
+    return BOARD_HEXES[slot]
+
+
+# the hexes of a board section in section slot order (column major)
+_SECTION_HEXES: Final[tuple[DoubledHeightCoordinateHex, ...]] = tuple(
+    DoubledHeightCoordinateHex.from_compact_2d_coordinates(col, half_row)
+    for col in range(SECTION_COLUMNS)
+    for half_row in range(SECTION_ROWS)
+)
+
+
+def _section_codes() -> tuple[npt.NDArray[np.int8], npt.NDArray[np.int8]]:
+    terrain = np.empty((len(BOARD_SECTIONS), 2, len(_SECTION_HEXES)), dtype=np.int8)
+    animal_territory = np.empty_like(terrain)
+    for section_index, board_section in enumerate(BOARD_SECTIONS):
+        for inverted in [False, True]:
+            view = board_section.view(inverted=inverted)
+            for slot, hex in enumerate(_SECTION_HEXES):
+                if (tile := view.base_tile(hex)) is None:
+                    raise KeyError(hex)
+                terrain[section_index, int(inverted), slot] = TERRAIN_CODES[tile.terrain]
+                animal_territory[section_index, int(inverted), slot] = (
+                    NO_FEATURE if tile.animal_territory is None else ANIMAL_TERRITORY_CODES[tile.animal_territory]
+                )
+    return terrain, animal_territory
+
+
+# feature codes of each board section, indexed by [section number - 1, inverted, section slot]
+SECTION_TERRAIN_CODES, SECTION_ANIMAL_TERRITORY_CODES = _section_codes()
+
+# board slot of every section slot, indexed by [board position, section slot]
+SECTION_SLOT_INDICES: Final[npt.NDArray[np.intp]] = np.array(
+    [
+        [(hex.col + offset.col) * BOARD_ROWS + (hex.row + offset.row) // 2 for hex in _SECTION_HEXES]
+        for offset in BOARD_SECTION_OFFSETS
+    ],
+    dtype=np.intp,
+)
+
+
+def layout_index(
+    order: Annotated[list[int], FixedLength(6)],
+    orientation: Optional[Annotated[list[bool], FixedLength(6)]] = None,
+) -> int:
+    """
+    :param order: board section numbers (1-6) in board position order, must use each section once
+    :param orientation: if the section in each board position is inverted
+    :return: index of the layout in [0, NUM_LAYOUTS)
+    """
+    if (order_index := _ORDER_INDICES.get(tuple(order), None)) is None:
+        raise ValueError(f"layout order must be a permutation of board sections 1-6, got {order} instead")
+    orientation = orientation if orientation is not None else [False] * 6
+    return order_index * NUM_ORIENTATIONS + sum(
+        1 << position for position, inverted in enumerate(orientation) if inverted
+    )
+
+
+def layout_from_index(index: int) -> tuple[list[int], list[bool]]:
+    """
+    inverse of layout_index
+    :return: the board section order and orientation of the layout
+    """
+    if not 0 <= index < NUM_LAYOUTS:
+        raise ValueError(f"layout index must be in [0, {NUM_LAYOUTS}), got {index} instead")
+    order_index, orientation_bits = divmod(index, NUM_ORIENTATIONS)
+    return list(ORDERS[order_index]), [bool(orientation_bits >> position & 1) for position in range(6)]
+
+
+def rotated_layout_index(index: int) -> int:
+    """
+    the layout of the same board turned 180 degrees: the board positions are reversed and every section is flipped
+    turning a standard board reverses its slot order, so both layouts give the same puzzles up to symmetry
+    """
+    order, orientation = layout_from_index(index)
+    return layout_index(order[::-1], [not inverted for inverted in orientation[::-1]])
+
+
+def canonical_layout_index(index: int) -> int:
+    """
+    the smaller index of a layout and its 180 degree rotation, equal for both layouts
+    """
+    return min(index, rotated_layout_index(index))
+
+
+def layout_arrays(
+    order: Annotated[list[int], FixedLength(6)],
+    orientation: Optional[Annotated[list[bool], FixedLength(6)]] = None,
+) -> tuple[npt.NDArray[np.int8], npt.NDArray[np.int8]]:
+    """
+    terrain and animal territory codes of a board in slot order, sections may be repeated
+    :param order: board section numbers (1-6) in board position order
+    :param orientation: if the section in each board position is inverted
+    :return: terrain codes and animal territory codes over the board slots
+    """
+    orientation = orientation if orientation is not None else [False] * 6
+    sections = np.array(order, dtype=np.intp) - 1
+    inverted = np.array(orientation, dtype=np.intp)
+    terrain = np.empty(len(BOARD_HEXES), dtype=np.int8)
+    animal_territory = np.empty(len(BOARD_HEXES), dtype=np.int8)
+    terrain[SECTION_SLOT_INDICES] = SECTION_TERRAIN_CODES[sections, inverted]
+    animal_territory[SECTION_SLOT_INDICES] = SECTION_ANIMAL_TERRITORY_CODES[sections, inverted]
+    return terrain, animal_territory
+
+
+@dataclass(frozen=True)
+class LayoutTable:
+    """
+    terrain and animal territory codes of every board layout, indexed by [layout index, board slot]
+    rows are filled in on first use, or all at once with build_all
+    """
+
+    terrain: npt.NDArray[np.int8]
+    animal_territory: npt.NDArray[np.int8]
+    built: npt.NDArray[np.bool_]
+
+    @classmethod
+    def empty(cls) -> LayoutTable:
+        return cls(
+            terrain=np.zeros((NUM_LAYOUTS, len(BOARD_HEXES)), dtype=np.int8),
+            animal_territory=np.zeros((NUM_LAYOUTS, len(BOARD_HEXES)), dtype=np.int8),
+            built=np.zeros(NUM_LAYOUTS, dtype=np.bool_),
+        )
+
+    def layout(self, index: int) -> tuple[npt.NDArray[np.int8], npt.NDArray[np.int8]]:
+        """
+        :param index: layout index from layout_index
+        :return: read only views of the terrain and animal territory codes of the layout
+        """
+        if not self.built[index]:
+            order, orientation = layout_from_index(index)
+            self.terrain[index], self.animal_territory[index] = layout_arrays(order, orientation)
+            self.built[index] = True
+        terrain, animal_territory = self.terrain[index], self.animal_territory[index]
+        terrain.setflags(write=False)
+        animal_territory.setflags(write=False)
+        return terrain, animal_territory
+
+    def build_all(self) -> LayoutTable:
+        orders = np.array(ORDERS, dtype=np.intp) - 1
+        for orientation_bits in range(NUM_ORIENTATIONS):
+            inverted = np.array([orientation_bits >> position & 1 for position in range(6)], dtype=np.intp)
+            rows = np.arange(NUM_ORDERS) * NUM_ORIENTATIONS + orientation_bits
+            self.terrain[rows[:, None, None], SECTION_SLOT_INDICES] = SECTION_TERRAIN_CODES[orders, inverted]
+            self.animal_territory[rows[:, None, None], SECTION_SLOT_INDICES] = SECTION_ANIMAL_TERRITORY_CODES[
+                orders, inverted
+            ]
+        self.built[:] = True
+        return self
+
+    def save(self, path: str | PathLike[str]) -> None:
+        np.savez_compressed(path, terrain=self.terrain, animal_territory=self.animal_territory, built=self.built)
+
+    @classmethod
+    def load(cls, path: str | PathLike[str]) -> LayoutTable:
+        with np.load(path) as data:
+            table = cls(terrain=data["terrain"], animal_territory=data["animal_territory"], built=data["built"])
+        if table.terrain.shape != (NUM_LAYOUTS, len(BOARD_HEXES)):
+            raise ValueError(
+                f"layout table has shape {table.terrain.shape}, expected {(NUM_LAYOUTS, len(BOARD_HEXES))}"
+            )
+        return table
+
+
+# shared table used by Board.from_layout
+LAYOUTS: Final[LayoutTable] = LayoutTable.empty()
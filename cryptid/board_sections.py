@@ -1,35 +1,131 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Annotated, Final
+from dataclasses import dataclass, field
+from typing import Annotated, Any, Final, Iterator, Mapping, Optional
 
-from cryptid.hex import AxialCoordinateHex, DoubledHeightCoordinateHex, FixedLength, Hex
+from cryptid.hex import AxialCoordinateHex, DoubledHeightCoordinateHex, FixedLength, Hex, pack_key
+from cryptid.hex_array import HexArray
+from cryptid.hex_transform import HexTransform
 from cryptid.tile import AnimalTerritory, Terrain, Tile
 
 
 @dataclass(frozen=True)
 class BoardSection:
     tiles: Annotated[dict[Hex, Tile], FixedLength(18)]
+    # the same tiles keyed by Hex.key, for BoardSectionView lookups
+    _tiles_by_key: dict[int, Tile] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_tiles_by_key", {hex.key: tile for hex, tile in self.tiles.items()})
 
     def offset(self, offset_hex: Hex) -> BoardSection:
-        new_tiles: dict[Hex, Tile] = dict()
-        for k, tile in self.tiles.items():
-            new_tile: Tile = tile + offset_hex
-            new_tiles[new_tile.hex] = new_tile
-        return BoardSection(tiles=new_tiles)
+        return self.transform(HexTransform.translation(offset_hex))
 
     def invert(self, inverted: bool = True) -> BoardSection:
         if not inverted:
             return self
+        return self.transform(SECTION_INVERSION)
+
+    def transform(self, transform: HexTransform) -> BoardSection:
+        """
+        move every tile of the section with one vectorized transform of all of its hexes
+        """
+        tiles = list(self.tiles.values())
+        hexes = transform.apply_array(HexArray.from_hexes([tile.hex for tile in tiles])).to_hexes()
+        return BoardSection.from_tile_list([tile.with_hex(hex) for tile, hex in zip(tiles, hexes)])
 
-        new_tile_list: list[Tile] = [AxialCoordinateHex(5, 0) - tile for tile in self.tiles.values()]  # type: ignore
-        return BoardSection.from_tile_list(new_tile_list)
+    def view(self, offset: Optional[Hex] = None, inverted: bool = False) -> BoardSectionView:
+        """
+        the section inverted and then offset without copying any tiles, see BoardSectionView
+        view(offset, inverted) has the same tiles as invert(inverted).offset(offset)
+        """
+        axial_offset = AxialCoordinateHex(0, 0) if offset is None else offset.to_axial_coordinate_hex()
+        return BoardSectionView(self, axial_offset, inverted)
 
     @classmethod
     def from_tile_list(cls, tile_list: Annotated[list[Tile], FixedLength(18)]) -> BoardSection:
         return cls(tiles={tile.hex: tile for tile in tile_list})
 
 
+# turns a section upside down in place, the 180 degree rotation taking axial (q, r) to (5 - q, -r)
+SECTION_INVERSION: Final[HexTransform] = HexTransform.rotation(3).then(
+    HexTransform.translation(AxialCoordinateHex(5, 0))
+)
+# SECTION_INVERSION maps the hex with key k to the hex with key _INVERSION_KEY - k, packing keys is linear
+_INVERSION_KEY: Final[int] = pack_key(5, 0)
+
+
+@dataclass(frozen=True, eq=False)
+class BoardSectionView(Mapping[Hex, Tile]):
+    """
+    a board section moved into place (inverted, then offset) that maps hexes back onto the base section on lookup
+    making and moving views never copies tiles, base_tile returns the base section's tile (at its original hex),
+    __getitem__ builds one moved Tile per lookup and materialize builds the whole moved BoardSection
+    views compare equal to any mapping with the same moved tiles
+    boards aren't built from views, Board.from_board_sections reads the precomputed section codes in
+    board_layouts instead, which are themselves read through views
+    """
+
+    section: BoardSection
+    offset: AxialCoordinateHex
+    inverted: bool = False
+
+    @property
+    def transform(self) -> HexTransform:
+        translation = HexTransform.translation(self.offset)
+        return SECTION_INVERSION.then(translation) if self.inverted else translation
+
+    def base_key(self, hex: Hex) -> int:
+        """
+        key of the hex of the base section that lands on hex
+        """
+        key = hex.key - self.offset.key
+        return _INVERSION_KEY - key if self.inverted else key
+
+    def base_tile(self, hex: Any) -> Optional[Tile]:
+        """
+        the base section's tile that lands on hex, without building a moved copy
+        use it to read a tile's features, its hex is the unmoved one
+        """
+        if not isinstance(hex, Hex):
+            return None
+        return self.section._tiles_by_key.get(self.base_key(hex), None)
+
+    def offset_by(self, offset: Hex) -> BoardSectionView:
+        """
+        the view moved by a further offset, like BoardSection.offset
+        """
+        return BoardSectionView(self.section, self.offset + offset.to_axial_coordinate_hex(), self.inverted)
+
+    def invert(self, inverted: bool = True) -> BoardSectionView:
+        """
+        like BoardSection.invert, turning the view about the section's own center, so the offset flips too
+        """
+        if not inverted:
+            return self
+        # SECTION_INVERSION(x + offset) = SECTION_INVERSION(x) - offset
+        return BoardSectionView(self.section, -self.offset, not self.inverted)
+
+    def materialize(self) -> BoardSection:
+        return self.section.transform(self.transform)
+
+    def __getitem__(self, hex: Hex) -> Tile:
+        if (tile := self.base_tile(hex)) is None:
+            raise KeyError(hex)
+        return tile.with_hex(hex)
+
+    def __contains__(self, hex: Any) -> bool:
+        return self.base_tile(hex) is not None
+
+    def __iter__(self) -> Iterator[Hex]:
+        transform = self.transform
+        for hex in self.section.tiles:
+            yield transform.apply(hex)
+
+    def __len__(self) -> int:
+        return len(self.section.tiles)
+
+
 # fmt: off
 SECTION_1: Final[BoardSection] = BoardSection.from_tile_list([
     Tile(hex=DoubledHeightCoordinateHex.from_row_col(col=0, row=0), terrain=Terrain.WATER),
@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Iterator, Optional
+
+import numpy as np
+import numpy.typing as npt
+
+from cryptid.board import Board
+from cryptid.board_layouts import BOARD_HEXES, LAYOUTS, LayoutTable, hex_to_slot
+from cryptid.clue_engine import (
+    ANIMAL_TERRITORIES,
+    COLOR_CODES,
+    NO_FEATURE,
+    SHAPE_CODES,
+    TERRAINS,
+    BoardArrays,
+    read_only,
+)
+from cryptid.hex import Hex
+from cryptid.tile import Structure, Tile
+
+
+@dataclass(frozen=True)
+class Placement:
+    """
+    one structure placed on a snapshot, linked to the placements made before it
+    """
+
+    slot: int
+    structure: Structure
+    previous: Optional[Placement] = None
+
+
+@dataclass(frozen=True, eq=False)
+class BoardSnapshot:
+    """
+    immutable standard board that shares its storage with the snapshots it was derived from
+    the terrain and animal territory codes are read only arrays shared by every snapshot of a layout (the rows of the
+    layout table when made with from_layout), and structures are a linked chain of placements, so with_structure is
+    O(1) and never copies tiles. Snapshots can be shared freely between threads
+    compare snapshots with fingerprint, equality is identity
+    """
+
+    terrain: npt.NDArray[np.int8]
+    animal_territory: npt.NDArray[np.int8]
+    last_placement: Optional[Placement] = None
+    # derived once on first use, setting it again from another thread just stores an equal value
+    _arrays: Optional[BoardArrays] = field(default=None, init=False, repr=False)
+
+    @classmethod
+    def from_layout(cls, index: int, table: LayoutTable = LAYOUTS) -> BoardSnapshot:
+        """
+        :param index: layout index, see board_layouts.layout_index
+        """
+        return cls(*table.layout(index))
+
+    @classmethod
+    def from_board(cls, board: Board) -> BoardSnapshot:
+        """
+        snapshot of a board's current tiles, later changes to the board don't affect the snapshot
+        """
+        if board.slots != BOARD_HEXES:
+            raise ValueError("only a standard 12 x 9 board can be snapshotted")
+        arrays = board.arrays
+        snapshot = cls(read_only(arrays.terrain), read_only(arrays.animal_territory))
+        for slot, hex in enumerate(BOARD_HEXES):
+            if (structure := board.tiles[hex].structure) is not None:
+                snapshot = snapshot.with_structure(structure, slot)
+        return snapshot
+
+    def with_structure(self, structure: Structure, location: Hex | int) -> BoardSnapshot:
+        """
+        a new snapshot with one more structure, replacing any structure already at location
+        :param location: hex or board slot
+        """
+        slot = location if isinstance(location, int) else hex_to_slot(location)
+        if slot is None or not 0 <= slot < len(BOARD_HEXES):
+            raise KeyError(location)
+        return BoardSnapshot(self.terrain, self.animal_territory, Placement(slot, structure, self.last_placement))
+
+    def placements(self) -> Iterator[Placement]:
+        """
+        every placement, latest first, including any that were later replaced
+        """
+        placement = self.last_placement
+        while placement is not None:
+            yield placement
+            placement = placement.previous
+
+    def structures(self) -> dict[int, Structure]:
+        """
+        the structure on every slot that has one, in slot order
+        """
+        structures: dict[int, Structure] = dict()
+        for placement in self.placements():
+            structures.setdefault(placement.slot, placement.structure)
+        return dict(sorted(structures.items()))
+
+    def structure_at(self, location: Hex | int) -> Optional[Structure]:
+        slot = location if isinstance(location, int) else hex_to_slot(location)
+        for placement in self.placements():
+            if placement.slot == slot:
+                return placement.structure
+        return None
+
+    def tile(self, location: Hex | int) -> Tile:
+        """
+        a new Tile for the slot, changing it does not change the snapshot
+        """
+        slot = location if isinstance(location, int) else hex_to_slot(location)
+        if slot is None or not 0 <= slot < len(BOARD_HEXES):
+            raise KeyError(location)
+        animal_code = int(self.animal_territory[slot])
+        return Tile(
+            hex=BOARD_HEXES[slot],
+            terrain=TERRAINS[int(self.terrain[slot])],
+            animal_territory=None if animal_code == NO_FEATURE else ANIMAL_TERRITORIES[animal_code],
+            structure=self.structure_at(slot),
+        )
+
+    @property
+    def arrays(self) -> BoardArrays:
+        arrays = self._arrays
+        if arrays is None:
+            shapes = np.full(len(BOARD_HEXES), NO_FEATURE, dtype=np.int8)
+            colors = shapes.copy()
+            for slot, structure in self.structures().items():
+                shapes[slot] = SHAPE_CODES[structure.shape]
+                colors[slot] = COLOR_CODES[structure.color]
+            shapes.setflags(write=False)
+            colors.setflags(write=False)
+            arrays = BoardArrays(self.terrain, self.animal_territory, shapes, colors)
+            object.__setattr__(self, "_arrays", arrays)
+        return arrays
+
+    def fingerprint(self, canonical: bool = False) -> int:
+        """
+        the same fingerprint as Board.fingerprint of the equivalent board
+        """
+        fingerprint = self.arrays.fingerprint()
+        if canonical:
+            fingerprint = min(fingerprint, self.arrays.reversed().fingerprint())
+        return fingerprint
+
+    def to_board(self, dense: bool = False) -> Board:
+        """
+        a new mutable board with the snapshot's tiles, for clue evaluation or further changes
+        :param dense: store the tiles in a DenseTiles array instead of a dict
+        """
+        board = Board.from_layout_arrays(self.terrain, self.animal_territory, dense=dense)
+        for slot, structure in self.structures().items():
+            board.tiles[BOARD_HEXES[slot]].structure = structure
+        board._arrays = self.arrays
+        return board
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import TYPE_CHECKING, Annotated, Any, Final
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Annotated, Any, ClassVar, Final
 
+from cryptid import clue_engine
 from cryptid.hex import FixedLength
-from cryptid.tile import AnimalTerritory, Color, Shape, Terrain, Tile
+from cryptid.tile import AnimalTerritory, Color, Shape, Terrain, Tile, flags
 
 if TYPE_CHECKING:
     from cryptid.board import Board
@@ -17,6 +18,9 @@ class Clue(ABC):
     Clue describing where the cryptid can or cannot be located
     """
 
+    # if placing a structure on the board can change how this clue resolves
+    depends_on_structures: ClassVar[bool] = True
+
     @property
     @abstractmethod
     def neg(self) -> bool:
@@ -42,6 +46,28 @@ class Clue(ABC):
         output = self.resolve(tile, board)
         return output if not self.neg else not output
 
+    def resolve_mask(self, board: Board) -> int:
+        """
+        resolve the rule for every tile on the board at once
+        :param board: the board setup
+        :return: bitmask over board.slots of the tiles where resolve is true
+        """
+        mask = 0
+        tiles = board.tiles
+        for index, hex in enumerate(board.slots):
+            if self.resolve(tiles[hex], board):
+                mask |= 1 << index
+        return mask
+
+    def check_mask(self, board: Board) -> int:
+        """
+        return the bitmask over board.slots of every tile the cryptid can be on according to this clue
+        :param board: the board setup
+        :return: bitmask over board.slots
+        """
+        mask = self.resolve_mask(board)
+        return mask if not self.neg else board.full_mask ^ mask
+
     @abstractmethod
     def describe(self) -> str:
         """
@@ -62,14 +88,19 @@ class OnOneOfTwoTerrainClue(Clue):
     cryptid is in one of two habitats
     """
 
+    depends_on_structures: ClassVar[bool] = False
+
     valid_terrains: Annotated[list[Terrain], FixedLength(2)]
     negated: bool = False
+    # Terrain.flag of both valid terrains, so checking a tile is one AND instead of a list scan
+    terrain_flags: int = field(default=0, init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         if (num_terrains := len(self.valid_terrains)) != 2:
             raise ValueError(f"must pass 2 valid terrains, got {num_terrains} instead")
-        if self.valid_terrains[0] == self.valid_terrains[1]:
+        if self.valid_terrains[0] is self.valid_terrains[1]:
             raise ValueError(f"must pass 2 different valid terrains, got 2 of {self.valid_terrains[0].value} instead")
+        object.__setattr__(self, "terrain_flags", flags(self.valid_terrains))
 
     def __hash__(self) -> int:
         terrains_sorted = sorted(self.valid_terrains)
@@ -85,7 +116,10 @@ class OnOneOfTwoTerrainClue(Clue):
         return self.negated
 
     def resolve(self, tile: Tile, board: Board) -> bool:
-        return tile.terrain in self.valid_terrains
+        return tile.terrain.flag & self.terrain_flags != 0
+
+    def resolve_mask(self, board: Board) -> int:
+        return clue_engine.to_mask(clue_engine.on_terrain_flags(board.arrays, self.terrain_flags))
 
     def describe(self) -> str:
         return f"on {self.valid_terrains[0].value.lower()} or {self.valid_terrains[1].value.lower()}"
@@ -97,6 +131,8 @@ class WithinOneSpaceOfTerrainClue(Clue):
     cryptid is either on or adjacent to a specific terrain
     """
 
+    depends_on_structures: ClassVar[bool] = False
+
     terrain: Terrain
     negated: bool = False
 
@@ -105,11 +141,14 @@ class WithinOneSpaceOfTerrainClue(Clue):
         return self.negated
 
     def resolve(self, tile: Tile, board: Board) -> bool:
-        for possible_tile in board.get_tiles_in_range(tile, 1):
-            if possible_tile.terrain == self.terrain:
+        for possible_tile in board.iter_tiles_in_range(tile, 1):
+            if possible_tile.terrain is self.terrain:
                 return True
         return False
 
+    def resolve_mask(self, board: Board) -> int:
+        return board.within_distance_mask(self.terrain, 1)
+
     def describe(self) -> str:
         return f"within one space of {self.terrain.value.lower()}"
 
@@ -120,6 +159,8 @@ class WithinOneSpaceOfEitherAnimalTerritoryClue(Clue):
     cryptid is either on or adjacent to any animal territory
     """
 
+    depends_on_structures: ClassVar[bool] = False
+
     negated: bool = False
 
     @property
@@ -127,11 +168,14 @@ class WithinOneSpaceOfEitherAnimalTerritoryClue(Clue):
         return self.negated
 
     def resolve(self, tile: Tile, board: Board) -> bool:
-        for possible_tile in board.get_tiles_in_range(tile, 1):
+        for possible_tile in board.iter_tiles_in_range(tile, 1):
             if possible_tile.animal_territory is not None:
                 return True
         return False
 
+    def resolve_mask(self, board: Board) -> int:
+        return board.within_distance_mask(AnimalTerritory, 1)
+
     def describe(self) -> str:
         return "within one space of either animal territory"
 
@@ -150,12 +194,14 @@ class WithinTwoSpacesOfShapeClue(Clue):
         return self.negated
 
     def resolve(self, tile: Tile, board: Board) -> bool:
-        for possible_hex in tile.hex.hexes_within_range(2):
-            if (possible_tile := board.tiles.get(possible_hex, None)) is not None:
-                if getattr(possible_tile.structure, "shape", None) == self.shape:
-                    return True
+        for possible_tile in board.iter_tiles_in_range(tile, 2):
+            if getattr(possible_tile.structure, "shape", None) is self.shape:
+                return True
         return False
 
+    def resolve_mask(self, board: Board) -> int:
+        return board.within_distance_mask(self.shape, 2)
+
     def describe(self) -> str:
         shape_str = self.shape.value.lower().replace("_", " ")
         a_vs_an = "an" if self.shape == Shape.ABANDONED_SHACK else "a"
@@ -168,6 +214,8 @@ class WithinTwoSpacesOfAnimalTerritoryClue(Clue):
     cryptid is within 2 spaces a specific animal territory
     """
 
+    depends_on_structures: ClassVar[bool] = False
+
     animal_territory: AnimalTerritory
     negated: bool = False
 
@@ -176,11 +224,14 @@ class WithinTwoSpacesOfAnimalTerritoryClue(Clue):
         return self.negated
 
     def resolve(self, tile: Tile, board: Board) -> bool:
-        for possible_tile in board.get_tiles_in_range(tile, 2):
-            if possible_tile.animal_territory == self.animal_territory:
+        for possible_tile in board.iter_tiles_in_range(tile, 2):
+            if possible_tile.animal_territory is self.animal_territory:
                 return True
         return False
 
+    def resolve_mask(self, board: Board) -> int:
+        return board.within_distance_mask(self.animal_territory, 2)
+
     def describe(self) -> str:
         return f"within two spaces of {self.animal_territory.value.lower()} territory"
 
@@ -199,11 +250,14 @@ class WithinThreeSpacesOfColorClue(Clue):
         return self.negated
 
     def resolve(self, tile: Tile, board: Board) -> bool:
-        for possible_tile in board.get_tiles_in_range(tile, 3):
-            if getattr(possible_tile.structure, "color", None) == self.color:
+        for possible_tile in board.iter_tiles_in_range(tile, 3):
+            if getattr(possible_tile.structure, "color", None) is self.color:
                 return True
         return False
 
+    def resolve_mask(self, board: Board) -> int:
+        return board.within_distance_mask(self.color, 3)
+
     def describe(self) -> str:
         return f"within three spaces of a {self.color.value.lower()} structure"
 
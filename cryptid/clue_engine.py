@@ -0,0 +1,282 @@
+from __future__ import annotations
+
+import hashlib
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING, Final, Iterable, Optional, TypeAlias
+
+import numpy as np
+import numpy.typing as npt
+
+from cryptid.hex import Hex
+from cryptid.hex_array import HexArray
+from cryptid.tile import AnimalTerritory, Color, Shape, Terrain, flags
+
+if TYPE_CHECKING:
+    from cryptid.board import Board
+
+
+# code stored for a missing animal territory or structure
+NO_FEATURE: Final[int] = -1
+
+TERRAIN_CODES: Final[dict[Terrain, int]] = {terrain: terrain.code for terrain in Terrain}
+ANIMAL_TERRITORY_CODES: Final[dict[AnimalTerritory, int]] = {
+    animal_territory: animal_territory.code for animal_territory in AnimalTerritory
+}
+SHAPE_CODES: Final[dict[Shape, int]] = {shape: shape.code for shape in Shape}
+COLOR_CODES: Final[dict[Color, int]] = {color: color.code for color in Color}
+
+# features indexed by their code
+TERRAINS: Final[tuple[Terrain, ...]] = tuple(Terrain)
+ANIMAL_TERRITORIES: Final[tuple[AnimalTerritory, ...]] = tuple(AnimalTerritory)
+
+# Terrain.flag indexed by terrain code
+TERRAIN_FLAGS: Final[npt.NDArray[np.uint8]] = np.array([terrain.flag for terrain in TERRAINS], dtype=np.uint8)
+
+# bump when the fingerprint input changes so on disk caches keyed by old fingerprints are not reused
+FINGERPRINT_VERSION: Final[int] = 1
+
+# distance stored for slots that cannot reach the feature at all
+UNREACHABLE: Final[int] = np.iinfo(np.int16).max
+
+# a specific feature, or a feature class (e.g. AnimalTerritory) to match any feature of that kind
+Feature: TypeAlias = (
+    Terrain | AnimalTerritory | Shape | Color | type[Terrain] | type[AnimalTerritory] | type[Shape] | type[Color]
+)
+
+
+@dataclass(frozen=True)
+class BoardArrays:
+    """
+    feature codes of every tile on a board, indexed by board slot (see Board.slots)
+    """
+
+    terrain: npt.NDArray[np.int8]
+    animal_territory: npt.NDArray[np.int8]
+    structure_shape: npt.NDArray[np.int8]
+    structure_color: npt.NDArray[np.int8]
+
+    def fingerprint(self) -> int:
+        """
+        stable 128 bit hash of the feature codes, the same in every process (unlike hash())
+        """
+        digest = hashlib.blake2b(FINGERPRINT_VERSION.to_bytes(2, "little"), digest_size=16)
+        for codes in [self.terrain, self.animal_territory, self.structure_shape, self.structure_color]:
+            digest.update(np.ascontiguousarray(codes, dtype=np.int8).tobytes())
+        return int.from_bytes(digest.digest(), "little")
+
+    @property
+    def terrain_flags(self) -> npt.NDArray[np.uint8]:
+        """
+        Terrain.flag of every slot, matched against a set of terrains with one AND
+        """
+        return TERRAIN_FLAGS[self.terrain]
+
+    @property
+    def structure_codes(self) -> npt.NDArray[np.int8]:
+        """
+        Structure.code of every slot, NO_FEATURE for slots without a structure
+        """
+        return np.where(
+            self.structure_shape == NO_FEATURE,
+            NO_FEATURE,
+            self.structure_shape * len(COLOR_CODES) + self.structure_color,
+        ).astype(np.int8)
+
+    def reversed(self) -> BoardArrays:
+        """
+        the arrays in reverse slot order, which on a standard board is the board turned 180 degrees
+        """
+        return BoardArrays(
+            self.terrain[::-1], self.animal_territory[::-1], self.structure_shape[::-1], self.structure_color[::-1]
+        )
+
+    @classmethod
+    def from_board(cls, board: Board) -> BoardArrays:
+        tiles = [board.tiles[hex] for hex in board.slots]
+        return cls(
+            terrain=np.array([TERRAIN_CODES[tile.terrain] for tile in tiles], dtype=np.int8),
+            animal_territory=np.array(
+                [
+                    NO_FEATURE if tile.animal_territory is None else ANIMAL_TERRITORY_CODES[tile.animal_territory]
+                    for tile in tiles
+                ],
+                dtype=np.int8,
+            ),
+            structure_shape=np.array(
+                [NO_FEATURE if tile.structure is None else SHAPE_CODES[tile.structure.shape] for tile in tiles],
+                dtype=np.int8,
+            ),
+            structure_color=np.array(
+                [NO_FEATURE if tile.structure is None else COLOR_CODES[tile.structure.color] for tile in tiles],
+                dtype=np.int8,
+            ),
+        )
+
+
+@lru_cache(maxsize=16)
+def neighborhood_indices(slots: tuple[Hex, ...], radius: int) -> npt.NDArray[np.intp]:
+    """
+    slot indices of every hex within radius of each slot
+    hexes that fall off the board point at the padding index len(slots)
+    :param slots: the board slots
+    :param radius: neighborhood radius
+    :return: array of shape (len(slots), 3 * radius * (radius + 1) + 1)
+    """
+    slot_index = {hex: index for index, hex in enumerate(slots)}
+    padding = len(slots)
+    indices = np.array(
+        [[slot_index.get(possible_hex, padding) for possible_hex in hex.hexes_within_range(radius)] for hex in slots],
+        dtype=np.intp,
+    )
+    indices.setflags(write=False)
+    return indices
+
+
+@lru_cache(maxsize=16)
+def neighbor_indices(slots: tuple[Hex, ...]) -> tuple[tuple[int, ...], ...]:
+    """
+    adjacency lists of the board, the slot indices of the on board neighbors of each slot
+    :param slots: the board slots
+    :return: tuple of neighbor slot indices per slot
+    """
+    slot_index = {hex: index for index, hex in enumerate(slots)}
+    return tuple(
+        tuple(index for neighbor in hex.neighbors if (index := slot_index.get(neighbor, None)) is not None)
+        for hex in slots
+    )
+
+
+def feature_mask(arrays: BoardArrays, feature: Feature) -> npt.NDArray[np.bool_]:
+    """
+    which slots have the feature
+    :param arrays: the board feature arrays
+    :param feature: a terrain, animal territory, shape or color, or one of those classes to match any of that kind
+    :return: boolean array over board slots
+    """
+    match feature:
+        case Terrain():
+            return arrays.terrain == TERRAIN_CODES[feature]
+        case AnimalTerritory():
+            return arrays.animal_territory == ANIMAL_TERRITORY_CODES[feature]
+        case Shape():
+            return arrays.structure_shape == SHAPE_CODES[feature]
+        case Color():
+            return arrays.structure_color == COLOR_CODES[feature]
+    if feature is Terrain:
+        return np.ones(arrays.terrain.shape, dtype=np.bool_)
+    if feature is AnimalTerritory:
+        return arrays.animal_territory != NO_FEATURE
+    if feature is Shape or feature is Color:
+        return arrays.structure_shape != NO_FEATURE
+    raise TypeError(f"unknown board feature {feature!r}")
+
+
+def is_structure_feature(feature: Feature) -> bool:
+    return isinstance(feature, (Shape, Color)) or feature is Shape or feature is Color
+
+
+@lru_cache(maxsize=16)
+def slot_distances(slots: tuple[Hex, ...]) -> npt.NDArray[np.int16]:
+    """
+    hex distance between every pair of board slots
+    :param slots: the board slots
+    :return: array of shape (len(slots), len(slots))
+    """
+    if len({type(hex) for hex in slots}) == 1:
+        hexes = HexArray.from_hexes(slots)
+    else:
+        hexes = HexArray.from_keys([hex.key for hex in slots])
+    distances = hexes.distances().astype(np.int16)
+    distances.setflags(write=False)
+    return distances
+
+
+def distance_transform(sources: npt.NDArray[np.bool_], neighborhood: npt.NDArray[np.intp]) -> npt.NDArray[np.int16]:
+    """
+    hex distance from every slot to the nearest source slot, in one multi-source breadth first search
+    each level of the search reaches every slot next to the last level at once with within_range
+    :param sources: boolean array over board slots
+    :param neighborhood: radius 1 neighborhood index array from neighborhood_indices
+    :return: array over board slots, UNREACHABLE where no source can be reached
+    """
+    distances = np.full(len(neighborhood), UNREACHABLE, dtype=np.int16)
+    reached = np.array(sources, dtype=np.bool_)
+    frontier = reached
+    distance = 0
+    while frontier.any():
+        distances[frontier] = distance
+        distance += 1
+        frontier = within_range(frontier, neighborhood) & ~reached
+        reached |= frontier
+    distances.setflags(write=False)
+    return distances
+
+
+def within_range(feature: npt.NDArray[np.bool_], neighborhood: npt.NDArray[np.intp]) -> npt.NDArray[np.bool_]:
+    """
+    for every slot, whether any slot in its neighborhood has the feature
+    :param feature: boolean array over board slots
+    :param neighborhood: neighborhood index array from neighborhood_indices
+    :return: boolean array over board slots
+    """
+    padded = np.append(feature, False)
+    return padded[neighborhood].any(axis=1)
+
+
+def read_only(codes: npt.NDArray[np.int8]) -> npt.NDArray[np.int8]:
+    """
+    codes that can't be changed in place, copying them only if they are writable
+    """
+    if not codes.flags.writeable:
+        return codes
+    codes = codes.copy()
+    codes.setflags(write=False)
+    return codes
+
+
+def to_mask(values: npt.NDArray[np.bool_]) -> int:
+    """
+    pack a boolean array over board slots into an int bitmask (bit i is slot i)
+    """
+    return int.from_bytes(np.packbits(values, bitorder="little").tobytes(), "little")
+
+
+def on_terrains(arrays: BoardArrays, terrains: Iterable[Terrain]) -> npt.NDArray[np.bool_]:
+    return on_terrain_flags(arrays, flags(terrains))
+
+
+def on_terrain_flags(arrays: BoardArrays, terrain_flags: int) -> npt.NDArray[np.bool_]:
+    """
+    :param terrain_flags: Terrain.flag of every terrain to match, or'ed together
+    """
+    return (arrays.terrain_flags & terrain_flags) != 0
+
+
+def within_range_of_terrain(
+    arrays: BoardArrays, neighborhood: npt.NDArray[np.intp], terrain: Terrain
+) -> npt.NDArray[np.bool_]:
+    return within_range(arrays.terrain == TERRAIN_CODES[terrain], neighborhood)
+
+
+def within_range_of_animal_territory(
+    arrays: BoardArrays, neighborhood: npt.NDArray[np.intp], animal_territory: Optional[AnimalTerritory] = None
+) -> npt.NDArray[np.bool_]:
+    """
+    :param animal_territory: the territory to look for, None matches either animal territory
+    """
+    if animal_territory is None:
+        return within_range(arrays.animal_territory != NO_FEATURE, neighborhood)
+    return within_range(arrays.animal_territory == ANIMAL_TERRITORY_CODES[animal_territory], neighborhood)
+
+
+def within_range_of_shape(
+    arrays: BoardArrays, neighborhood: npt.NDArray[np.intp], shape: Shape
+) -> npt.NDArray[np.bool_]:
+    return within_range(arrays.structure_shape == SHAPE_CODES[shape], neighborhood)
+
+
+def within_range_of_color(
+    arrays: BoardArrays, neighborhood: npt.NDArray[np.intp], color: Color
+) -> npt.NDArray[np.bool_]:
+    return within_range(arrays.structure_color == COLOR_CODES[color], neighborhood)
@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from itertools import chain, combinations, groupby, product
+from typing import Iterable, Iterator, Optional, Sequence
+
+from cryptid.board import Board
+from cryptid.clue import Clue
+from cryptid.hex import Hex
+from cryptid.tile import Tile
+
+
+def is_minimal(masks: Iterable[int], full_mask: int) -> bool:
+    """
+    :param masks: clue masks of a combination
+    :return: if dropping any one of the masks leaves more than one tile
+    """
+    masks = list(masks)
+    for skipped in range(len(masks)):
+        others = full_mask
+        for position, mask in enumerate(masks):
+            if position != skipped:
+                others &= mask
+        if others & (others - 1) == 0:
+            return False
+    return True
+
+
+def search_combinations(
+    masks: Sequence[int],
+    candidates: Sequence[int],
+    size: int,
+    full_mask: int,
+    minimal: bool = True,
+    repeats: Optional[Sequence[int]] = None,
+) -> Iterator[tuple[tuple[int, ...], int]]:
+    """
+    depth first search for combinations of masks whose intersection is exactly one tile
+    a branch is abandoned as soon as its running intersection is empty, a mask stops narrowing it (minimal) or it
+    already isolates a tile (minimal)
+    :param masks: clue masks over board slots
+    :param candidates: ascending indices into masks to combine, e.g. only the masks containing a target tile
+    :param size: number of masks in each combination
+    :param minimal: only keep combinations where every mask is needed
+    :param repeats: how many times each mask may be picked when not minimal, e.g. the number of clues sharing it,
+    once by default (a minimal combination never repeats a mask, as the second copy is never needed)
+    :return: iterator of (non decreasing indices into masks, the single bit intersection)
+    """
+    chosen: list[int] = list()
+    repeats = None if minimal else repeats
+
+    def search(start: int, running: int) -> Iterator[tuple[tuple[int, ...], int]]:
+        remaining = size - len(chosen)
+        stop = len(candidates) if repeats is not None else len(candidates) - remaining + 1
+        for position in range(start, stop):
+            index = candidates[position]
+            narrowed = running & masks[index]
+            # an empty mask never isolates a tile, and a minimal search also skips the whole board mask as it never
+            # narrows the running intersection
+            if not narrowed or (minimal and narrowed == running):
+                continue
+            if remaining == 1:
+                if narrowed & (narrowed - 1) == 0 and (
+                    not minimal or is_minimal((masks[i] for i in chosen + [index]), full_mask)
+                ):
+                    yield tuple(chosen) + (index,), narrowed
+                continue
+            # once a prefix isolates a tile, any further clue is redundant
+            if minimal and narrowed & (narrowed - 1) == 0:
+                continue
+            chosen.append(index)
+            # stay on this mask while it has picks left
+            again = repeats is not None and chosen.count(index) < repeats[index]
+            yield from search(position if again else position + 1, narrowed)
+            chosen.pop()
+
+    if size > 0:
+        yield from search(0, full_mask)
+
+
+@dataclass(frozen=True)
+class ClueIndex:
+    """
+    inverted index from every board slot to the whole board clue masks containing it, for puzzle authoring
+    clues with the same mask on the board are interchangeable, so searches run over the distinct masks and each
+    combination of masks expands into every combination of their clues
+    a non minimal combination may pick a mask once for each of its clues
+    """
+
+    board: Board
+    # every distinct clue mask, in order of first clue
+    masks: tuple[int, ...]
+    # the clues with each mask, in pool order
+    clues: tuple[tuple[Clue, ...], ...]
+    # indices into masks of every mask containing each slot, ascending
+    by_slot: tuple[tuple[int, ...], ...]
+
+    @classmethod
+    def build(cls, board: Board, clues: Iterable[Clue]) -> ClueIndex:
+        """
+        :param clues: the pool of clues, e.g. generator.unique_book_clues or every clue of the books
+        """
+        clues_by_mask: dict[int, list[Clue]] = dict()
+        for clue in clues:
+            clues_by_mask.setdefault(board.clue_mask(clue).bits, []).append(clue)
+        masks = tuple(clues_by_mask)
+        by_slot = tuple(
+            tuple(index for index, mask in enumerate(masks) if mask >> slot & 1) for slot in range(len(board.slots))
+        )
+        return cls(board, masks, tuple(tuple(group) for group in clues_by_mask.values()), by_slot)
+
+    @property
+    def _repeats(self) -> tuple[int, ...]:
+        return tuple(len(clues) for clues in self.clues)
+
+    def _slot(self, location: Tile | Hex) -> int:
+        if isinstance(location, Tile):
+            location = location.hex
+        if (slot := self.board.slot_of(location)) is None:
+            raise KeyError(location)
+        return slot
+
+    def _clue_combinations(self, indices: tuple[int, ...]) -> Iterator[tuple[Clue, ...]]:
+        """
+        every combination of clues for a combination of masks, a mask picked n times uses n of its clues
+        """
+        for parts in product(*(combinations(self.clues[index], len(list(picks))) for index, picks in groupby(indices))):
+            yield tuple(chain.from_iterable(parts))
+
+    def clues_containing(self, location: Tile | Hex) -> list[Clue]:
+        """
+        every clue of the pool that allows the cryptid on location
+        """
+        return [clue for index in self.by_slot[self._slot(location)] for clue in self.clues[index]]
+
+    def isolating_masks(
+        self,
+        location: Tile | Hex,
+        clues_per_combination: int,
+        minimal: bool = True,
+        max_combinations: Optional[int] = None,
+    ) -> Iterator[tuple[int, ...]]:
+        """
+        every combination of masks whose intersection is exactly location
+        only masks containing location are combined, so the running intersection never drops the target, and a
+        branch is abandoned as soon as a clue stops narrowing it
+        :param minimal: only keep combinations where every clue is needed
+        :param max_combinations: stop after this many combinations
+        :return: iterator of non decreasing indices into masks
+        """
+        slot = self._slot(location)
+        found = 0
+        # every candidate contains the target, so a single tile intersection is always the target
+        for indices, _ in search_combinations(
+            self.masks, self.by_slot[slot], clues_per_combination, self.board.full_mask, minimal, self._repeats
+        ):
+            found += 1
+            yield indices
+            if max_combinations is not None and found >= max_combinations:
+                return
+
+    def combinations(self, clues_per_combination: int, minimal: bool = True) -> Iterator[tuple[tuple[Clue, ...], Hex]]:
+        """
+        every combination of clues from the pool that pins the cryptid to a single tile, whichever tile that is
+        :return: iterator of (clues, cryptid location)
+        """
+        everything = range(len(self.masks))
+        for indices, narrowed in search_combinations(
+            self.masks, everything, clues_per_combination, self.board.full_mask, minimal, self._repeats
+        ):
+            cryptid = self.board.slots[narrowed.bit_length() - 1]
+            for combination in self._clue_combinations(indices):
+                yield combination, cryptid
+
+    def isolating(
+        self,
+        location: Tile | Hex,
+        clues_per_combination: int,
+        minimal: bool = True,
+        max_combinations: Optional[int] = None,
+    ) -> Iterator[tuple[Clue, ...]]:
+        """
+        every combination of clues from the pool that pins the cryptid to location, see isolating_masks
+        :param max_combinations: stop after this many combinations of masks, each may expand to several of clues
+        :return: iterator of clue combinations
+        """
+        for indices in self.isolating_masks(location, clues_per_combination, minimal, max_combinations):
+            yield from self._clue_combinations(indices)
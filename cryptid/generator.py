@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Final, Iterable, Iterator, Optional, Sequence
+
+from cryptid.board import Board
+from cryptid.board_layouts import NUM_LAYOUTS, canonical_layout_index
+from cryptid.clue import BLUE_CLUES, BROWN_CLUES, GREEN_CLUES, PURPLE_CLUES, RED_CLUES, Clue
+from cryptid.clue_search import ClueIndex
+from cryptid.hex import Hex
+from cryptid.tile import Color, Shape, Structure
+
+# structures used in the base game, the advanced game adds the black structures
+BASE_STRUCTURES: Final[tuple[Structure, ...]] = tuple(
+    Structure(shape, color) for color in [Color.WHITE, Color.GREEN, Color.BLUE] for shape in Shape
+)
+ADVANCED_STRUCTURES: Final[tuple[Structure, ...]] = BASE_STRUCTURES + tuple(
+    Structure(shape, Color.BLACK) for shape in Shape
+)
+
+
+def unique_book_clues() -> tuple[Clue, ...]:
+    """
+    every distinct clue across the 5 clue books, in book order
+    """
+    clues: dict[tuple[type, Clue], Clue] = dict()
+    for book in [RED_CLUES, GREEN_CLUES, BLUE_CLUES, BROWN_CLUES, PURPLE_CLUES]:
+        for clue in book[1:]:
+            clues.setdefault((type(clue), clue), clue)
+    return tuple(clues.values())
+
+
+@dataclass(frozen=True)
+class Puzzle:
+    layout_index: int
+    structures: tuple[tuple[Hex, Structure], ...]
+    clues: tuple[Clue, ...]
+    cryptid: Hex
+
+    def to_board(self) -> Board:
+        board = Board.from_layout(self.layout_index)
+        for location, structure in self.structures:
+            board.place_structure(structure, location)
+        return board
+
+
+@dataclass(frozen=True)
+class Shard:
+    """
+    one unit of generator work: a layout and the seed used to place its structures
+    """
+
+    layout_index: int
+    seed: int
+    clues_per_puzzle: int
+    structures: tuple[Structure, ...]
+    clue_pool: tuple[Clue, ...]
+    minimal: bool
+    max_puzzles: Optional[int]
+
+
+def random_structure_placement(
+    board: Board, structures: Sequence[Structure], rng: random.Random
+) -> tuple[tuple[Hex, Structure], ...]:
+    """
+    place every structure on a different random tile of the board
+    """
+    locations = rng.sample(board.slots, len(structures))
+    return tuple(zip(locations, structures))
+
+
+def find_puzzles(
+    board: Board,
+    clues: Sequence[Clue],
+    clues_per_puzzle: int,
+    minimal: bool = True,
+    max_puzzles: Optional[int] = None,
+) -> Iterator[tuple[tuple[Clue, ...], Hex]]:
+    """
+    find every combination of clues whose combined answer is exactly one tile of the board
+    searched with a ClueIndex, see clue_search.search_combinations for the pruning
+    :param board: the board setup
+    :param clues: the pool of clues to combine
+    :param clues_per_puzzle: number of clues in each combination
+    :param minimal: only keep combinations where every clue is needed (dropping any clue leaves several tiles)
+    :param max_puzzles: stop after this many combinations
+    :return: iterator of (clues, cryptid location)
+    """
+    for found, puzzle in enumerate(ClueIndex.build(board, clues).combinations(clues_per_puzzle, minimal), start=1):
+        yield puzzle
+        if max_puzzles is not None and found >= max_puzzles:
+            return
+
+
+def generate_shard(shard: Shard) -> list[Puzzle]:
+    board = Board.from_layout(shard.layout_index)
+    structures = random_structure_placement(board, shard.structures, random.Random(shard.seed))
+    for location, structure in structures:
+        board.place_structure(structure, location)
+    return [
+        Puzzle(layout_index=shard.layout_index, structures=structures, clues=clues, cryptid=cryptid)
+        for clues, cryptid in find_puzzles(
+            board, shard.clue_pool, shard.clues_per_puzzle, shard.minimal, shard.max_puzzles
+        )
+    ]
+
+
+@dataclass
+class GenerationStats:
+    boards: int = 0
+    puzzles: int = 0
+    elapsed: float = 0.0
+    workers: int = 1
+
+    @property
+    def puzzles_per_second(self) -> float:
+        return self.puzzles / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def puzzles_per_second_per_core(self) -> float:
+        return self.puzzles_per_second / self.workers
+
+    def __str__(self) -> str:
+        return (
+            f"{self.puzzles} puzzles from {self.boards} boards in {self.elapsed:.2f}s on {self.workers} worker(s): "
+            f"{self.puzzles_per_second_per_core:.1f} puzzles/s/core"
+        )
+
+
+def make_shards(
+    num_boards: int,
+    clues_per_puzzle: int = 3,
+    seed: int = 0,
+    structures: Sequence[Structure] = BASE_STRUCTURES,
+    clue_pool: Optional[Iterable[Clue]] = None,
+    minimal: bool = True,
+    max_puzzles_per_board: Optional[int] = None,
+) -> list[Shard]:
+    """
+    split generation into one shard per random (layout, structure placement) pair
+    the same seed always gives the same shards
+    """
+    rng = random.Random(seed)
+    clue_pool = tuple(clue_pool) if clue_pool is not None else unique_book_clues()
+    return [
+        Shard(
+            # a layout and its 180 degree rotation give the same puzzles, so only one of each pair is searched
+            layout_index=canonical_layout_index(rng.randrange(NUM_LAYOUTS)),
+            seed=rng.getrandbits(64),
+            clues_per_puzzle=clues_per_puzzle,
+            structures=tuple(structures),
+            clue_pool=clue_pool,
+            minimal=minimal,
+            max_puzzles=max_puzzles_per_board,
+        )
+        for _ in range(num_boards)
+    ]
+
+
+def generate_puzzles(
+    num_boards: int,
+    clues_per_puzzle: int = 3,
+    seed: int = 0,
+    structures: Sequence[Structure] = BASE_STRUCTURES,
+    clue_pool: Optional[Iterable[Clue]] = None,
+    minimal: bool = True,
+    max_puzzles_per_board: Optional[int] = None,
+    max_workers: Optional[int] = None,
+    stats: Optional[GenerationStats] = None,
+) -> Iterator[Puzzle]:
+    """
+    mass produce puzzles with a unique cryptid location, sharded across a process pool
+    puzzles are yielded as soon as their shard finishes, so shard order is not preserved with more than one worker
+    :param num_boards: number of random (layout, structure placement) boards to search
+    :param clues_per_puzzle: number of clues in each puzzle
+    :param seed: seed for picking layouts and structure placements
+    :param structures: structures to place on each board
+    :param clue_pool: clues to combine, defaults to every distinct clue in the clue books
+    :param minimal: only keep puzzles where every clue is needed
+    :param max_puzzles_per_board: stop searching a board after this many puzzles
+    :param max_workers: number of worker processes, 1 runs in this process
+    :param stats: updated in place with throughput as puzzles are produced
+    :return: iterator of puzzles
+    """
+    shards = make_shards(num_boards, clues_per_puzzle, seed, structures, clue_pool, minimal, max_puzzles_per_board)
+    max_workers = max_workers if max_workers is not None else (os.cpu_count() or 1)
+    stats = stats if stats is not None else GenerationStats()
+    stats.workers = max_workers
+    start = time.perf_counter()
+
+    if max_workers == 1:
+        for shard in shards:
+            puzzles = generate_shard(shard)
+            stats.boards += 1
+            stats.puzzles += len(puzzles)
+            stats.elapsed = time.perf_counter() - start
+            yield from puzzles
+        return
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(generate_shard, shard) for shard in shards]
+        try:
+            for future in as_completed(futures):
+                puzzles = future.result()
+                stats.boards += 1
+                stats.puzzles += len(puzzles)
+                stats.elapsed = time.perf_counter() - start
+                yield from puzzles
+        finally:
+            # closing the generator early drops the shards that haven't started instead of waiting for every one
+            for future in futures:
+                future.cancel()
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 import copy
+import functools
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, fields
 from types import NotImplementedType
-from typing import Annotated, Any, Optional, Self
+from typing import Annotated, Any, Final, Iterator, Optional, Self, TypeVar, cast
 
 
 @dataclass(frozen=True)
@@ -12,8 +13,75 @@ class FixedLength:
     length: int
 
 
+# a hex key packs its axial (q, r) into one int, q in the high bits so keys sort like (q, r)
+KEY_SHIFT: Final[int] = 32
+_KEY_OFFSET: Final[int] = 1 << (KEY_SHIFT - 1)
+
+
+def pack_key(q: int, r: int) -> int:
+    """
+    :param q: axial q
+    :param r: axial r, must fit in a signed 32 bit int
+    :return: the canonical key of the hex at axial (q, r)
+    """
+    return (q << KEY_SHIFT) + r
+
+
+def unpack_key(key: int) -> tuple[int, int]:
+    """
+    :return: the axial (q, r) of a key made by pack_key
+    """
+    q, r = divmod(key + _KEY_OFFSET, 1 << KEY_SHIFT)
+    return q, r - _KEY_OFFSET
+
+
+# hexes built internally from coordinates that are valid by construction (conversions, arithmetic, stencils) skip the
+# __post_init__ checks, see Hex._unchecked.  Hexes built through the public constructors are always checked
+_full_validation: bool = False
+
+
+def set_full_validation(enabled: bool) -> bool:
+    """
+    debug switch to also validate every internally built hex, for tracking down a bad conversion
+    :return: the previous setting
+    """
+    global _full_validation
+    previous, _full_validation = _full_validation, enabled
+    return previous
+
+
+def full_validation_enabled() -> bool:
+    return _full_validation
+
+
+_new = object.__new__
+_set = object.__setattr__
+
+
+@functools.cache
+def axial_range_stencil(n: int) -> tuple[tuple[int, int], ...]:
+    """
+    axial (q, r) offsets of every hex within n spaces of the origin, built once per radius
+    """
+    return tuple((q, r) for q in range(-n, n + 1) for r in range(max(-n, -n - q), min(n, n - q) + 1))
+
+
+@functools.cache
+def key_range_stencil(n: int) -> tuple[int, ...]:
+    """
+    key offsets of every hex within n spaces, nearest first so searches can stop at the closest hit
+    packing is linear so hex.key + offset is the key of each neighbor
+    """
+    offsets = sorted(axial_range_stencil(n), key=lambda offset: max(abs(offset[0]), abs(offset[1]), abs(sum(offset))))
+    return tuple(pack_key(q, r) for q, r in offsets)
+
+
 @dataclass(frozen=True)
 class Hex(ABC):
+    # slotted by hand rather than with dataclass(slots=True), which rebuilds the class and breaks bare super() calls
+    # _key caches Hex.key and is not a dataclass field
+    __slots__ = ("q", "r", "_key")
+
     q: int
     r: int
 
@@ -27,16 +95,49 @@ class Hex(ABC):
 
     @property
     def neighbors(self) -> Annotated[list[Self], FixedLength(6)]:
-        return [self + direction for direction in self.neighbor_directions]
+        return [self._step(direction) for direction in self.neighbor_directions]
+
+    def neighbor(self, direction: int) -> Self:
+        """
+        :param direction: index into neighbor_directions
+        """
+        return self._step(self.neighbor_directions[direction])
+
+    def _step(self, direction: Self) -> Self:
+        return self + direction
+
+    def ring(self, n: int) -> Iterator[Self]:
+        """
+        lazily yield the hexes exactly n spaces away, walking neighbor_directions around the ring
+        """
+        if n == 0:
+            yield self
+            return
+        hex = self
+        for _ in range(n):
+            hex = hex.neighbor(4)
+        for direction in range(6):
+            for _ in range(n):
+                yield hex
+                hex = hex.neighbor(direction)
+
+    def spiral(self, n: int) -> Iterator[Self]:
+        """
+        lazily yield every hex within n spaces in order of distance, ring by ring, so searches can stop at the nearest hit
+        """
+        for radius in range(n + 1):
+            yield from self.ring(radius)
 
     def hexes_within_range(self, n: int) -> list[Self]:
-        output = list()
+        return list(self.iter_hexes_within_range(n))
+
+    def iter_hexes_within_range(self, n: int) -> Iterator[Self]:
+        """
+        lazily yield every hex within n spaces, in the same order as hexes_within_range
+        """
         center = self.to_axial_coordinate_hex()
-        for q in range(-n, n + 1):
-            for r in range(max(-n, -n - q), min(n, n - q) + 1):
-                ah: AxialCoordinateHex = center + AxialCoordinateHex(q, r)
-                output.append(self.from_axial_coordinate_hex(ah))
-        return output
+        for q, r in axial_range_stencil(n):
+            yield self.from_axial_coordinate_hex(AxialCoordinateHex(center.q + q, center.r + r))
 
     def to_axial_coordinate_hex(self) -> AxialCoordinateHex:
         return AxialCoordinateHex(self.q, self.r)
@@ -45,6 +146,45 @@ class Hex(ABC):
     def from_axial_coordinate_hex(cls, axial_hex: AxialCoordinateHex) -> Self:
         return cls(axial_hex.q, axial_hex.r)
 
+    @classmethod
+    def _unchecked(cls, q: int, r: int) -> Self:
+        """
+        build a hex from its 2d coordinates without running __post_init__, the caller guarantees they are valid
+        goes through the checked constructor instead while full validation is on, see set_full_validation
+        """
+        if _full_validation:
+            return cls.from_2d_coordinates(q, r)
+        hex = _new(cls)
+        _set(hex, "q", q)
+        _set(hex, "r", r)
+        return hex
+
+    @property
+    def key(self) -> int:
+        """
+        canonical packed int of the axial coordinates, equal for every type of hex at the same location
+        computed on first use and cached on the instance
+        """
+        key: Optional[int] = getattr(self, "_key", None)
+        if key is None:
+            key = self._compute_key()
+            object.__setattr__(self, "_key", key)
+        return key
+
+    def _compute_key(self) -> int:
+        axial = self.to_axial_coordinate_hex()
+        return pack_key(axial.q, axial.r)
+
+    @classmethod
+    def from_key(cls, key: int) -> Self:
+        return cls.from_axial_coordinate_hex(AxialCoordinateHex(*unpack_key(key)))
+
+    def interned(self) -> Self:
+        """
+        the shared instance of this hex from HEX_POOL, see HexPool
+        """
+        return HEX_POOL.intern(self)
+
     def to_cube_coordinate_hex(self) -> CubeCoordinateHex:
         return self.to_axial_coordinate_hex().to_cube_coordinate_hex()
 
@@ -74,6 +214,10 @@ class Hex(ABC):
     def __copy__(self) -> Self:
         return self.__class__(**{field.name: getattr(self, field.name) for field in fields(self)})
 
+    def __reduce__(self) -> tuple[type[Self], tuple[int, ...]]:
+        # frozen slotted instances can't have their state set after creation, so pickle through the constructor
+        return self.__class__, tuple(getattr(self, field.name) for field in fields(self))
+
     def __deepcopy__(self, memodict: dict = dict()) -> Self:
         return self.__class__(
             **{field.name: copy.deepcopy(getattr(self, field.name), memodict) for field in fields(self)}
@@ -81,9 +225,11 @@ class Hex(ABC):
 
     def __eq__(self, other: Any) -> bool | NotImplementedType:
         ## only compare same families of hexes, works because abstract hexes will never be instantiated
+        if self is other:
+            return True
         if not isinstance(other, Hex):
             return NotImplemented  # (f"equality is only defined between the same type of Hexes.  Trying to compare {self.__class__} and {other.__class__} ")  # fmt: skip
-        return self.distance(other) == 0
+        return self.key == other.key
 
         ## Only compare exact same types
         # if not type(other) == self.__class__:
@@ -115,34 +261,57 @@ class Hex(ABC):
         return -1 * self
 
     def __hash__(self) -> int:
-        return hash(self.to_axial_coordinate_hex().to_2d_coordinates())
+        return hash(self.key)
+
+    # subclasses bind __eq__ and __hash__ to these directly (so dataclass does not generate field based versions)
+    # rather than delegating through super(), which would add a call per level of the hierarchy to every dict probe
 
     # NOTE: specifically don't implement radd and rsub so its clear what type of Hex will come out of arithmetic operations
 
 
 @dataclass(frozen=True)
 class VectorHex(Hex, ABC):
+    __slots__ = ()
+
+    @classmethod
+    def range_stencil(cls, n: int) -> tuple[tuple[int, int], ...]:
+        """
+        offsets of every hex within n spaces in this class's own 2d coordinates, built once per radius and class
+        vector hexes convert linearly from axial, so the offsets are the same around every center
+        """
+        return _vector_range_stencil(cls, n)
+
+    @property
+    def neighbors(self) -> Annotated[list[Self], FixedLength(6)]:
+        q, r = self.to_2d_coordinates()
+        unchecked = self._unchecked
+        return [unchecked(q + dq, r + dr) for dq, dr in _vector_direction_offsets(type(self))]
+
+    def iter_hexes_within_range(self, n: int) -> Iterator[Self]:
+        q, r = self.to_2d_coordinates()
+        # the stencil offsets keep any parity or cube constraint, so every hex is valid by construction
+        unchecked = self._unchecked
+        for dq, dr in self.range_stencil(n):
+            yield unchecked(q + dq, r + dr)
+
     def __add__(self, other: Any) -> Self | NotImplementedType:
         if isinstance(other, self.__class__):
-            return self.__class__(
-                **{field.name: getattr(self, field.name) + getattr(other, field.name) for field in fields(self)}
-            )
+            # sums, differences and multiples of valid vector hexes are valid
+            return self._unchecked(self.q + other.q, self.r + other.r)
         elif isinstance(other, Hex):
             return super().__add__(other)
         return NotImplemented  # (f"Can only add Hexes together.  Trying to add {type(self)} to {type(other)}")
 
     def __sub__(self, other: Any) -> Self | NotImplementedType:
         if isinstance(other, self.__class__):
-            return self.__class__(
-                **{field.name: getattr(self, field.name) - getattr(other, field.name) for field in fields(self)}
-            )
+            return self._unchecked(self.q - other.q, self.r - other.r)
         elif isinstance(other, Hex):
             return super().__sub__(other)
         return NotImplemented  # (f"Can only subtract Hexes from each other.  Trying to subtract {type(other)} from {type(self)}")  # fmt: skip
 
     def __mul__(self, other: Any) -> Self | NotImplementedType:
         if isinstance(other, int):
-            return self.__class__(**{field.name: other * getattr(self, field.name) for field in fields(self)})
+            return self._unchecked(other * self.q, other * self.r)
         return NotImplemented  # (f"Can only scale Hex's by integers, got {type(other)} instead")
 
     # def __radd__(self, other: Any) -> Hex | NotImplementedType:
@@ -157,12 +326,27 @@ class VectorHex(Hex, ABC):
     def __neg__(self) -> Self | NotImplementedType:
         return -1 * self
 
-    def __eq__(self, other: Any) -> bool | NotImplementedType:
-        return super().__eq__(other)
+    __eq__ = Hex.__eq__
+    __hash__ = Hex.__hash__
+
+
+@functools.cache
+def _vector_direction_offsets(cls: type[VectorHex]) -> tuple[tuple[int, int], ...]:
+    # like the range stencil, vector hex directions are the same offsets around every hex
+    return tuple(direction.to_2d_coordinates() for direction in cls.origin().neighbor_directions)
+
+
+@functools.cache
+def _vector_range_stencil(cls: type[VectorHex], n: int) -> tuple[tuple[int, int], ...]:
+    return tuple(
+        cls.from_axial_coordinate_hex(AxialCoordinateHex(q, r)).to_2d_coordinates() for q, r in axial_range_stencil(n)
+    )
 
 
 @dataclass(frozen=True)
 class OffsetCoordinateHex(Hex, ABC):
+    __slots__ = ()
+
     @property
     def row(self) -> int:
         return self.r
@@ -175,29 +359,37 @@ class OffsetCoordinateHex(Hex, ABC):
     def from_row_col(cls, row: int, col: int) -> Self:
         return cls(col, row)
 
+    def _step(self, direction: Self) -> Self:
+        # offset directions are only valid in the hex's own coordinates, adding them in axial space would be wrong
+        return self._unchecked(self.q + direction.q, self.r + direction.r)
+
     # def distance(self, other: Self) -> int:
     #     if not isinstance(other, self.__class__):
     #         raise NotImplementedError(f"distance is only defined between the same type of Hexes.  Trying to compare {self.__class__} to {other.__class__}")  # fmt: skip
     #     return self.to_axial_coordinate_hex().distance(other.to_axial_coordinate_hex())
 
-    def __eq__(self, other: Any) -> bool | NotImplementedType:
-        return super().__eq__(other)
+    __eq__ = Hex.__eq__
+    __hash__ = Hex.__hash__
 
 
 @dataclass(frozen=True)
 class DoubleCoordinateHex(OffsetCoordinateHex, VectorHex, ABC):
+    __slots__ = ()
+
     # q is col
     # r is row
     def __post_init__(self) -> None:
         # print("in Double Coord hex post init")
         assert (self.q + self.r) % 2 == 0, "A doubled coordinate hex must have its coordinates be of the same parity"  # fmt: skip
 
-    def __eq__(self, other: Any) -> bool | NotImplementedType:
-        return super().__eq__(other)
+    __eq__ = Hex.__eq__
+    __hash__ = Hex.__hash__
 
 
 @dataclass(frozen=True)
 class DoubledHeightCoordinateHex(DoubleCoordinateHex):
+    __slots__ = ()
+
     def __post_init__(self) -> None:
         super().__post_init__()
 
@@ -220,6 +412,9 @@ class DoubledHeightCoordinateHex(DoubleCoordinateHex):
     def to_axial_coordinate_hex(self) -> AxialCoordinateHex:
         return AxialCoordinateHex(self.q, (self.r - self.q) // 2)
 
+    def _compute_key(self) -> int:
+        return pack_key(self.q, (self.r - self.q) // 2)
+
     @classmethod
     def from_axial_coordinate_hex(cls, axial_hex: AxialCoordinateHex) -> DoubledHeightCoordinateHex:
         return axial_hex.to_double_height_coordinate_hex()
@@ -228,11 +423,24 @@ class DoubledHeightCoordinateHex(DoubleCoordinateHex):
     # def from_cube_coordinate_hex(cls, cube_hex: CubeCoordinateHex) -> DoubledHeightCoordinateHex:
     #     return cube_hex.to_double_height_coordinate_hex()
 
-    # TODO: override to_2d to support array with less wasted space?
+    def to_compact_2d_coordinates(self) -> tuple[int, int]:
+        """
+        (col, row // 2), every other row is empty in doubled height so this indexes an array with no wasted space
+        """
+        return self.col, self.row >> 1
+
+    @classmethod
+    def from_compact_2d_coordinates(cls, col: int, half_row: int) -> DoubledHeightCoordinateHex:
+        return cls._unchecked(col, 2 * half_row + (col & 1))
+
+    __eq__ = Hex.__eq__
+    __hash__ = Hex.__hash__
 
 
 @dataclass(frozen=True)
 class DoubledWidthCoordinateHex(DoubleCoordinateHex):
+    __slots__ = ()
+
     def __post_init__(self) -> None:
         super().__post_init__()
 
@@ -255,6 +463,9 @@ class DoubledWidthCoordinateHex(DoubleCoordinateHex):
     def to_axial_coordinate_hex(self) -> AxialCoordinateHex:
         return AxialCoordinateHex((self.col - self.row) // 2, self.row)
 
+    def _compute_key(self) -> int:
+        return pack_key((self.col - self.row) // 2, self.row)
+
     @classmethod
     def from_axial_coordinate_hex(cls, axial_hex: AxialCoordinateHex) -> DoubledWidthCoordinateHex:
         return axial_hex.to_double_width_coordinate_hex()
@@ -263,14 +474,24 @@ class DoubledWidthCoordinateHex(DoubleCoordinateHex):
     # def from_cube_coordinate_hex(cls, cube_hex: CubeCoordinateHex) -> DoubledWidthCoordinateHex:
     #     return cube_hex.to_double_width_coordinate_hex()
 
-    # TODO: override to_2d to support array with less wasted space??
+    def to_compact_2d_coordinates(self) -> tuple[int, int]:
+        """
+        (col // 2, row), every other column is empty in doubled width so this indexes an array with no wasted space
+        """
+        return self.col >> 1, self.row
 
-    def __eq__(self, other: Any) -> bool | NotImplementedType:
-        return super().__eq__(other)
+    @classmethod
+    def from_compact_2d_coordinates(cls, half_col: int, row: int) -> DoubledWidthCoordinateHex:
+        return cls._unchecked(2 * half_col + (row & 1), row)
+
+    __eq__ = Hex.__eq__
+    __hash__ = Hex.__hash__
 
 
 @dataclass(frozen=True)
 class AxialCoordinateHex(VectorHex):
+    __slots__ = ()
+
     @property
     def _s(self) -> int:
         return -(self.q + self.r)
@@ -286,6 +507,9 @@ class AxialCoordinateHex(VectorHex):
             self.from_axial_coordinate_hex(AxialCoordinateHex(q=0, r=1)),
         ]
 
+    def _compute_key(self) -> int:
+        return pack_key(self.q, self.r)
+
     def distance(self, other: AxialCoordinateHex) -> int:
         if type(other) is not AxialCoordinateHex:
             return super().distance(other)
@@ -293,42 +517,42 @@ class AxialCoordinateHex(VectorHex):
         return max(abs(d.q), abs(d.r), abs(d._s))
 
     def to_cube_coordinate_hex(self) -> CubeCoordinateHex:
-        return CubeCoordinateHex(self.q, self.r, self._s)
+        return CubeCoordinateHex._unchecked(self.q, self.r)
 
     @classmethod
     def from_cube_coordinate_hex(cls, cube_hex: CubeCoordinateHex) -> AxialCoordinateHex:
         return cube_hex.to_axial_coordinate_hex()
 
     def to_double_width_coordinate_hex(self) -> DoubledWidthCoordinateHex:
-        return DoubledWidthCoordinateHex.from_row_col(col=2 * self.q + self.r, row=self.r)
+        return DoubledWidthCoordinateHex._unchecked(2 * self.q + self.r, self.r)
 
     @classmethod
     def from_double_width_coordinate_hex(cls, double_width_hex: DoubledWidthCoordinateHex) -> AxialCoordinateHex:
         return double_width_hex.to_axial_coordinate_hex()
 
     def to_double_height_coordinate_hex(self) -> DoubledHeightCoordinateHex:
-        return DoubledHeightCoordinateHex.from_row_col(col=self.q, row=2 * self.r + self.q)
+        return DoubledHeightCoordinateHex._unchecked(self.q, 2 * self.r + self.q)
 
     @classmethod
     def from_double_height_coordinate_hex(cls, double_height_hex: DoubledHeightCoordinateHex) -> AxialCoordinateHex:
         return double_height_hex.to_axial_coordinate_hex()
 
     def to_even_row_offset_coordinate_hex(self) -> EvenRowOffsetCoordinateHex:
-        return EvenRowOffsetCoordinateHex.from_row_col(row=self.r, col=self.q + (self.r + (self.r & 1)) // 2)
+        return EvenRowOffsetCoordinateHex._unchecked(self.q + (self.r + (self.r & 1)) // 2, self.r)
 
     @classmethod
     def from_even_row_offset_coordinate(cls, even_row_offset_hex: EvenRowOffsetCoordinateHex) -> AxialCoordinateHex:
         return even_row_offset_hex.to_axial_coordinate_hex()
 
     def to_odd_row_offset_coordinate_hex(self) -> OddRowOffsetCoordinateHex:
-        return OddRowOffsetCoordinateHex.from_row_col(row=self.r, col=self.q + (self.r - (self.r & 1)) // 2)
+        return OddRowOffsetCoordinateHex._unchecked(self.q + (self.r - (self.r & 1)) // 2, self.r)
 
     @classmethod
     def from_odd_row_offset_coordinate_hex(cls, odd_row_offset_hex: OddRowOffsetCoordinateHex) -> AxialCoordinateHex:
         return odd_row_offset_hex.to_axial_coordinate_hex()
 
     def to_even_column_offset_coordinate_hex(self) -> EvenColumnOffsetCoordinateHex:
-        return EvenColumnOffsetCoordinateHex.from_row_col(row=self.r + (self.q + (self.q & 1)) // 2, col=self.q)
+        return EvenColumnOffsetCoordinateHex._unchecked(self.q, self.r + (self.q + (self.q & 1)) // 2)
 
     @classmethod
     def from_even_column_offset_coordinate_hex(
@@ -337,7 +561,7 @@ class AxialCoordinateHex(VectorHex):
         return even_column_offset_hex.to_axial_coordinate_hex()
 
     def to_odd_column_offset_coordinate_hex(self) -> OddColumnOffsetCoordinateHex:
-        return OddColumnOffsetCoordinateHex.from_row_col(row=self.r + (self.q - (self.q & 1)) // 2, col=self.q)
+        return OddColumnOffsetCoordinateHex._unchecked(self.q, self.r + (self.q - (self.q & 1)) // 2)
 
     @classmethod
     def from_odd_column_offset_coordinate_hex(
@@ -372,12 +596,14 @@ class AxialCoordinateHex(VectorHex):
         reflected = shifted.reflect_over_s_axis().reflect_over_hex()
         return self.from_axial_coordinate_hex(reflected + reference_point)
 
-    def __eq__(self, other: Any) -> bool | NotImplementedType:
-        return super().__eq__(other)
+    __eq__ = Hex.__eq__
+    __hash__ = Hex.__hash__
 
 
 @dataclass(frozen=True)
 class CubeCoordinateHex(AxialCoordinateHex):
+    __slots__ = ("s",)
+
     s: int
 
     def __post_init__(self) -> None:
@@ -409,12 +635,24 @@ class CubeCoordinateHex(AxialCoordinateHex):
     def from_2d_coordinates(cls, q: int, r: int) -> CubeCoordinateHex:
         return cls(q=q, r=r, s=-q - r)
 
-    def __eq__(self, other: Any) -> bool | NotImplementedType:
-        return super().__eq__(other)
+    @classmethod
+    def _unchecked(cls, q: int, r: int) -> CubeCoordinateHex:
+        if _full_validation:
+            return cls.from_2d_coordinates(q, r)
+        hex = _new(cls)
+        _set(hex, "q", q)
+        _set(hex, "r", r)
+        _set(hex, "s", -q - r)
+        return hex
+
+    __eq__ = Hex.__eq__
+    __hash__ = Hex.__hash__
 
 
 @dataclass(frozen=True)
 class EvenRowOffsetCoordinateHex(OffsetCoordinateHex):
+    __slots__ = ()
+
     def to_axial_coordinate_hex(self) -> AxialCoordinateHex:
         return AxialCoordinateHex(q=self.col - (self.row + (self.row & 1)) // 2, r=self.row)
 
@@ -424,39 +662,32 @@ class EvenRowOffsetCoordinateHex(OffsetCoordinateHex):
 
     @property
     def neighbor_directions(self) -> Annotated[list[EvenRowOffsetCoordinateHex], FixedLength(6)]:
-        # if self.row & 1:
-        #     return [
-        #         EvenRowOffsetCoordinateHex(1, 0),
-        #         EvenRowOffsetCoordinateHex(0, -1),
-        #         EvenRowOffsetCoordinateHex(-1, -1),
-        #         EvenRowOffsetCoordinateHex(-1, 0),
-        #         EvenRowOffsetCoordinateHex(-1, 1),
-        #         EvenRowOffsetCoordinateHex(0, 1),
-        #     ]
-        # return [
-        #     EvenRowOffsetCoordinateHex(1, 0),
-        #     EvenRowOffsetCoordinateHex(1, -1),
-        #     EvenRowOffsetCoordinateHex(0, -1),
-        #     EvenRowOffsetCoordinateHex(-1, 0),
-        #     EvenRowOffsetCoordinateHex(0, 1),
-        #     EvenRowOffsetCoordinateHex(1, 1),
-        # ]
-
+        if self.row & 1:
+            return [
+                EvenRowOffsetCoordinateHex(1, 0),
+                EvenRowOffsetCoordinateHex(0, -1),
+                EvenRowOffsetCoordinateHex(-1, -1),
+                EvenRowOffsetCoordinateHex(-1, 0),
+                EvenRowOffsetCoordinateHex(-1, 1),
+                EvenRowOffsetCoordinateHex(0, 1),
+            ]
         return [
             EvenRowOffsetCoordinateHex(1, 0),
+            EvenRowOffsetCoordinateHex(1, -1),
             EvenRowOffsetCoordinateHex(0, -1),
-            EvenRowOffsetCoordinateHex(-1, -1),
             EvenRowOffsetCoordinateHex(-1, 0),
-            EvenRowOffsetCoordinateHex(-1, 1),
             EvenRowOffsetCoordinateHex(0, 1),
+            EvenRowOffsetCoordinateHex(1, 1),
         ]
 
-    def __eq__(self, other: Any) -> bool | NotImplementedType:
-        return super().__eq__(other)
+    __eq__ = Hex.__eq__
+    __hash__ = Hex.__hash__
 
 
 @dataclass(frozen=True)
 class OddRowOffsetCoordinateHex(OffsetCoordinateHex):
+    __slots__ = ()
+
     def to_axial_coordinate_hex(self) -> AxialCoordinateHex:
         return AxialCoordinateHex(q=self.col - (self.row - (self.row & 1)) // 2, r=self.row)
 
@@ -484,12 +715,14 @@ class OddRowOffsetCoordinateHex(OffsetCoordinateHex):
             OddRowOffsetCoordinateHex(0, 1),
         ]
 
-    def __eq__(self, other: Any) -> bool | NotImplementedType:
-        return super().__eq__(other)
+    __eq__ = Hex.__eq__
+    __hash__ = Hex.__hash__
 
 
 @dataclass(frozen=True)
 class EvenColumnOffsetCoordinateHex(OffsetCoordinateHex):
+    __slots__ = ()
+
     def to_axial_coordinate_hex(self) -> AxialCoordinateHex:
         return AxialCoordinateHex(q=self.col, r=self.row - (self.col + (self.col & 1)) // 2)
 
@@ -517,12 +750,14 @@ class EvenColumnOffsetCoordinateHex(OffsetCoordinateHex):
             EvenColumnOffsetCoordinateHex(0, 1),
         ]
 
-    def __eq__(self, other: Any) -> bool | NotImplementedType:
-        return super().__eq__(other)
+    __eq__ = Hex.__eq__
+    __hash__ = Hex.__hash__
 
 
 @dataclass(frozen=True)
 class OddColumnOffsetCoordinateHex(OffsetCoordinateHex):
+    __slots__ = ()
+
     def to_axial_coordinate_hex(self) -> AxialCoordinateHex:
         return AxialCoordinateHex(q=self.col, r=self.row - (self.col - (self.col & 1)) // 2)
 
@@ -550,5 +785,44 @@ class OddColumnOffsetCoordinateHex(OffsetCoordinateHex):
             OddColumnOffsetCoordinateHex(0, 1),
         ]
 
-    def __eq__(self, other: Any) -> bool | NotImplementedType:
-        return super().__eq__(other)
+    __eq__ = Hex.__eq__
+    __hash__ = Hex.__hash__
+
+
+HexT = TypeVar("HexT", bound=Hex)
+
+# axial coordinates up to this size (in absolute value) are pooled, which covers a board with room to spare
+INTERN_LIMIT: Final[int] = 64
+
+
+class HexPool:
+    """
+    flyweight pool sharing one instance per type of hex and location
+    interned hexes can be compared by identity, and holding many references to them costs no new objects
+    only small coordinates are pooled so the pool stays bounded
+    """
+
+    __slots__ = ("limit", "_hexes")
+
+    def __init__(self, limit: int = INTERN_LIMIT) -> None:
+        self.limit = limit
+        self._hexes: dict[tuple[type[Hex], int], Hex] = dict()
+
+    def intern(self, hex: HexT) -> HexT:
+        """
+        :return: the pooled instance equal to hex (hex itself the first time), or hex if it is too far out to pool
+        """
+        key = hex.key
+        q, r = unpack_key(key)
+        if abs(q) > self.limit or abs(r) > self.limit:
+            return hex
+        return cast(HexT, self._hexes.setdefault((type(hex), key), hex))
+
+    def clear(self) -> None:
+        self._hexes.clear()
+
+    def __len__(self) -> int:
+        return len(self._hexes)
+
+
+HEX_POOL: Final[HexPool] = HexPool()
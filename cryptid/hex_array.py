@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Callable, Final, Iterable, Iterator, Optional, TypeAlias
+
+import numpy as np
+import numpy.typing as npt
+
+from cryptid.hex import (
+    KEY_SHIFT,
+    AxialCoordinateHex,
+    CubeCoordinateHex,
+    DoubleCoordinateHex,
+    DoubledHeightCoordinateHex,
+    DoubledWidthCoordinateHex,
+    EvenColumnOffsetCoordinateHex,
+    EvenRowOffsetCoordinateHex,
+    Hex,
+    OddColumnOffsetCoordinateHex,
+    OddRowOffsetCoordinateHex,
+)
+
+Coordinates: TypeAlias = npt.NDArray[np.int64]
+_Conversion: TypeAlias = Callable[[Coordinates, Coordinates], tuple[Coordinates, Coordinates]]
+
+# vectorized versions of each type's to_axial_coordinate_hex, on its (q, r) = (col, row) arrays
+# numpy // and & follow the same floor and two's complement rules as python ints, so parity matches the scalar methods
+_TO_AXIAL: Final[dict[type[Hex], _Conversion]] = {
+    AxialCoordinateHex: lambda q, r: (q, r),
+    CubeCoordinateHex: lambda q, r: (q, r),
+    DoubledHeightCoordinateHex: lambda col, row: (col, (row - col) // 2),
+    DoubledWidthCoordinateHex: lambda col, row: ((col - row) // 2, row),
+    EvenRowOffsetCoordinateHex: lambda col, row: (col - (row + (row & 1)) // 2, row),
+    OddRowOffsetCoordinateHex: lambda col, row: (col - (row - (row & 1)) // 2, row),
+    EvenColumnOffsetCoordinateHex: lambda col, row: (col, row - (col + (col & 1)) // 2),
+    OddColumnOffsetCoordinateHex: lambda col, row: (col, row - (col - (col & 1)) // 2),
+}
+
+# vectorized versions of AxialCoordinateHex.to_..._coordinate_hex, returning (q, r) = (col, row) for offset types
+_FROM_AXIAL: Final[dict[type[Hex], _Conversion]] = {
+    AxialCoordinateHex: lambda q, r: (q, r),
+    CubeCoordinateHex: lambda q, r: (q, r),
+    DoubledHeightCoordinateHex: lambda q, r: (q, 2 * r + q),
+    DoubledWidthCoordinateHex: lambda q, r: (2 * q + r, r),
+    EvenRowOffsetCoordinateHex: lambda q, r: (q + (r + (r & 1)) // 2, r),
+    OddRowOffsetCoordinateHex: lambda q, r: (q + (r - (r & 1)) // 2, r),
+    EvenColumnOffsetCoordinateHex: lambda q, r: (q, r + (q + (q & 1)) // 2),
+    OddColumnOffsetCoordinateHex: lambda q, r: (q, r + (q - (q & 1)) // 2),
+}
+
+
+@dataclass(frozen=True)
+class HexArray:
+    """
+    many hexes of one type stored as parallel q and r arrays, for converting whole boards at once
+    q and r hold the same values as the scalar hexes' q and r fields (col and row for offset types)
+    """
+
+    hex_type: type[Hex]
+    q: Coordinates
+    r: Coordinates
+
+    def __post_init__(self) -> None:
+        if self.hex_type not in _TO_AXIAL:
+            raise TypeError(f"{self.hex_type} is not a concrete type of hex")
+        if self.q.shape != self.r.shape or self.q.ndim != 1:
+            raise ValueError(f"q and r must be 1d arrays of the same length, got {self.q.shape} and {self.r.shape}")
+        if issubclass(self.hex_type, DoubleCoordinateHex) and ((self.q + self.r) & 1).any():
+            raise ValueError("A doubled coordinate hex must have its coordinates be of the same parity")
+
+    @classmethod
+    def from_coordinates(cls, hex_type: type[Hex], q: npt.ArrayLike, r: npt.ArrayLike) -> HexArray:
+        return cls(hex_type, np.asarray(q, dtype=np.int64), np.asarray(r, dtype=np.int64))
+
+    @classmethod
+    def from_hexes(cls, hexes: Iterable[Hex], hex_type: Optional[type[Hex]] = None) -> HexArray:
+        """
+        :param hexes: hexes that are all of the same type
+        :param hex_type: type of the hexes, required if hexes is empty
+        """
+        hexes = list(hexes)
+        if hex_type is None:
+            if not hexes:
+                raise ValueError("hex_type must be given for an empty HexArray")
+            hex_type = type(hexes[0])
+        if any(type(hex) is not hex_type for hex in hexes):
+            raise TypeError(f"every hex must be a {hex_type.__name__}")
+        return cls.from_coordinates(hex_type, [hex.q for hex in hexes], [hex.r for hex in hexes])
+
+    @classmethod
+    def from_keys(cls, keys: npt.ArrayLike, hex_type: type[Hex] = AxialCoordinateHex) -> HexArray:
+        """
+        inverse of keys, see hex.pack_key
+        """
+        keys = np.asarray(keys, dtype=np.int64)
+        offset = 1 << (KEY_SHIFT - 1)
+        q, r = np.divmod(keys + offset, 1 << KEY_SHIFT)
+        return cls(AxialCoordinateHex, q, r - offset).convert(hex_type)
+
+    @property
+    def s(self) -> Coordinates:
+        """
+        cube s coordinate of every hex
+        """
+        axial = self.to_axial()
+        return -(axial.q + axial.r)
+
+    def keys(self) -> Coordinates:
+        """
+        Hex.key of every hex
+        """
+        axial = self.to_axial()
+        return (axial.q << KEY_SHIFT) + axial.r
+
+    def to_axial(self) -> HexArray:
+        if self.hex_type is AxialCoordinateHex:
+            return self
+        return HexArray(AxialCoordinateHex, *_TO_AXIAL[self.hex_type](self.q, self.r))
+
+    def convert(self, hex_type: type[Hex]) -> HexArray:
+        """
+        :param hex_type: any of the concrete hex types in cryptid.hex
+        :return: the same hexes in hex_type's coordinates
+        """
+        if hex_type is self.hex_type:
+            return self
+        if hex_type not in _FROM_AXIAL:
+            raise TypeError(f"{hex_type} is not a concrete type of hex")
+        axial = self.to_axial()
+        return HexArray(hex_type, *_FROM_AXIAL[hex_type](axial.q, axial.r))
+
+    def distances(self, other: Optional[HexArray] = None) -> Coordinates:
+        """
+        hex distance between every pair of hexes, using the doubled coordinate closed forms when both sides are
+        doubled height or doubled width and the axial form otherwise
+        :param other: second collection of hexes, defaults to self
+        :return: array of shape (len(self), len(other))
+        """
+        if other is None:
+            other = self
+        if self.hex_type is other.hex_type is DoubledHeightCoordinateHex:
+            drow = np.abs(self.r[:, np.newaxis] - other.r[np.newaxis, :])
+            dcol = np.abs(self.q[:, np.newaxis] - other.q[np.newaxis, :])
+            return dcol + np.maximum(0, (drow - dcol) // 2)
+        if self.hex_type is other.hex_type is DoubledWidthCoordinateHex:
+            dcol = np.abs(self.q[:, np.newaxis] - other.q[np.newaxis, :])
+            drow = np.abs(self.r[:, np.newaxis] - other.r[np.newaxis, :])
+            return drow + np.maximum(0, (dcol - drow) // 2)
+        a, b = self.to_axial(), other.to_axial()
+        dq = a.q[:, np.newaxis] - b.q[np.newaxis, :]
+        dr = a.r[:, np.newaxis] - b.r[np.newaxis, :]
+        return np.maximum(np.maximum(np.abs(dq), np.abs(dr)), np.abs(dq + dr))
+
+    def condensed_distances(self) -> Coordinates:
+        """
+        distances between every unordered pair of distinct hexes, in the order of np.triu_indices(len(self), 1)
+        """
+        rows, cols = np.triu_indices(len(self), 1)
+        return self.distances()[rows, cols]
+
+    def to_hexes(self) -> list[Hex]:
+        # the coordinates were validated once for the whole array in __post_init__
+        unchecked = self.hex_type._unchecked
+        return [unchecked(q, r) for q, r in zip(self.q.tolist(), self.r.tolist())]
+
+    def __len__(self) -> int:
+        return len(self.q)
+
+    def __iter__(self) -> Iterator[Hex]:
+        return iter(self.to_hexes())
+
+    def __getitem__(self, index: int) -> Hex:
+        return self.hex_type._unchecked(int(self.q[index]), int(self.r[index]))
+
+
+def distance_matrix(hexes: HexArray | Iterable[Hex], others: Optional[HexArray | Iterable[Hex]] = None) -> Coordinates:
+    """
+    hex distance between every pair from two collections of hexes, see HexArray.distances
+    :param hexes: a HexArray, or hexes of one type
+    :param others: a HexArray, or hexes of one type, defaults to hexes
+    :return: array of shape (len(hexes), len(others))
+    """
+    if not isinstance(hexes, HexArray):
+        hexes = HexArray.from_hexes(hexes)
+    if others is not None and not isinstance(others, HexArray):
+        others = HexArray.from_hexes(others)
+    return hexes.distances(others)
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from types import NotImplementedType
+from typing import TYPE_CHECKING, Any, Iterator
+
+from cryptid.hex import Hex
+from cryptid.tile import Tile
+
+if TYPE_CHECKING:
+    from cryptid.board import Board
+
+
+@dataclass(frozen=True)
+class HexSet:
+    """
+    set of spaces on a board stored as a bitmask over the board's tile slots
+    bit i is set when the tile in slot i (see Board.slots) is in the set
+    """
+
+    board: Board = field(repr=False, compare=False)
+    bits: int = 0
+
+    def __post_init__(self) -> None:
+        if self.bits < 0 or self.bits > self.board.full_mask:
+            raise ValueError(f"bits {self.bits:#x} do not fit in a board of {len(self.board.slots)} slots")
+
+    def _check_same_board(self, other: HexSet) -> None:
+        if other.board is not self.board:
+            raise ValueError("HexSets can only be combined with HexSets from the same board")
+
+    def complement(self) -> HexSet:
+        return HexSet(self.board, self.board.full_mask ^ self.bits)
+
+    def tiles(self) -> Iterator[Tile]:
+        """
+        iterate over the tiles in the set in slot order
+        """
+        tiles = self.board.tiles
+        for hex in self:
+            yield tiles[hex]
+
+    def slot_indices(self) -> Iterator[int]:
+        """
+        iterate over the slot indices of the set bits in increasing order
+        """
+        bits = self.bits
+        while bits:
+            lowest_bit = bits & -bits
+            yield lowest_bit.bit_length() - 1
+            bits ^= lowest_bit
+
+    def __iter__(self) -> Iterator[Hex]:
+        slots = self.board.slots
+        for index in self.slot_indices():
+            yield slots[index]
+
+    def __len__(self) -> int:
+        return self.bits.bit_count()
+
+    def __bool__(self) -> bool:
+        return self.bits != 0
+
+    def __contains__(self, item: Any) -> bool:
+        if isinstance(item, Tile):
+            item = item.hex
+        if not isinstance(item, Hex):
+            return False
+        index = self.board.slot_of(item)
+        return index is not None and bool(self.bits >> index & 1)
+
+    def __and__(self, other: Any) -> HexSet | NotImplementedType:
+        if not isinstance(other, HexSet):
+            return NotImplemented
+        self._check_same_board(other)
+        return HexSet(self.board, self.bits & other.bits)
+
+    def __or__(self, other: Any) -> HexSet | NotImplementedType:
+        if not isinstance(other, HexSet):
+            return NotImplemented
+        self._check_same_board(other)
+        return HexSet(self.board, self.bits | other.bits)
+
+    def __xor__(self, other: Any) -> HexSet | NotImplementedType:
+        if not isinstance(other, HexSet):
+            return NotImplemented
+        self._check_same_board(other)
+        return HexSet(self.board, self.bits ^ other.bits)
+
+    def __sub__(self, other: Any) -> HexSet | NotImplementedType:
+        if not isinstance(other, HexSet):
+            return NotImplemented
+        self._check_same_board(other)
+        return HexSet(self.board, self.bits & ~other.bits)
+
+    def __invert__(self) -> HexSet:
+        return self.complement()
+
+    def __eq__(self, other: Any) -> bool | NotImplementedType:
+        if not isinstance(other, HexSet):
+            return NotImplemented
+        return self.board is other.board and self.bits == other.bits
+
+    def __hash__(self) -> int:
+        return hash((id(self.board), self.bits))
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Final, Optional, TypeVar
+
+import numpy as np
+import numpy.typing as npt
+
+from cryptid.hex import AxialCoordinateHex, Hex
+from cryptid.hex_array import HexArray
+
+HexT = TypeVar("HexT", bound=Hex)
+
+# an affine map of axial coordinates as the top two rows of a homogeneous 3 x 3 integer matrix
+# (q, r) -> (a * q + b * r + tq, c * q + d * r + tr) is ((a, b, tq), (c, d, tr))
+Matrix = tuple[tuple[int, int, int], tuple[int, int, int]]
+
+
+@dataclass(frozen=True)
+class HexTransform:
+    """
+    a rotation or reflection of the hex grid (the 12 element dihedral group) followed by a translation
+    stored as an integer matrix on axial coordinates, so any chain of transforms composes into one matrix
+    """
+
+    matrix: Matrix
+
+    @classmethod
+    def identity(cls) -> HexTransform:
+        return cls(((1, 0, 0), (0, 1, 0)))
+
+    @classmethod
+    def translation(cls, offset: Hex) -> HexTransform:
+        axial = offset.to_axial_coordinate_hex()
+        return cls(((1, 0, axial.q), (0, 1, axial.r)))
+
+    @classmethod
+    def rotation(cls, steps: int = 1, center: Optional[Hex] = None) -> HexTransform:
+        """
+        :param steps: number of 60 degree turns, each one maps cube (q, r, s) to (-r, -s, -q)
+        :param center: hex to rotate around, defaults to the origin
+        """
+        one_step = cls(((0, -1, 0), (1, 1, 0)))
+        output = cls.identity()
+        for _ in range(steps % 6):
+            output = one_step @ output
+        return output.about(center)
+
+    @classmethod
+    def reflection(cls, axis: str, center: Optional[Hex] = None) -> HexTransform:
+        """
+        :param axis: "q", "r" or "s", matching AxialCoordinateHex.reflect_over_q_axis and friends
+        :param center: hex the axis passes through, defaults to the origin
+        """
+        match axis:
+            case "q":
+                output = cls(((1, 0, 0), (-1, -1, 0)))
+            case "r":
+                output = cls(((-1, -1, 0), (0, 1, 0)))
+            case "s":
+                output = cls(((0, 1, 0), (1, 0, 0)))
+            case _:
+                raise ValueError(f"axis must be one of q, r or s, got {axis!r}")
+        return output.about(center)
+
+    def about(self, center: Optional[Hex]) -> HexTransform:
+        """
+        the same transform with center as the fixed point instead of the origin
+        """
+        if center is None:
+            return self
+        return HexTransform.translation(center) @ self @ HexTransform.translation(-center.to_axial_coordinate_hex())
+
+    def then(self, other: HexTransform) -> HexTransform:
+        """
+        apply self first and then other
+        """
+        return other @ self
+
+    def __matmul__(self, other: HexTransform) -> HexTransform:
+        # (self @ other) applies other first, like matrix multiplication
+        (a, b, tq), (c, d, tr) = self.matrix
+        (e, f, uq), (g, h, ur) = other.matrix
+        return HexTransform(
+            (
+                (a * e + b * g, a * f + b * h, a * uq + b * ur + tq),
+                (c * e + d * g, c * f + d * h, c * uq + d * ur + tr),
+            )
+        )
+
+    @property
+    def array(self) -> npt.NDArray[np.int64]:
+        """
+        the full homogeneous 3 x 3 matrix
+        """
+        return np.array([*self.matrix, (0, 0, 1)], dtype=np.int64)
+
+    @property
+    def is_reflection(self) -> bool:
+        (a, b, _), (c, d, _) = self.matrix
+        return a * d - b * c < 0
+
+    def apply(self, hex: HexT) -> HexT:
+        """
+        transform a single hex, the result has the same type as hex
+        """
+        axial = hex.to_axial_coordinate_hex()
+        (a, b, tq), (c, d, tr) = self.matrix
+        return hex.from_axial_coordinate_hex(
+            AxialCoordinateHex(a * axial.q + b * axial.r + tq, c * axial.q + d * axial.r + tr)
+        )
+
+    def apply_array(self, hexes: HexArray) -> HexArray:
+        """
+        transform every hex in one vectorized pass, the result has the same hex type as hexes
+        """
+        axial = hexes.to_axial()
+        (a, b, tq), (c, d, tr) = self.matrix
+        transformed = HexArray(AxialCoordinateHex, a * axial.q + b * axial.r + tq, c * axial.q + d * axial.r + tr)
+        return transformed.convert(hexes.hex_type)
+
+
+# the 6 rotations followed by the 6 reflections, about the origin
+DIHEDRAL_GROUP: Final[tuple[HexTransform, ...]] = tuple(HexTransform.rotation(steps) for steps in range(6)) + tuple(
+    HexTransform.rotation(steps) @ HexTransform.reflection("q") for steps in range(6)
+)
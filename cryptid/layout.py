@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import Final
+
+import numpy as np
+import numpy.typing as npt
+
+from cryptid.board_layouts import BOARD_COLUMNS, BOARD_ROWS
+from cryptid.hex import AxialCoordinateHex, Hex
+from cryptid.hex_array import HexArray
+
+SQRT3: Final[float] = math.sqrt(3)
+
+Floats = npt.NDArray[np.float64]
+
+
+@dataclass(frozen=True)
+class Orientation:
+    """
+    forward maps axial (q, r) to unit pixel (x, y), backward is its inverse
+    """
+
+    forward: tuple[float, float, float, float]
+    backward: tuple[float, float, float, float]
+
+
+POINTY: Final[Orientation] = Orientation(
+    forward=(SQRT3, SQRT3 / 2, 0.0, 3 / 2),
+    backward=(SQRT3 / 3, -1 / 3, 0.0, 2 / 3),
+)
+FLAT: Final[Orientation] = Orientation(
+    forward=(3 / 2, 0.0, SQRT3 / 2, SQRT3),
+    backward=(2 / 3, 0.0, -1 / 3, SQRT3 / 3),
+)
+
+
+def cube_round(q: float, r: float) -> tuple[int, int]:
+    """
+    nearest hex to fractional axial coordinates, rounding in cube space so the result always satisfies q + r + s = 0
+    """
+    s = -q - r
+    rq, rr, rs = round(q), round(r), round(s)
+    dq, dr, ds = abs(rq - q), abs(rr - r), abs(rs - s)
+    if dq > dr and dq > ds:
+        rq = -rr - rs
+    elif dr > ds:
+        rr = -rq - rs
+    return rq, rr
+
+
+def cube_round_arrays(q: Floats, r: Floats) -> tuple[npt.NDArray[np.int64], npt.NDArray[np.int64]]:
+    """
+    vectorized cube_round
+    """
+    s = -q - r
+    rq, rr, rs = np.rint(q), np.rint(r), np.rint(s)
+    dq, dr, ds = np.abs(rq - q), np.abs(rr - r), np.abs(rs - s)
+    fix_q = (dq > dr) & (dq > ds)
+    fix_r = ~fix_q & (dr > ds)
+    rq = np.where(fix_q, -rr - rs, rq)
+    rr = np.where(fix_r, -rq - rs, rr)
+    return rq.astype(np.int64), rr.astype(np.int64)
+
+
+@dataclass(frozen=True)
+class Layout:
+    """
+    where hexes are drawn: an orientation, the hex size along x and y and the pixel position of the origin hex
+    a negative y size flips the y axis, e.g. Layout(POINTY, (1, -1)) puts positive r below the origin with y pointing up
+    """
+
+    orientation: Orientation = POINTY
+    size: tuple[float, float] = (1.0, 1.0)
+    origin: tuple[float, float] = (0.0, 0.0)
+
+    def hex_to_pixel(self, hex: Hex) -> tuple[float, float]:
+        """
+        :return: (x, y) of the center of the hex
+        """
+        axial = hex.to_axial_coordinate_hex()
+        f0, f1, f2, f3 = self.orientation.forward
+        x = (f0 * axial.q + f1 * axial.r) * self.size[0] + self.origin[0]
+        y = (f2 * axial.q + f3 * axial.r) * self.size[1] + self.origin[1]
+        return x, y
+
+    def hexes_to_pixels(self, hexes: HexArray) -> tuple[Floats, Floats]:
+        """
+        vectorized hex_to_pixel
+        :return: x and y arrays of the hex centers
+        """
+        axial = hexes.to_axial()
+        f0, f1, f2, f3 = self.orientation.forward
+        x = (f0 * axial.q + f1 * axial.r) * self.size[0] + self.origin[0]
+        y = (f2 * axial.q + f3 * axial.r) * self.size[1] + self.origin[1]
+        return x, y
+
+    def pixel_to_fractional(self, x: float, y: float) -> tuple[float, float]:
+        """
+        :return: fractional axial (q, r) of a point
+        """
+        b0, b1, b2, b3 = self.orientation.backward
+        px = (x - self.origin[0]) / self.size[0]
+        py = (y - self.origin[1]) / self.size[1]
+        return b0 * px + b1 * py, b2 * px + b3 * py
+
+    def pixel_to_hex(self, x: float, y: float, hex_type: type[Hex] = AxialCoordinateHex) -> Hex:
+        """
+        :return: the hex containing the point, as a hex_type
+        """
+        q, r = cube_round(*self.pixel_to_fractional(x, y))
+        return hex_type.from_axial_coordinate_hex(AxialCoordinateHex(q, r))
+
+    def pixels_to_hexes(self, x: npt.ArrayLike, y: npt.ArrayLike, hex_type: type[Hex] = AxialCoordinateHex) -> HexArray:
+        """
+        vectorized pixel_to_hex
+        :return: the hexes containing each point, in hex_type coordinates
+        """
+        b0, b1, b2, b3 = self.orientation.backward
+        px = (np.asarray(x, dtype=np.float64) - self.origin[0]) / self.size[0]
+        py = (np.asarray(y, dtype=np.float64) - self.origin[1]) / self.size[1]
+        q, r = cube_round_arrays(b0 * px + b1 * py, b2 * px + b3 * py)
+        return HexArray(AxialCoordinateHex, q, r).convert(hex_type)
+
+    def pixels_to_slots(self, x: npt.ArrayLike, y: npt.ArrayLike) -> npt.NDArray[np.int64]:
+        """
+        board slot (see board_layouts.BOARD_HEXES) under each point of a standard board, for hit testing
+        :return: slot index per point, -1 for points off the board
+        """
+        hexes = self.pixels_to_hexes(x, y)
+        # doubled height col and half row, computed straight from axial to skip building the intermediate arrays
+        col, half_row = hexes.q, hexes.r + (hexes.q >> 1)
+        on_board = (0 <= col) & (col < BOARD_COLUMNS) & (0 <= half_row) & (half_row < BOARD_ROWS)
+        return np.where(on_board, col * BOARD_ROWS + half_row, -1)
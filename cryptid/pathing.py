@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import heapq
+import math
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Mapping, Optional, TypeAlias, TypeVar
+
+import numpy as np
+import numpy.typing as npt
+
+from cryptid.clue_engine import TERRAINS, neighbor_indices
+from cryptid.hex import AxialCoordinateHex, Hex
+from cryptid.layout import cube_round
+from cryptid.tile import Terrain, Tile
+
+if TYPE_CHECKING:
+    from cryptid.board import Board
+
+HexT = TypeVar("HexT", bound=Hex)
+
+# cost of stepping onto a tile of each terrain, terrains left out cost 1 and math.inf makes a terrain impassable
+TerrainCosts: TypeAlias = Mapping[Terrain, float]
+
+# nudge the lerp off the edges between hexes so ties always round the same way, see hex_line
+_LINE_NUDGE_Q = 1e-6
+_LINE_NUDGE_R = 2e-6
+
+
+def hex_line(start: HexT, end: HexT) -> list[HexT]:
+    """
+    the hexes a straight line from the center of start to the center of end passes through
+    :return: distance + 1 hexes from start to end, each adjacent to the last, as start's type of hex
+    """
+    a, b = start.to_axial_coordinate_hex(), end.to_axial_coordinate_hex()
+    n = a.distance(b)
+    if n == 0:
+        return [start]
+    line = []
+    for i in range(n + 1):
+        t = i / n
+        q, r = cube_round(
+            a.q + (b.q - a.q) * t + _LINE_NUDGE_Q,
+            a.r + (b.r - a.r) * t + _LINE_NUDGE_R,
+        )
+        line.append(start.from_axial_coordinate_hex(AxialCoordinateHex(q, r)))
+    return line
+
+
+def cost_codes(costs: Optional[TerrainCosts] = None) -> tuple[float, ...]:
+    """
+    :param costs: cost of stepping onto each terrain, None for every step costing 1
+    :return: the cost of each terrain indexed by terrain code, hashable for caching
+    """
+    costs = costs if costs is not None else {}
+    output = tuple(float(costs.get(terrain, 1.0)) for terrain in TERRAINS)
+    if any(cost < 0 or math.isnan(cost) for cost in output):
+        raise ValueError(f"terrain costs must be non negative, got {costs}")
+    return output
+
+
+def slot_costs(board: Board, costs: Optional[TerrainCosts] = None) -> npt.NDArray[np.float64]:
+    """
+    cost of stepping onto every slot of the board
+    """
+    return np.array(cost_codes(costs), dtype=np.float64)[board.arrays.terrain]
+
+
+@dataclass(frozen=True)
+class Path:
+    hexes: tuple[Hex, ...]
+    cost: float
+
+
+def _slot(board: Board, loc: Tile | Hex) -> int:
+    if isinstance(loc, Tile):
+        loc = loc.hex
+    if (slot := board.slot_of(loc)) is None:
+        raise KeyError(loc)
+    return slot
+
+
+def find_path(
+    board: Board, start: Tile | Hex, goal: Tile | Hex, costs: Optional[TerrainCosts] = None
+) -> Optional[Path]:
+    """
+    cheapest path between two tiles with A*, guided by hex distance times the cheapest terrain cost
+    :param costs: cost of stepping onto each terrain, see TerrainCosts, start's own terrain is free
+    :return: the path including both ends, or None if goal can't be reached
+    """
+    start_slot, goal_slot = _slot(board, start), _slot(board, goal)
+    step_costs = slot_costs(board, costs).tolist()
+    cheapest_step = min(step_costs)
+    heuristic = (board.distance_matrix[:, goal_slot] * cheapest_step).tolist()
+    neighbors = neighbor_indices(board.slots)
+
+    best = [math.inf] * len(step_costs)
+    previous = [-1] * len(step_costs)
+    best[start_slot] = 0.0
+    queue = [(heuristic[start_slot], 0.0, start_slot)]
+    while queue:
+        _, cost, slot = heapq.heappop(queue)
+        if slot == goal_slot:
+            break
+        if cost > best[slot]:
+            continue
+        for neighbor in neighbors[slot]:
+            if (neighbor_cost := cost + step_costs[neighbor]) < best[neighbor]:
+                best[neighbor] = neighbor_cost
+                previous[neighbor] = slot
+                heapq.heappush(queue, (neighbor_cost + heuristic[neighbor], neighbor_cost, neighbor))
+
+    if math.isinf(best[goal_slot]):
+        return None
+    slots = [goal_slot]
+    while slots[-1] != start_slot:
+        slots.append(previous[slots[-1]])
+    return Path(tuple(board.slots[slot] for slot in reversed(slots)), best[goal_slot])
+
+
+def path_costs_from(board: Board, start: Tile | Hex, costs: Optional[TerrainCosts] = None) -> npt.NDArray[np.float64]:
+    """
+    cheapest path cost from start to every slot with Dijkstra
+    :return: array over board slots, math.inf where a slot can't be reached
+    """
+    start_slot = _slot(board, start)
+    step_costs = slot_costs(board, costs).tolist()
+    neighbors = neighbor_indices(board.slots)
+
+    best = [math.inf] * len(step_costs)
+    best[start_slot] = 0.0
+    queue = [(0.0, start_slot)]
+    while queue:
+        cost, slot = heapq.heappop(queue)
+        if cost > best[slot]:
+            continue
+        for neighbor in neighbors[slot]:
+            if (neighbor_cost := cost + step_costs[neighbor]) < best[neighbor]:
+                best[neighbor] = neighbor_cost
+                heapq.heappush(queue, (neighbor_cost, neighbor))
+    return np.array(best, dtype=np.float64)
+
+
+@dataclass(frozen=True)
+class PathTable:
+    """
+    cheapest paths between every pair of slots of a board for one set of terrain costs, see Board.path_table
+    """
+
+    slots: tuple[Hex, ...]
+    # cheapest path cost indexed by [start slot, goal slot], math.inf where goal can't be reached
+    costs: npt.NDArray[np.float64]
+    # the slot after start on the cheapest path indexed by [start slot, goal slot], -1 where goal can't be reached
+    next_slot: npt.NDArray[np.intp]
+
+    @classmethod
+    def build(cls, board: Board, costs: Optional[TerrainCosts] = None) -> PathTable:
+        """
+        all pairs shortest paths with Floyd-Warshall, vectorized over each pair of slots for every intermediate slot
+        """
+        step_costs = slot_costs(board, costs)
+        n = len(step_costs)
+        total = np.full((n, n), math.inf)
+        next_slot = np.full((n, n), -1, dtype=np.intp)
+        for slot, neighbors in enumerate(neighbor_indices(board.slots)):
+            reachable = [neighbor for neighbor in neighbors if not math.isinf(step_costs[neighbor])]
+            total[slot, reachable] = step_costs[reachable]
+            next_slot[slot, reachable] = reachable
+        np.fill_diagonal(total, 0.0)
+        np.fill_diagonal(next_slot, np.arange(n))
+
+        for k in range(n):
+            through = total[:, k, np.newaxis] + total[np.newaxis, k, :]
+            better = through < total
+            total = np.where(better, through, total)
+            next_slot = np.where(better, next_slot[:, k, np.newaxis], next_slot)
+
+        total.setflags(write=False)
+        next_slot.setflags(write=False)
+        return cls(board.slots, total, next_slot)
+
+    def slot_path(self, start_slot: int, goal_slot: int) -> Optional[list[int]]:
+        """
+        :return: slot indices of the cheapest path including both ends, or None if goal can't be reached
+        """
+        if self.next_slot[start_slot, goal_slot] < 0:
+            return None
+        slots = [start_slot]
+        while slots[-1] != goal_slot:
+            slots.append(int(self.next_slot[slots[-1], goal_slot]))
+        return slots
+
+    def path(self, start_slot: int, goal_slot: int) -> Optional[Path]:
+        if (slots := self.slot_path(start_slot, goal_slot)) is None:
+            return None
+        return Path(tuple(self.slots[slot] for slot in slots), float(self.costs[start_slot, goal_slot]))
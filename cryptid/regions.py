@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, TypeAlias
+
+import numpy as np
+import numpy.typing as npt
+
+from cryptid.clue_engine import ANIMAL_TERRITORIES, NO_FEATURE, TERRAINS, neighbor_indices, to_mask
+from cryptid.tile import AnimalTerritory, Terrain
+
+if TYPE_CHECKING:
+    from cryptid.board import Board
+
+RegionFeature: TypeAlias = Terrain | AnimalTerritory
+
+
+def label_regions(codes: npt.NDArray[np.int8], neighbors: tuple[tuple[int, ...], ...]) -> npt.NDArray[np.intp]:
+    """
+    connected components of slots with equal codes, in one union find pass over the board adjacency
+    :param codes: feature code of every slot, slots with NO_FEATURE belong to no region
+    :param neighbors: adjacency lists from clue_engine.neighbor_indices
+    :return: region label of every slot, numbered in order of each region's first slot, -1 for NO_FEATURE slots
+    """
+    codes_list = codes.tolist()
+    parents = list(range(len(codes_list)))
+
+    def find(slot: int) -> int:
+        while (parent := parents[slot]) != slot:
+            # path halving keeps the trees flat without recursion
+            parents[slot] = slot = parents[parent]
+        return slot
+
+    for slot, code in enumerate(codes_list):
+        if code == NO_FEATURE:
+            continue
+        for neighbor in neighbors[slot]:
+            if neighbor > slot and codes_list[neighbor] == code:
+                root, neighbor_root = find(slot), find(neighbor)
+                if root != neighbor_root:
+                    # the smaller slot stays root so labels come out in slot order
+                    parents[max(root, neighbor_root)] = min(root, neighbor_root)
+
+    labels = np.full(len(codes_list), -1, dtype=np.intp)
+    region_of_root: dict[int, int] = dict()
+    for slot, code in enumerate(codes_list):
+        if code != NO_FEATURE:
+            labels[slot] = region_of_root.setdefault(find(slot), len(region_of_root))
+    return labels
+
+
+@dataclass(frozen=True)
+class Regions:
+    """
+    connected regions of one kind of feature (every terrain, or every animal territory) on a board
+    regions are numbered in order of their first board slot
+    """
+
+    # region of every board slot, -1 for slots without the feature
+    labels: npt.NDArray[np.intp]
+    # feature of every region
+    features: tuple[RegionFeature, ...]
+    # number of tiles in every region
+    sizes: npt.NDArray[np.intp]
+    # number of hex edges between every region and anything else, including the edge of the board
+    perimeters: npt.NDArray[np.intp]
+    # whether two regions share an edge, indexed by [region, region]
+    adjacency: npt.NDArray[np.bool_]
+
+    @classmethod
+    def from_board(cls, board: Board, feature_type: type[RegionFeature]) -> Regions:
+        """
+        :param feature_type: Terrain or AnimalTerritory
+        """
+        features: tuple[RegionFeature, ...]
+        if feature_type is Terrain:
+            codes, features = board.arrays.terrain, TERRAINS
+        elif feature_type is AnimalTerritory:
+            codes, features = board.arrays.animal_territory, ANIMAL_TERRITORIES
+        else:
+            raise TypeError(f"regions are only defined for Terrain and AnimalTerritory, got {feature_type!r}")
+        neighbors = neighbor_indices(board.slots)
+        labels = label_regions(codes, neighbors)
+        num_regions = int(labels.max()) + 1
+
+        sources = np.array(
+            [slot for slot, slot_neighbors in enumerate(neighbors) for _ in slot_neighbors], dtype=np.intp
+        )
+        targets = np.array([neighbor for slot_neighbors in neighbors for neighbor in slot_neighbors], dtype=np.intp)
+        source_labels, target_labels = labels[sources], labels[targets]
+
+        in_region = labels >= 0
+        sizes = np.bincount(labels[in_region], minlength=num_regions)
+        # every tile has 6 edges, each shared with a neighbor in the same region is interior
+        interior = (source_labels == target_labels) & (source_labels >= 0)
+        perimeters = 6 * sizes - np.bincount(source_labels[interior], minlength=num_regions)
+
+        adjacency = np.zeros((num_regions, num_regions), dtype=np.bool_)
+        border = (source_labels != target_labels) & (source_labels >= 0) & (target_labels >= 0)
+        adjacency[source_labels[border], target_labels[border]] = True
+
+        first_slots = np.unique(labels[in_region], return_index=True)[1]
+        region_codes = codes[in_region][first_slots].tolist()
+        for array in [labels, sizes, perimeters, adjacency]:
+            array.setflags(write=False)
+        return cls(labels, tuple(features[code] for code in region_codes), sizes, perimeters, adjacency)
+
+    def __len__(self) -> int:
+        return len(self.features)
+
+    def regions_of(self, feature: RegionFeature) -> list[int]:
+        return [region for region, region_feature in enumerate(self.features) if region_feature is feature]
+
+    def neighbors(self, region: int) -> list[int]:
+        """
+        the regions sharing an edge with region
+        """
+        return np.flatnonzero(self.adjacency[region]).tolist()
+
+    def mask(self, region: int) -> int:
+        """
+        bitmask over board slots of the tiles in region, see Board.hex_set
+        """
+        return to_mask(self.labels == region)
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from typing import Iterable, Optional
+
+from cryptid.board import Board
+from cryptid.clue import Clue
+from cryptid.hex_set import HexSet
+from cryptid.setup_card import SETUP_CARDS, SetupCard
+from cryptid.tile import Tile
+
+
+def candidates(board: Board, clues: Iterable[Clue]) -> HexSet:
+    """
+    every tile that satisfies all of the clues
+    :param board: the board setup
+    :param clues: the clues in play
+    :return: HexSet of the possible cryptid locations
+    """
+    output = board.full_hex_set()
+    for clue in clues:
+        output &= board.clue_mask(clue)
+    return output
+
+
+def describe_candidates(board: Board, clues: Iterable[Clue]) -> str:
+    """
+    diagnostics of how each clue narrows down the possible cryptid locations
+    """
+    lines = []
+    running = board.full_hex_set()
+    for clue in clues:
+        mask = board.clue_mask(clue)
+        running &= mask
+        lines.append(f"  {clue}: {len(mask)} tiles, {len(running)} remaining")
+    lines.append(f"  remaining tiles: {[hex for hex in running]}")
+    return "\n".join(lines)
+
+
+def solve(card: SetupCard, players: int, board: Optional[Board] = None) -> Tile:
+    """
+    find where the cryptid is for a setup card
+    :param card: the setup card
+    :param players: the number of players (3, 4 or 5)
+    :param board: the board built from the card, pass one in to reuse its cached clue masks
+    :return: the only tile satisfying every player's clue
+    """
+    if players not in card.clues:
+        raise ValueError(f"setup cards have clues for {sorted(card.clues)} players, got {players} instead")
+    if board is None:
+        board = Board.from_setup_card(card)
+    clues = card.clues[players]
+    result = candidates(board, clues)
+    if len(result) != 1:
+        raise ValueError(
+            f"{players} player clues should leave exactly 1 tile, got {len(result)} instead\n"
+            + describe_candidates(board, clues)
+        )
+    return next(result.tiles())
+
+
+def solve_setup_cards(
+    cards: Iterable[SetupCard] = SETUP_CARDS, players: Iterable[int] = (3, 4, 5)
+) -> dict[tuple[int, int], Tile]:
+    """
+    solve every setup card for every player count, building each board once
+    :param cards: the setup cards to validate
+    :param players: the player counts to validate
+    :return: cryptid tile keyed by (card index, number of players)
+    """
+    solutions: dict[tuple[int, int], Tile] = dict()
+    errors: list[str] = list()
+    players = tuple(players)
+    for card_index, card in enumerate(cards):
+        board = Board.from_setup_card(card)
+        for num_players in players:
+            try:
+                solutions[(card_index, num_players)] = solve(card, num_players, board)
+            except ValueError as e:
+                errors.append(f"card {card_index}: {e}")
+    if errors:
+        raise ValueError(f"{len(errors)} invalid setup card(s)\n" + "\n".join(errors))
+    return solutions
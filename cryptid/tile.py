@@ -1,19 +1,43 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, replace
+from dataclasses import dataclass
 from enum import StrEnum, auto, unique
 from types import NotImplementedType
-from typing import Any, Optional
+from typing import Any, Final, Iterable, Optional, TypeVar
 
 from cryptid.hex import Hex
 
 
 class UpperStrEnum(StrEnum):
+    # small int code of the member, its position in definition order, used to store features in numpy arrays
+    # set by the coded decorator on every subclass
+    code: int
+
     @staticmethod
     def _generate_next_value_(name: str, start: int, count: int, last_values: list[str]) -> str:
         return name.upper()
 
+    @property
+    def flag(self) -> int:
+        """
+        one bit per member, so a set of members is an int and matching against it is a single AND
+        """
+        return 1 << self.code
+
+
+EnumT = TypeVar("EnumT", bound=type[UpperStrEnum])
+
 
+def coded(cls: EnumT) -> EnumT:
+    """
+    give every member of a finished enum its code, its position in definition order
+    """
+    for code, member in enumerate(cls):
+        member.code = code
+    return cls
+
+
+@coded
 @unique
 class Terrain(UpperStrEnum):
     WATER = auto()
@@ -23,12 +47,14 @@ class Terrain(UpperStrEnum):
     DESERT = auto()
 
 
+@coded
 @unique
 class AnimalTerritory(UpperStrEnum):
     BEAR = auto()
     COUGAR = auto()
 
 
+@coded
 @unique
 class Color(UpperStrEnum):
     WHITE = auto()
@@ -37,12 +63,14 @@ class Color(UpperStrEnum):
     BLACK = auto()
 
 
+@coded
 @unique
 class Shape(UpperStrEnum):
     STANDING_STONE = auto()
     ABANDONED_SHACK = auto()
 
 
+@coded
 @unique
 class PlayerName(UpperStrEnum):
     PLAYER1 = auto()
@@ -57,22 +85,66 @@ class Structure:
     shape: Shape
     color: Color
 
+    @property
+    def code(self) -> int:
+        """
+        shape and color packed into one small int, unique per structure
+        """
+        return self.shape.code * len(Color) + self.color.code
+
+    @classmethod
+    def from_code(cls, code: int) -> Structure:
+        shape_code, color_code = divmod(code, len(Color))
+        return cls(SHAPES[shape_code], COLORS[color_code])
+
     def __str__(self) -> str:
         return f"Structure(shape={self.shape.value}, color={self.color.value})"
 
 
-@dataclass
+# members indexed by their code
+SHAPES: Final[tuple[Shape, ...]] = tuple(Shape)
+COLORS: Final[tuple[Color, ...]] = tuple(Color)
+
+
+def flags(members: Iterable[UpperStrEnum]) -> int:
+    """
+    the flags of every member or'ed together
+    """
+    output = 0
+    for member in members:
+        output |= member.flag
+    return output
+
+
+@dataclass(slots=True, eq=False)
 class Tile:
     hex: Hex
     terrain: Terrain
     animal_territory: Optional[AnimalTerritory] = None
     structure: Optional[Structure] = None
 
+    def with_hex(self, hex: Hex) -> Tile:
+        """
+        a copy of the tile moved to hex, built directly rather than through dataclasses.replace
+        """
+        return Tile(hex, self.terrain, self.animal_territory, self.structure)
+
+    def __eq__(self, other: Any) -> bool | NotImplementedType:
+        # compares by value with any Tile, including the views handed out by tile_storage.TileStore
+        if not isinstance(other, Tile):
+            return NotImplemented
+        return (
+            self.hex == other.hex
+            and self.terrain is other.terrain
+            and self.animal_territory is other.animal_territory
+            and self.structure == other.structure
+        )
+
     def __add__(self, other: Any) -> Tile | NotImplementedType:
         if isinstance(other, Tile):
-            return replace(self, hex=self.hex + other.hex)
+            return self.with_hex(self.hex + other.hex)
         if isinstance(other, Hex):
-            return replace(self, hex=self.hex + other)
+            return self.with_hex(self.hex + other)
         return NotImplemented
 
     def __radd__(self, other: Any) -> Tile | NotImplementedType:
@@ -80,9 +152,9 @@ class Tile:
 
     def __sub__(self, other: Any) -> Tile | NotImplementedType:
         if isinstance(other, Tile):
-            return replace(self, hex=self.hex - other.hex)
+            return self.with_hex(self.hex - other.hex)
         if isinstance(other, Hex):
-            return replace(self, hex=self.hex - other)
+            return self.with_hex(self.hex - other)
         return NotImplemented
 
     def __rsub__(self, other: Any) -> Tile | NotImplementedType:
@@ -97,7 +169,7 @@ class Tile:
     #     return self.__mul__(other)
 
     def __neg__(self) -> Tile | NotImplementedType:
-        return replace(self, hex=-self.hex)
+        return self.with_hex(-self.hex)
 
     # def __str__(self) -> str:
     #     attr_strs = [
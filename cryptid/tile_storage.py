@@ -0,0 +1,301 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Iterable, Iterator, MutableMapping, Optional, TypeAlias
+
+import numpy as np
+import numpy.typing as npt
+
+from cryptid.board_layouts import BOARD_HEXES, hex_to_slot
+from cryptid.clue_engine import (
+    ANIMAL_TERRITORIES,
+    COLOR_CODES,
+    NO_FEATURE,
+    TERRAINS,
+    BoardArrays,
+)
+from cryptid.hex import Hex
+from cryptid.tile import AnimalTerritory, Structure, Terrain, Tile
+
+# called after every write to a tile storage, with whether only structures changed, see Board.tiles_changed
+WriteHook: TypeAlias = Callable[[bool], None]
+
+
+class TileDict(dict[Hex, Tile]):
+    """
+    the default tile storage, a dict that calls on_write after every change to its entries
+    """
+
+    __slots__ = ("on_write",)
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.on_write: Optional[WriteHook] = None
+
+    def _written(self) -> None:
+        if self.on_write is not None:
+            self.on_write(False)
+
+    def __setitem__(self, key: Hex, tile: Tile) -> None:
+        super().__setitem__(key, tile)
+        self._written()
+
+    def __delitem__(self, key: Hex) -> None:
+        super().__delitem__(key)
+        self._written()
+
+    # dict's other writers don't go through __setitem__ or __delitem__
+    def __ior__(self, other: Any) -> TileDict:  # type: ignore[override, misc]
+        super().__ior__(other)
+        self._written()
+        return self
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        super().update(*args, **kwargs)
+        self._written()
+
+    def pop(self, *args: Any) -> Any:
+        output = super().pop(*args)
+        self._written()
+        return output
+
+    def popitem(self) -> tuple[Hex, Tile]:
+        output = super().popitem()
+        self._written()
+        return output
+
+    def setdefault(self, key: Hex, default: Any = None) -> Any:
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def clear(self) -> None:
+        super().clear()
+        self._written()
+
+    def __reduce__(self) -> tuple[type[TileDict], tuple[dict[Hex, Tile]]]:
+        # the write hook belongs to the board holding the tiles, it isn't part of their state
+        return TileDict, (dict(self),)
+
+
+class DenseTiles(MutableMapping[Hex, Tile]):
+    """
+    tiles of a standard 12 x 9 board stored in a flat list indexed by board slot
+    lookups map any type of hex to its slot arithmetically instead of hashing it
+    """
+
+    __slots__ = ("_tiles", "_count", "on_write")
+
+    def __init__(self, tiles: Iterable[Tile] = ()) -> None:
+        self._tiles: list[Optional[Tile]] = [None] * len(BOARD_HEXES)
+        self._count = 0
+        self.on_write: Optional[WriteHook] = None
+        for tile in tiles:
+            self[tile.hex] = tile
+
+    @classmethod
+    def from_slots(cls, tiles: Iterable[Optional[Tile]]) -> DenseTiles:
+        """
+        :param tiles: the tile (or None) in every board slot, in slot order
+        """
+        output = cls()
+        output._tiles = list(tiles)
+        if len(output._tiles) != len(BOARD_HEXES):
+            raise ValueError(f"must pass {len(BOARD_HEXES)} slots, got {len(output._tiles)} instead")
+        output._count = sum(tile is not None for tile in output._tiles)
+        return output
+
+    def tile_at(self, slot: int) -> Optional[Tile]:
+        return self._tiles[slot]
+
+    def _slot(self, key: Any) -> int:
+        if not isinstance(key, Hex) or (slot := hex_to_slot(key)) is None:
+            raise KeyError(key)
+        return slot
+
+    def __getitem__(self, key: Hex) -> Tile:
+        if (tile := self._tiles[self._slot(key)]) is None:
+            raise KeyError(key)
+        return tile
+
+    def __setitem__(self, key: Hex, tile: Tile) -> None:
+        slot = self._slot(key)
+        if hex_to_slot(tile.hex) != slot:
+            raise ValueError(f"tile at {tile.hex} can't be stored at {key}")
+        if self._tiles[slot] is None:
+            self._count += 1
+        self._tiles[slot] = tile
+        if self.on_write is not None:
+            self.on_write(False)
+
+    def __delitem__(self, key: Hex) -> None:
+        slot = self._slot(key)
+        if self._tiles[slot] is None:
+            raise KeyError(key)
+        self._tiles[slot] = None
+        self._count -= 1
+        if self.on_write is not None:
+            self.on_write(False)
+
+    def __contains__(self, key: Any) -> bool:
+        if not isinstance(key, Hex) or (slot := hex_to_slot(key)) is None:
+            return False
+        return self._tiles[slot] is not None
+
+    def __iter__(self) -> Iterator[Hex]:
+        for tile in self._tiles:
+            if tile is not None:
+                yield tile.hex
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({[tile for tile in self._tiles if tile is not None]})"
+
+
+class TileView(Tile):
+    """
+    a Tile that reads and writes one slot of a TileStore, handed out by TileStore lookups
+    it compares equal to a Tile with the same values, tile.with_hex(tile.hex) makes a detached copy
+    """
+
+    __slots__ = ("_store", "_slot")
+
+    def __init__(self, store: TileStore, slot: int) -> None:
+        self._store = store
+        self._slot = slot
+
+    @property
+    def hex(self) -> Hex:
+        return BOARD_HEXES[self._slot]
+
+    @hex.setter
+    def hex(self, hex: Hex) -> None:
+        raise AttributeError("tiles in a TileStore can't be moved, assign a new tile to the store instead")
+
+    @property
+    def terrain(self) -> Terrain:
+        return TERRAINS[self._store.terrain[self._slot]]
+
+    @terrain.setter
+    def terrain(self, terrain: Terrain) -> None:
+        self._store.terrain[self._slot] = terrain.code
+        self._store.written(False)
+
+    @property
+    def animal_territory(self) -> Optional[AnimalTerritory]:
+        code = self._store.animal_territory[self._slot]
+        return None if code == NO_FEATURE else ANIMAL_TERRITORIES[code]
+
+    @animal_territory.setter
+    def animal_territory(self, animal_territory: Optional[AnimalTerritory]) -> None:
+        self._store.animal_territory[self._slot] = NO_FEATURE if animal_territory is None else animal_territory.code
+        self._store.written(False)
+
+    @property
+    def structure(self) -> Optional[Structure]:
+        code = self._store.structure[self._slot]
+        return None if code == NO_FEATURE else Structure.from_code(code)
+
+    @structure.setter
+    def structure(self, structure: Optional[Structure]) -> None:
+        self._store.structure[self._slot] = NO_FEATURE if structure is None else structure.code
+        self._store.written(True)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.with_hex(self.hex)!r})"
+
+
+class TileStore(MutableMapping[Hex, Tile]):
+    """
+    tiles of a standard 12 x 9 board stored as one small int array per attribute, indexed by board slot
+    a board is 4 arrays of 108 bytes instead of 108 Tile objects, lookups hand out TileView objects that read and
+    write the arrays so changing a tile (e.g. placing a structure) changes the store
+    """
+
+    __slots__ = ("terrain", "animal_territory", "structure", "present", "on_write")
+
+    def __init__(self, tiles: Iterable[Tile] = ()) -> None:
+        # feature codes as in clue_engine, structures as Structure.code, NO_FEATURE where there is none
+        self.terrain: npt.NDArray[np.int8] = np.zeros(len(BOARD_HEXES), dtype=np.int8)
+        self.animal_territory: npt.NDArray[np.int8] = np.full(len(BOARD_HEXES), NO_FEATURE, dtype=np.int8)
+        self.structure: npt.NDArray[np.int8] = np.full(len(BOARD_HEXES), NO_FEATURE, dtype=np.int8)
+        self.present: npt.NDArray[np.bool_] = np.zeros(len(BOARD_HEXES), dtype=np.bool_)
+        self.on_write: Optional[WriteHook] = None
+        for tile in tiles:
+            self[tile.hex] = tile
+
+    @classmethod
+    def from_codes(cls, terrain: npt.NDArray[np.int8], animal_territory: npt.NDArray[np.int8]) -> TileStore:
+        """
+        a full board from terrain and animal territory codes in slot order, see board_layouts.layout_arrays
+        """
+        output = cls()
+        output.terrain[:] = terrain
+        output.animal_territory[:] = animal_territory
+        output.present[:] = True
+        return output
+
+    def arrays(self) -> BoardArrays:
+        """
+        the store's codes as BoardArrays (copies), valid for a full board
+        """
+        has_structure = self.structure != NO_FEATURE
+        shape, color = np.divmod(self.structure, len(COLOR_CODES))
+        return BoardArrays(
+            terrain=self.terrain.copy(),
+            animal_territory=self.animal_territory.copy(),
+            structure_shape=np.where(has_structure, shape, NO_FEATURE).astype(np.int8),
+            structure_color=np.where(has_structure, color, NO_FEATURE).astype(np.int8),
+        )
+
+    def written(self, structures_only: bool) -> None:
+        if self.on_write is not None:
+            self.on_write(structures_only)
+
+    def tile_at(self, slot: int) -> Optional[Tile]:
+        return TileView(self, slot) if self.present[slot] else None
+
+    def _slot(self, key: Any) -> int:
+        if not isinstance(key, Hex) or (slot := hex_to_slot(key)) is None:
+            raise KeyError(key)
+        return slot
+
+    def __getitem__(self, key: Hex) -> Tile:
+        slot = self._slot(key)
+        if not self.present[slot]:
+            raise KeyError(key)
+        return TileView(self, slot)
+
+    def __setitem__(self, key: Hex, tile: Tile) -> None:
+        slot = self._slot(key)
+        if hex_to_slot(tile.hex) != slot:
+            raise ValueError(f"tile at {tile.hex} can't be stored at {key}")
+        self.terrain[slot] = tile.terrain.code
+        self.animal_territory[slot] = NO_FEATURE if tile.animal_territory is None else tile.animal_territory.code
+        self.structure[slot] = NO_FEATURE if tile.structure is None else tile.structure.code
+        self.present[slot] = True
+        self.written(False)
+
+    def __delitem__(self, key: Hex) -> None:
+        slot = self._slot(key)
+        if not self.present[slot]:
+            raise KeyError(key)
+        self.present[slot] = False
+        self.structure[slot] = NO_FEATURE
+        self.written(False)
+
+    def __contains__(self, key: Any) -> bool:
+        if not isinstance(key, Hex) or (slot := hex_to_slot(key)) is None:
+            return False
+        return bool(self.present[slot])
+
+    def __iter__(self) -> Iterator[Hex]:
+        for slot in np.flatnonzero(self.present).tolist():
+            yield BOARD_HEXES[slot]
+
+    def __len__(self) -> int:
+        return int(self.present.sum())
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({[tile.with_hex(hex) for hex, tile in self.items()]})"
@@ -0,0 +1,26 @@
+# mypy: ignore-errors
+
+import time
+
+from cryptid.board import Board
+from cryptid.clue import BLUE_CLUES, BROWN_CLUES, GREEN_CLUES, PURPLE_CLUES, RED_CLUES
+from cryptid.clue_search import ClueIndex
+from cryptid.setup_card import SETUP_CARDS
+
+if __name__ == "__main__":
+    board = Board.from_setup_card(SETUP_CARDS[0])
+    pool = [clue for book in [RED_CLUES, GREEN_CLUES, BLUE_CLUES, BROWN_CLUES, PURPLE_CLUES] for clue in book[1:]]
+
+    start = time.perf_counter()
+    index = ClueIndex.build(board, pool)
+    print(
+        f"indexed {len(pool)} book clues into {len(index.masks)} distinct masks in {time.perf_counter() - start:.3f}s"
+    )
+
+    for clues_per_combination in [3, 4, 5]:
+        start = time.perf_counter()
+        found = sum(1 for hex in board.slots for _ in index.isolating_masks(hex, clues_per_combination))
+        print(
+            f"{clues_per_combination} clues: {found:,} minimal mask combinations over every tile"
+            f" in {time.perf_counter() - start:.2f}s"
+        )
@@ -7,10 +7,9 @@ from matplotlib.patches import RegularPolygon
 from cryptid.setup_card import SETUP_CARDS
 from cryptid.board import Board
 from cryptid.hex import AxialCoordinateHex
+from cryptid.layout import FLAT, POINTY, Layout
 from cryptid.tile import AnimalTerritory, Terrain, Tile, Shape
 
-SQRT3: Final[float] = math.sqrt(3)
-SQRT3_OVER2: Final[float] = math.sqrt(3) / 2
 
 HEX_COLOR_MAPPING: Final[dict[Terrain, str]] = {
     Terrain.WATER: "blue",
@@ -32,15 +31,11 @@ SHAPE_MAPPING: dict = {
 
 
 def hex_to_pointy_coords(axial: AxialCoordinateHex, radius: float = 1) -> tuple[float, float]:
-    x = radius * (SQRT3 * axial.q + SQRT3_OVER2 * axial.r)
-    y = -1.5 * radius * axial.r
-    return x, y
+    return Layout(POINTY, size=(radius, -radius)).hex_to_pixel(axial)
 
 
 def hex_to_flat_coords(axial: AxialCoordinateHex, radius: float = 1) -> tuple[float, float]:
-    x = 1.5 * radius * axial.q
-    y = -radius * (SQRT3 * axial.r + SQRT3_OVER2 * axial.q)
-    return x, y
+    return Layout(FLAT, size=(radius, -radius)).hex_to_pixel(axial)
 
 
 def plot_hex(
@@ -0,0 +1,50 @@
+# mypy: ignore-errors
+
+import gc
+import random
+import tracemalloc
+from dataclasses import dataclass
+
+from cryptid.board_layouts import BOARD_HEXES
+from cryptid.hex import DoubledHeightCoordinateHex
+
+
+@dataclass(frozen=True)
+class DictHex:
+    """
+    stand in for a hex without __slots__, the layout every hex had before they were slotted
+    """
+
+    q: int
+    r: int
+
+
+def traced_size(build) -> int:
+    gc.collect()
+    tracemalloc.start()
+    held = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del held
+    return size
+
+
+if __name__ == "__main__":
+    count = 1_000_000
+    random.seed(0)
+    # candidate tracking holds the same few board locations over and over
+    picks = [random.choice(BOARD_HEXES) for _ in range(count)]
+
+    results = {
+        "dict based hexes": traced_size(lambda: [DictHex(hex.q, hex.r) for hex in picks]),
+        "slotted hexes": traced_size(lambda: [DoubledHeightCoordinateHex(hex.q, hex.r) for hex in picks]),
+        "interned hexes": traced_size(lambda: [DoubledHeightCoordinateHex(hex.q, hex.r).interned() for hex in picks]),
+        "int keys": traced_size(lambda: [hex.key for hex in picks]),
+    }
+
+    baseline = results["dict based hexes"]
+    print(f"holding {count:,} board hexes:")
+    for name, size in results.items():
+        print(
+            f"  {name:>16}: {size / 2**20:7.1f} MiB ({size / count:5.1f} bytes per hex, {size / baseline:6.1%} of dict based)"
+        )
@@ -0,0 +1,35 @@
+# mypy: ignore-errors
+
+import timeit
+
+from cryptid.hex import (
+    AxialCoordinateHex,
+    CubeCoordinateHex,
+    DoubledHeightCoordinateHex,
+    DoubledWidthCoordinateHex,
+    set_full_validation,
+)
+
+if __name__ == "__main__":
+    # a radius 10 patch of hexes in each type, every one of them is converted, stepped and ranged over
+    centers = list(AxialCoordinateHex(0, 0).iter_hexes_within_range(10))
+    number = 5
+    for hex_type in [DoubledHeightCoordinateHex, DoubledWidthCoordinateHex, CubeCoordinateHex]:
+        hexes = [hex_type.from_axial_coordinate_hex(center) for center in centers]
+        benchmarks = {
+            "neighbors": lambda: [hex.neighbors for hex in hexes],
+            "hexes_within_range(3)": lambda: [hex.hexes_within_range(3) for hex in hexes],
+            "from_axial_coordinate_hex": lambda: [hex_type.from_axial_coordinate_hex(center) for center in centers],
+        }
+        for name, benchmark in benchmarks.items():
+            timings = {}
+            for validated in [True, False]:
+                set_full_validation(validated)
+                benchmark()  # warm up the stencil caches
+                timings[validated] = timeit.timeit(benchmark, number=number) / number
+            set_full_validation(False)
+            print(
+                f"{hex_type.__name__}.{name} over {len(hexes)} hexes: "
+                f"validated {timings[True] * 1e3:.2f}ms, unchecked {timings[False] * 1e3:.2f}ms "
+                f"({timings[True] / timings[False]:.1f}x)"
+            )
@@ -0,0 +1,19 @@
+# mypy: ignore-errors
+
+import os
+
+from cryptid.generator import GenerationStats, generate_puzzles
+
+if __name__ == "__main__":
+    for clues_per_puzzle in [3, 4]:
+        for workers in sorted({1, os.cpu_count() or 1}):
+            stats = GenerationStats()
+            for _ in generate_puzzles(
+                num_boards=4 * workers,
+                clues_per_puzzle=clues_per_puzzle,
+                max_puzzles_per_board=2000,
+                max_workers=workers,
+                stats=stats,
+            ):
+                pass
+            print(f"{clues_per_puzzle} clues: {stats}")
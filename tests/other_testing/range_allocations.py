@@ -0,0 +1,57 @@
+# mypy: ignore-errors
+
+import sys
+from collections import Counter
+
+from cryptid.board import Board
+from cryptid.clue import Clue, WithinThreeSpacesOfColorClue
+from cryptid.hex import Hex
+from cryptid.setup_card import SETUP_CARDS
+from cryptid.tile import Color, Tile
+
+
+def count_constructions(call, classes=(Hex, Tile)) -> Counter:
+    """
+    count the objects of classes built while running call, by class name
+    hexes and tiles are built either through their __init__ or straight from object.__new__ (see Hex._unchecked)
+    """
+    counts = Counter()
+
+    def profile(frame, event, arg):
+        if event == "call" and frame.f_code.co_name == "__init__":
+            built = frame.f_locals.get("self", None)
+            if isinstance(built, classes):
+                counts[type(built).__name__] += 1
+        elif event == "c_call" and arg is object.__new__:
+            cls = frame.f_locals.get("cls", None)
+            if isinstance(cls, type) and issubclass(cls, classes):
+                counts[cls.__name__] += 1
+
+    sys.setprofile(profile)
+    try:
+        call()
+    finally:
+        sys.setprofile(None)
+    return counts
+
+
+def report(name: str, counts: Counter) -> None:
+    details = ", ".join(f"{count:,} {class_name}" for class_name, count in counts.most_common())
+    print(f"{name}: {sum(counts.values()):,} hexes and tiles built ({details or 'none'})")
+
+
+if __name__ == "__main__":
+    board = Board.from_setup_card(SETUP_CARDS[0])
+    # no black structure is placed, so every tile scans its whole radius 3 neighbourhood
+    clue = WithinThreeSpacesOfColorClue(Color.BLACK)
+    # warm up the range stencils, the board's lookup tables and the neighbourhood arrays so only the clue is counted
+    Clue.resolve_mask(clue, board)
+    clue.resolve_mask(board)
+
+    report(
+        "per tile resolve for every tile (Clue.resolve_mask)",
+        count_constructions(lambda: Clue.resolve_mask(clue, board)),
+    )
+    # the vectorized path on a board that hasn't computed its feature arrays or distances yet
+    fresh_board = Board.from_setup_card(SETUP_CARDS[0])
+    report("resolve_mask on a new board", count_constructions(lambda: clue.resolve_mask(fresh_board)))
@@ -0,0 +1,26 @@
+# mypy: ignore-errors
+
+import time
+
+from cryptid.board import Board
+from cryptid.setup_card import SETUP_CARDS
+from cryptid.solver import solve
+
+if __name__ == "__main__":
+    card = SETUP_CARDS[0]
+    num_trials = 1000
+
+    start = time.perf_counter()
+    for _ in range(num_trials):
+        solve(card, 5)
+    cold = (time.perf_counter() - start) / num_trials
+
+    board = Board.from_setup_card(card)
+    solve(card, 5, board)
+    start = time.perf_counter()
+    for _ in range(num_trials):
+        solve(card, 5, board)
+    warm = (time.perf_counter() - start) / num_trials
+
+    print(f"solve with a new board: {cold * 1e3:.3f} ms")
+    print(f"solve reusing a board's cached clue masks: {warm * 1e3:.3f} ms ({cold / warm:.0f}x faster)")
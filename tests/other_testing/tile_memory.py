@@ -0,0 +1,53 @@
+# mypy: ignore-errors
+
+import gc
+import random
+import time
+import tracemalloc
+
+from cryptid.board import Board
+from cryptid.board_layouts import NUM_LAYOUTS
+from cryptid.clue import OnOneOfTwoTerrainClue
+from cryptid.tile import Terrain
+
+
+def traced_size(build) -> int:
+    gc.collect()
+    tracemalloc.start()
+    held = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del held
+    return size
+
+
+def clue_time(boards) -> float:
+    clue = OnOneOfTwoTerrainClue([Terrain.FOREST, Terrain.WATER])
+    start = time.perf_counter()
+    for board in boards:
+        clue.check_mask(board)
+    return (time.perf_counter() - start) / len(boards)
+
+
+if __name__ == "__main__":
+    count = 1_000
+    random.seed(0)
+    indices = random.sample(range(NUM_LAYOUTS), count)
+    storages = {
+        "dict": dict(),
+        "dense": dict(dense=True),
+        "compact": dict(compact=True),
+    }
+
+    baseline = None
+    print(f"holding {count:,} boards:")
+    for name, kwargs in storages.items():
+        size = traced_size(lambda: [Board.from_layout(index, **kwargs) for index in indices])
+        baseline = baseline or size
+        boards = [Board.from_layout(index, **kwargs) for index in indices]
+        for board in boards:
+            board._arrays = None
+        print(
+            f"  {name:>8}: {size / 2**20:6.2f} MiB ({size / count / 1024:5.1f} KiB per board, {size / baseline:6.1%} of"
+            f" dict), clue mask from scratch {clue_time(boards) * 1e6:5.1f} us"
+        )
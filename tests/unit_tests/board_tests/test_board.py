@@ -1,9 +1,24 @@
+import pickle
 import random
 
+import pytest
+
 from cryptid.board import Board
+from cryptid.board_layouts import BOARD_HEXES, rotated_layout_index
 from cryptid.board_sections import BOARD_SECTION_OFFSETS, BOARD_SECTIONS
+from cryptid.clue import (
+    BLUE_CLUES,
+    BROWN_CLUES,
+    GREEN_CLUES,
+    PURPLE_CLUES,
+    RED_CLUES,
+    Clue,
+    OnOneOfTwoTerrainClue,
+    WithinTwoSpacesOfShapeClue,
+)
 from cryptid.hex import DoubledHeightCoordinateHex
-from cryptid.tile import AnimalTerritory, Terrain
+from cryptid.setup_card import SETUP_CARDS
+from cryptid.tile import AnimalTerritory, Color, Shape, Structure, Terrain, Tile
 
 
 class TestBoard:
@@ -84,3 +99,137 @@ class TestBoard:
         assert len(board.get_tiles_in_range(loc=DoubledHeightCoordinateHex(5, 9), range=2)) == 19
         assert len(board.get_tiles_in_range(loc=DoubledHeightCoordinateHex(5, 9), range=3)) == 37
         assert len(board.get_tiles_in_range(loc=DoubledHeightCoordinateHex(9, 17), range=3)) == 18
+
+
+class TestBoardClueMask:
+    @staticmethod
+    def all_book_clues() -> list[Clue]:
+        return [clue for book in [RED_CLUES, GREEN_CLUES, BLUE_CLUES, BROWN_CLUES, PURPLE_CLUES] for clue in book[1:]]
+
+    def test_clue_mask_matches_check_space(self):
+        board = Board.from_setup_card(SETUP_CARDS[0])
+        for clue in {(type(clue), clue): clue for clue in self.all_book_clues()}.values():
+            expected = board.hex_set(tile for tile in board.tiles.values() if clue.check_space(tile, board))
+            assert board.clue_mask(clue) == expected
+
+    def test_duplicate_clues_share_entries(self):
+        board = Board.from_setup_card(SETUP_CARDS[0])
+        clues = self.all_book_clues()
+        for clue in clues:
+            _ = board.clue_mask(clue)
+        assert len(board._clue_masks) < len(clues)
+
+        clue1 = OnOneOfTwoTerrainClue(valid_terrains=[Terrain.WATER, Terrain.DESERT])
+        clue2 = OnOneOfTwoTerrainClue(valid_terrains=[Terrain.DESERT, Terrain.WATER])
+        board = Board.from_setup_card(SETUP_CARDS[0])
+        assert board.clue_mask(clue1) == board.clue_mask(clue2)
+        assert len(board._clue_masks) == 1
+
+    def test_place_structure_invalidates(self):
+        board = Board.from_board_sections([1, 2, 3, 4, 5, 6])
+        shape_clue = WithinTwoSpacesOfShapeClue(shape=Shape.STANDING_STONE)
+        terrain_clue = OnOneOfTwoTerrainClue(valid_terrains=[Terrain.WATER, Terrain.DESERT])
+        assert len(board.clue_mask(shape_clue)) == 0
+        terrain_mask = board.clue_mask(terrain_clue)
+
+        location = DoubledHeightCoordinateHex(5, 9)
+        board.place_structure(Structure(Shape.STANDING_STONE, Color.BLUE), location)
+        assert (type(terrain_clue), terrain_clue) in board._clue_masks
+        assert (type(shape_clue), shape_clue) not in board._clue_masks
+
+        assert board.clue_mask(shape_clue) == board.hex_set(board.get_tiles_in_range(location, 2))
+        assert board.clue_mask(terrain_clue) == terrain_mask
+
+
+class TestBoardInvalidation:
+    @staticmethod
+    def warm(board: Board) -> None:
+        _ = board.arrays, board.regions(Terrain), board.path_table(), board.distance_to(Terrain.WATER)
+        _ = board.clue_mask(OnOneOfTwoTerrainClue(valid_terrains=[Terrain.WATER, Terrain.DESERT]))
+
+    @staticmethod
+    def assert_cold(board: Board) -> None:
+        assert board._arrays is None
+        assert board._regions == {} and board._path_tables == {}
+        assert board._distances == {} and board._clue_masks == {}
+
+    @pytest.mark.parametrize("storage", [{}, {"dense": True}, {"compact": True}])
+    def test_tile_writes_invalidate(self, storage):
+        board = Board.from_layout(0, **storage)
+        hex = BOARD_HEXES[20]
+        self.warm(board)
+        board.tiles[hex] = Tile(hex, Terrain.MOUNTAIN)
+        self.assert_cold(board)
+        assert board.arrays.terrain[20] == Terrain.MOUNTAIN.code
+        assert board.regions(Terrain).features[board.regions(Terrain).labels[20]] is Terrain.MOUNTAIN
+        assert board.tiles_by_key[hex.key].terrain is Terrain.MOUNTAIN
+
+        self.warm(board)
+        board.set_tile(Tile(hex, Terrain.SWAMP))
+        self.assert_cold(board)
+        assert board.arrays.terrain[20] == Terrain.SWAMP.code
+
+    def test_compact_view_writes_invalidate(self):
+        board = Board.from_layout(0, compact=True)
+        self.warm(board)
+        board.tiles[BOARD_HEXES[20]].terrain = Terrain.MOUNTAIN
+        self.assert_cold(board)
+        assert board.arrays.terrain[20] == Terrain.MOUNTAIN.code
+
+        self.warm(board)
+        board.tiles[BOARD_HEXES[20]].structure = Structure(Shape.STANDING_STONE, Color.BLUE)
+        assert board._arrays is None
+        assert board._regions and board._path_tables
+
+    def test_place_structure_keeps_terrain_caches(self):
+        board = Board.from_layout(0)
+        self.warm(board)
+        regions, table = board.regions(Terrain), board.path_table()
+        board.place_structure(Structure(Shape.STANDING_STONE, Color.BLUE), BOARD_HEXES[20])
+        assert board.regions(Terrain) is regions and board.path_table() is table
+
+    def test_plain_dict_and_pickle_are_hooked(self):
+        board = Board(tiles=dict(Board.from_layout(0).tiles))
+        self.warm(board)
+        board.tiles[BOARD_HEXES[20]] = Tile(BOARD_HEXES[20], Terrain.MOUNTAIN)
+        self.assert_cold(board)
+
+        board = pickle.loads(pickle.dumps(Board.from_layout(0)))
+        self.warm(board)
+        board.tiles.update({BOARD_HEXES[20]: Tile(BOARD_HEXES[20], Terrain.MOUNTAIN)})
+        self.assert_cold(board)
+
+
+class TestBoardFingerprint:
+    def test_stable(self):
+        # fingerprints key on disk caches, so they must never change between processes or releases
+        assert Board.from_layout(0).fingerprint() == 0x3A315114DC0866BE4C1C5D332855FAC
+        assert Board.from_setup_card(SETUP_CARDS[0]).fingerprint() == 0xA4ADBEE28716177A4E9983D4A7A3546F
+
+    def test_distinguishes_boards(self):
+        fingerprints = {Board.from_layout(index).fingerprint() for index in range(0, 46080, 97)}
+        assert len(fingerprints) == len(range(0, 46080, 97))
+
+        board = Board.from_layout(5)
+        before = board.fingerprint()
+        board.place_structure(Structure(Shape.STANDING_STONE, Color.BLUE), board.slots[0])
+        assert board.fingerprint() != before
+
+    def test_canonical(self):
+        random.seed(4)
+        for index in random.sample(range(46080), 10):
+            board = Board.from_layout(index)
+            rotated = Board.from_layout(rotated_layout_index(index))
+            locations = random.sample(range(len(BOARD_HEXES)), 3)
+            for location, color in zip(locations, [Color.WHITE, Color.GREEN, Color.BLUE]):
+                board.place_structure(Structure(Shape.ABANDONED_SHACK, color), BOARD_HEXES[location])
+                rotated.place_structure(Structure(Shape.ABANDONED_SHACK, color), BOARD_HEXES[-1 - location])
+            assert board.fingerprint() != rotated.fingerprint()
+            assert board.fingerprint(canonical=True) == rotated.fingerprint(canonical=True)
+            assert board.fingerprint(canonical=True) in (board.fingerprint(), rotated.fingerprint())
+
+    def test_canonical_standard_boards_only(self):
+        board = Board(tiles=dict(BOARD_SECTIONS[0].tiles))
+        _ = board.fingerprint()
+        with pytest.raises(ValueError):
+            _ = board.fingerprint(canonical=True)
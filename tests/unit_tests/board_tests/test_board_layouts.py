@@ -0,0 +1,141 @@
+import random
+
+import numpy as np
+import pytest
+
+from cryptid.board import Board
+from cryptid.board_layouts import (
+    BOARD_HEXES,
+    NUM_LAYOUTS,
+    LayoutTable,
+    canonical_layout_index,
+    layout_arrays,
+    layout_from_index,
+    layout_index,
+    rotated_layout_index,
+)
+from cryptid.board_sections import BOARD_SECTION_OFFSETS, BOARD_SECTIONS
+from cryptid.clue_engine import BoardArrays
+from cryptid.hex import Hex
+from cryptid.tile import Terrain, Tile
+
+
+def reference_board(order: list[int], orientation: list[bool]) -> Board:
+    tiles: dict[Hex, Tile] = dict()
+    for offset, (board_section, inverted) in enumerate(zip(order, orientation)):
+        tiles |= BOARD_SECTIONS[board_section - 1].invert(inverted).offset(BOARD_SECTION_OFFSETS[offset]).tiles
+    return Board(tiles=tiles)
+
+
+class TestLayoutIndex:
+    def test_num_layouts(self):
+        assert NUM_LAYOUTS == 46080
+
+    def test_round_trip(self):
+        random.seed(7)
+        for index in [0, 1, 63, 64, NUM_LAYOUTS - 1, *random.sample(range(NUM_LAYOUTS), 50)]:
+            order, orientation = layout_from_index(index)
+            assert sorted(order) == [1, 2, 3, 4, 5, 6]
+            assert layout_index(order, orientation) == index
+
+        assert layout_index([1, 2, 3, 4, 5, 6]) == 0
+        assert layout_index([1, 2, 3, 4, 5, 6], [True, False, False, False, False, False]) == 1
+        assert layout_index([6, 5, 4, 3, 2, 1], [True] * 6) == NUM_LAYOUTS - 1
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            _ = layout_index([1, 1, 2, 3, 4, 5])
+
+        with pytest.raises(ValueError):
+            _ = layout_from_index(NUM_LAYOUTS)
+
+        with pytest.raises(ValueError):
+            _ = layout_from_index(-1)
+
+
+class TestLayoutSymmetry:
+    def test_rotated_layout(self):
+        random.seed(5)
+        for index in random.sample(range(NUM_LAYOUTS), 25):
+            rotated = rotated_layout_index(index)
+            assert rotated != index
+            assert rotated_layout_index(rotated) == index
+            assert canonical_layout_index(index) == canonical_layout_index(rotated) == min(index, rotated)
+            # turning a standard board 180 degrees reverses its slot order
+            board, rotated_board = Board.from_layout(index), Board.from_layout(rotated)
+            assert np.array_equal(board.arrays.terrain[::-1], rotated_board.arrays.terrain)
+            assert np.array_equal(board.arrays.animal_territory[::-1], rotated_board.arrays.animal_territory)
+
+    def test_canonical_layout_count(self):
+        assert len({canonical_layout_index(index) for index in range(NUM_LAYOUTS)}) == NUM_LAYOUTS // 2
+
+
+class TestLayoutBoards:
+    def test_board_hexes_are_slots(self):
+        board = reference_board([1, 2, 3, 4, 5, 6], [False] * 6)
+        assert board.slots == BOARD_HEXES
+
+    def test_from_layout_matches_sections(self):
+        random.seed(3)
+        for index in random.sample(range(NUM_LAYOUTS), 25):
+            order, orientation = layout_from_index(index)
+            board = Board.from_layout(index)
+            assert board == reference_board(order, orientation)
+            assert board.slots == BOARD_HEXES
+            expected_arrays = BoardArrays.from_board(board)
+            for name in ["terrain", "animal_territory", "structure_shape", "structure_color"]:
+                assert np.array_equal(getattr(board.arrays, name), getattr(expected_arrays, name))
+
+    def test_repeated_sections(self):
+        order = [1, 1, 3, 3, 5, 5]
+        orientation = [False, True, False, True, False, True]
+        assert Board.from_board_sections(order, orientation) == reference_board(order, orientation)
+
+    def test_tiles_not_shared(self):
+        board1 = Board.from_layout(0)
+        board2 = Board.from_layout(0)
+        for hex in BOARD_HEXES:
+            assert board1.tiles[hex] is not board2.tiles[hex]
+
+    def test_arrays_read_only(self):
+        terrain, animal_territory = layout_arrays([1, 2, 3, 4, 5, 6], [False] * 6)
+        board = Board.from_layout_arrays(terrain, animal_territory)
+        arrays = board.arrays
+        assert arrays.structure_shape is not arrays.structure_color
+        for codes in [arrays.terrain, arrays.animal_territory, arrays.structure_shape, arrays.structure_color]:
+            assert not codes.flags.writeable
+        # writable codes are copied, so changing them later doesn't change the board
+        terrain[0] = (terrain[0] + 1) % len(Terrain)
+        assert arrays.terrain[0] != terrain[0]
+        assert Board.from_layout(0).arrays.terrain.base is not None
+
+
+class TestLayoutTable:
+    def test_lazy_rows(self):
+        table = LayoutTable.empty()
+        assert not table.built.any()
+        terrain, animal_territory = table.layout(100)
+        assert table.built.sum() == 1
+        order, orientation = layout_from_index(100)
+        expected_terrain, expected_animal_territory = layout_arrays(order, orientation)
+        assert np.array_equal(terrain, expected_terrain)
+        assert np.array_equal(animal_territory, expected_animal_territory)
+        assert not terrain.flags.writeable
+
+    def test_build_all_and_save(self, tmp_path):
+        table = LayoutTable.empty().build_all()
+        assert table.built.all()
+
+        random.seed(11)
+        for index in random.sample(range(NUM_LAYOUTS), 25):
+            expected_terrain, expected_animal_territory = layout_arrays(*layout_from_index(index))
+            assert np.array_equal(table.terrain[index], expected_terrain)
+            assert np.array_equal(table.animal_territory[index], expected_animal_territory)
+
+        path = tmp_path / "layouts.npz"
+        table.save(path)
+        loaded = LayoutTable.load(path)
+        assert np.array_equal(loaded.terrain, table.terrain)
+        assert np.array_equal(loaded.animal_territory, table.animal_territory)
+        assert loaded.built.all()
+        assert Board.from_layout(12345, loaded) == Board.from_layout(12345)
@@ -1,5 +1,8 @@
-from cryptid.board_sections import BOARD_SECTIONS
+import pytest
+
+from cryptid.board_sections import BOARD_SECTIONS, SECTION_INVERSION
 from cryptid.hex import DoubledHeightCoordinateHex
+from cryptid.hex_transform import HexTransform
 from cryptid.tile import AnimalTerritory, Terrain
 from tests.test_utils import get_random_DoubleHeightCoordinateHex
 
@@ -35,6 +38,15 @@ class TestBoardSections:
         assert tile.terrain == Terrain.DESERT
         assert tile.animal_territory == AnimalTerritory.BEAR
 
+    def test_offset_matches_per_tile_formula(self):
+        for seed in range(5):
+            offset_hex = get_random_DoubleHeightCoordinateHex(10, seed)
+            for board_section in BOARD_SECTIONS:
+                expected = {tile.hex + offset_hex: tile + offset_hex for tile in board_section.tiles.values()}
+                new_tiles = board_section.offset(offset_hex).tiles
+                assert new_tiles == expected
+                assert all(type(hex) is DoubledHeightCoordinateHex for hex in new_tiles)
+
     def test_inversion_1(self):
         for board_section in BOARD_SECTIONS:
             inverted_section = board_section.invert(False)
@@ -60,3 +72,60 @@ class TestBoardSections:
                 assert tile.hex == hex
                 assert inverted_tile.hex == inverted_hex
                 assert hex + inverted_hex == DoubledHeightCoordinateHex(5, 5)
+
+    def test_transform(self):
+        transform = HexTransform.rotation(2, DoubledHeightCoordinateHex(2, 2)).then(HexTransform.reflection("s"))
+        for board_section in BOARD_SECTIONS:
+            transformed = board_section.transform(transform)
+            assert len(transformed.tiles) == 18
+            for tile, new_tile in zip(board_section.tiles.values(), transformed.tiles.values()):
+                assert new_tile.hex == transform.apply(tile.hex)
+                assert type(new_tile.hex) is DoubledHeightCoordinateHex
+                assert new_tile.terrain == tile.terrain
+                assert new_tile.animal_territory == tile.animal_territory
+
+    def test_inversion_matches_per_tile_formula(self):
+        # turning a section over maps doubled height (col, row) to (5 - col, 5 - row)
+        center = DoubledHeightCoordinateHex(5, 5)
+        for board_section in BOARD_SECTIONS:
+            expected = {center - hex: tile.with_hex(center - hex) for hex, tile in board_section.tiles.items()}
+            assert board_section.transform(SECTION_INVERSION).tiles == expected
+
+
+class TestBoardSectionView:
+    def test_matches_materialized_sections(self):
+        offset_hex = DoubledHeightCoordinateHex(3, 5)
+        for board_section in BOARD_SECTIONS:
+            for inverted in [False, True]:
+                expected = board_section.invert(inverted).offset(offset_hex).tiles
+                view = board_section.view(offset_hex, inverted)
+                assert len(view) == 18
+                assert view == expected
+                assert dict(view) == expected
+                assert view.materialize().tiles == expected
+                assert all(type(hex) is DoubledHeightCoordinateHex for hex in view)
+                for hex, tile in expected.items():
+                    assert hex in view
+                    assert hex.to_axial_coordinate_hex() in view
+                    assert view[hex] == tile
+                    base_tile = view.base_tile(hex)
+                    assert base_tile is not None and base_tile in board_section.tiles.values()
+                    assert base_tile.terrain is tile.terrain
+
+    def test_lookups_off_section(self):
+        view = BOARD_SECTIONS[0].view(DoubledHeightCoordinateHex(6, 6), inverted=True)
+        assert DoubledHeightCoordinateHex(0, 0) not in view
+        assert "hex" not in view
+        assert view.base_tile(DoubledHeightCoordinateHex(0, 0)) is None
+        with pytest.raises(KeyError):
+            _ = view[DoubledHeightCoordinateHex(0, 0)]
+
+    def test_moving_views(self):
+        first, second = DoubledHeightCoordinateHex(3, 5), DoubledHeightCoordinateHex(6, 0)
+        for board_section in BOARD_SECTIONS:
+            view = board_section.view(first)
+            assert view.offset_by(second) == board_section.offset(first).offset(second).tiles
+            assert view.invert() == board_section.offset(first).invert().tiles
+            assert view.invert().invert() == view
+            assert view.invert(False) is view
+            assert view.section is board_section
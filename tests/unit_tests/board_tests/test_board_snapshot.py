@@ -0,0 +1,72 @@
+import pytest
+
+from cryptid.board import Board
+from cryptid.board_layouts import BOARD_HEXES, LAYOUTS
+from cryptid.board_snapshot import BoardSnapshot
+from cryptid.hex import DoubledHeightCoordinateHex
+from cryptid.setup_card import SETUP_CARDS
+from cryptid.tile import Color, Shape, Structure
+
+BLUE_STONE = Structure(Shape.STANDING_STONE, Color.BLUE)
+GREEN_SHACK = Structure(Shape.ABANDONED_SHACK, Color.GREEN)
+
+
+class TestBoardSnapshot:
+    def test_matches_board(self):
+        card = SETUP_CARDS[0]
+        board = Board.from_setup_card(card)
+        snapshot = BoardSnapshot.from_board(board)
+        assert snapshot.fingerprint() == board.fingerprint()
+        assert snapshot.fingerprint(canonical=True) == board.fingerprint(canonical=True)
+        assert snapshot.to_board() == board
+        assert snapshot.to_board(dense=True) == board
+        for slot, hex in enumerate(BOARD_HEXES):
+            assert snapshot.tile(slot) == board.tiles[hex]
+            assert snapshot.tile(hex.to_axial_coordinate_hex()) == board.tiles[hex]
+        for clue in card.clues[3]:
+            assert snapshot.to_board().clue_mask(clue).bits == board.clue_mask(clue).bits
+
+    def test_structural_sharing(self):
+        base = BoardSnapshot.from_layout(7)
+        terrain, _ = LAYOUTS.layout(7)
+        assert base.terrain.base is terrain.base or base.terrain is terrain
+
+        first = base.with_structure(BLUE_STONE, BOARD_HEXES[3])
+        second = first.with_structure(GREEN_SHACK, 50)
+        assert second.terrain is base.terrain and second.animal_territory is base.animal_territory
+        assert second.last_placement.previous is first.last_placement
+        assert base.structures() == {}
+        assert first.structures() == {3: BLUE_STONE}
+        assert second.structures() == {3: BLUE_STONE, 50: GREEN_SHACK}
+        assert base.fingerprint() != first.fingerprint() != second.fingerprint()
+
+        # a later placement on the same slot replaces the structure
+        replaced = second.with_structure(GREEN_SHACK, 3)
+        assert replaced.structure_at(3) == GREEN_SHACK
+        assert second.structure_at(BOARD_HEXES[3]) == BLUE_STONE
+
+    def test_isolated_from_boards(self):
+        board = Board.from_layout(3)
+        snapshot = BoardSnapshot.from_board(board)
+        board.place_structure(BLUE_STONE, BOARD_HEXES[0])
+        assert snapshot.structure_at(0) is None
+        assert not snapshot.arrays.terrain.flags.writeable
+
+        derived = snapshot.to_board()
+        derived.place_structure(GREEN_SHACK, BOARD_HEXES[1])
+        assert snapshot.structure_at(1) is None
+        tile = snapshot.tile(2)
+        tile.structure = GREEN_SHACK
+        assert snapshot.structure_at(2) is None
+
+    def test_errors(self):
+        snapshot = BoardSnapshot.from_layout(0)
+        with pytest.raises(KeyError):
+            snapshot.with_structure(BLUE_STONE, DoubledHeightCoordinateHex(-1, 1))
+        with pytest.raises(KeyError):
+            snapshot.with_structure(BLUE_STONE, 108)
+        with pytest.raises(KeyError):
+            snapshot.tile(-1)
+        board = Board(tiles={hex: Board.from_layout(0).tiles[hex] for hex in BOARD_HEXES[:10]})
+        with pytest.raises(ValueError):
+            BoardSnapshot.from_board(board)
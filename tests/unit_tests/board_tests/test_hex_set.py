@@ -0,0 +1,88 @@
+import pytest
+
+from cryptid.board import Board
+from cryptid.hex import DoubledHeightCoordinateHex
+from cryptid.hex_set import HexSet
+from cryptid.setup_card import SETUP_CARDS
+from cryptid.tile import Terrain
+
+
+@pytest.fixture
+def board() -> Board:
+    return Board.from_setup_card(SETUP_CARDS[0])
+
+
+class TestBoardSlots:
+    def test_slots(self, board):
+        assert len(board.slots) == 108
+        assert set(board.slots) == set(board.tiles)
+        assert board.slots[0] == DoubledHeightCoordinateHex(0, 0)
+        assert board.slots[1] == DoubledHeightCoordinateHex(0, 2)
+        assert board.slots[9] == DoubledHeightCoordinateHex(1, 1)
+        assert board.slots[-1] == DoubledHeightCoordinateHex(11, 17)
+
+    def test_slot_index(self, board):
+        assert all(board.slot_index[hex] == index for index, hex in enumerate(board.slots))
+
+
+class TestHexSet:
+    def test_full_and_empty(self, board):
+        full = board.full_hex_set()
+        empty = board.empty_hex_set()
+        assert len(full) == 108
+        assert len(empty) == 0
+        assert not empty
+        assert full
+        assert ~full == empty
+        assert ~empty == full
+        assert list(full) == list(board.slots)
+        assert list(empty) == []
+
+    def test_invalid_bits(self, board):
+        with pytest.raises(ValueError):
+            _ = HexSet(board, -1)
+
+        with pytest.raises(ValueError):
+            _ = HexSet(board, 1 << 108)
+
+    def test_set_algebra(self, board):
+        water = board.hex_set(tile for tile in board.tiles.values() if tile.terrain == Terrain.WATER)
+        desert = board.hex_set(tile for tile in board.tiles.values() if tile.terrain == Terrain.DESERT)
+        assert len(water) == 22
+        assert len(desert) == 21
+        assert len(water | desert) == 43
+        assert len(water & desert) == 0
+        assert (water | desert) - desert == water
+        assert (water ^ desert) == (water | desert)
+        assert len(~water) == 108 - 22
+        assert water.complement() == ~water
+        assert (~water & water) == board.empty_hex_set()
+
+    def test_iteration_and_membership(self, board):
+        locations = [
+            DoubledHeightCoordinateHex(7, 5),
+            DoubledHeightCoordinateHex(1, 1),
+            DoubledHeightCoordinateHex(9, 13),
+        ]
+        hex_set = board.hex_set(locations)
+        assert len(hex_set) == 3
+        assert list(hex_set) == sorted(locations, key=lambda h: board.slot_index[h])
+        assert [tile.hex for tile in hex_set.tiles()] == list(hex_set)
+        assert list(hex_set.slot_indices()) == sorted(board.slot_index[h] for h in locations)
+
+        for location in locations:
+            assert location in hex_set
+            assert board.tiles[location] in hex_set
+        assert DoubledHeightCoordinateHex(0, 0) not in hex_set
+        assert DoubledHeightCoordinateHex(-10, -10) not in hex_set
+        assert "not a hex" not in hex_set
+
+    def test_different_boards(self, board):
+        other_board = Board.from_setup_card(SETUP_CARDS[0])
+        assert board.full_hex_set() != other_board.full_hex_set()
+        with pytest.raises(ValueError):
+            _ = board.full_hex_set() & other_board.full_hex_set()
+
+    def test_hash(self, board):
+        assert hash(board.full_hex_set()) == hash(board.full_hex_set())
+        assert len({board.full_hex_set(), board.full_hex_set(), board.empty_hex_set()}) == 2
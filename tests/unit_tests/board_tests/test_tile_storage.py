@@ -0,0 +1,170 @@
+import random
+
+import pytest
+
+from cryptid.board import Board
+from cryptid.board_layouts import BOARD_HEXES, NUM_LAYOUTS, hex_to_slot, slot_to_hex
+from cryptid.hex import AxialCoordinateHex, DoubledHeightCoordinateHex
+from cryptid.setup_card import SETUP_CARDS
+from cryptid.tile import AnimalTerritory, Color, Shape, Structure, Terrain, Tile
+from cryptid.tile_storage import DenseTiles, TileStore, TileView
+
+
+class TestHexToSlot:
+    def test_round_trip(self):
+        for slot, hex in enumerate(BOARD_HEXES):
+            assert hex_to_slot(hex) == slot
+            assert slot_to_hex(slot) == hex
+
+    def test_other_hex_types(self):
+        for slot, hex in enumerate(BOARD_HEXES):
+            axial = hex.to_axial_coordinate_hex()
+            assert hex_to_slot(axial) == slot
+            assert hex_to_slot(axial.to_cube_coordinate_hex()) == slot
+            assert hex_to_slot(axial.to_double_width_coordinate_hex()) == slot
+
+    def test_off_board(self):
+        assert hex_to_slot(DoubledHeightCoordinateHex(-1, 1)) is None
+        assert hex_to_slot(DoubledHeightCoordinateHex(0, 18)) is None
+        assert hex_to_slot(DoubledHeightCoordinateHex(12, 0)) is None
+        assert hex_to_slot(AxialCoordinateHex(0, -1)) is None
+
+
+class TestDenseTiles:
+    def test_mapping(self):
+        tiles = DenseTiles()
+        assert len(tiles) == 0
+        hex = BOARD_HEXES[10]
+        tile = Tile(hex=hex, terrain=Terrain.FOREST)
+        tiles[hex] = tile
+        assert len(tiles) == 1
+        assert tiles[hex] is tile
+        assert tiles[hex.to_axial_coordinate_hex()] is tile
+        assert hex in tiles
+        assert BOARD_HEXES[11] not in tiles
+        assert "hex" not in tiles
+        assert list(tiles) == [hex]
+        assert tiles.tile_at(10) is tile
+
+        del tiles[hex]
+        assert len(tiles) == 0
+        with pytest.raises(KeyError):
+            _ = tiles[hex]
+        with pytest.raises(KeyError):
+            del tiles[hex]
+        with pytest.raises(KeyError):
+            tiles[DoubledHeightCoordinateHex(-1, 1)] = tile
+        with pytest.raises(ValueError):
+            tiles[BOARD_HEXES[11]] = tile
+        assert BOARD_HEXES[11] not in tiles
+
+    def test_from_slots(self):
+        with pytest.raises(ValueError):
+            _ = DenseTiles.from_slots([None] * 3)
+
+    def test_dense_board_matches_dict_board(self):
+        random.seed(8)
+        for index in random.sample(range(NUM_LAYOUTS), 10):
+            dense = Board.from_layout(index, dense=True)
+            board = Board.from_layout(index)
+            assert isinstance(dense.tiles, DenseTiles)
+            assert dense == board
+            assert dense.tiles == board.tiles
+            assert list(dense.tiles) == list(BOARD_HEXES)
+
+    def test_dense_board_clues(self):
+        card = SETUP_CARDS[0]
+        board = Board.from_board_sections(card.board_sections, card.board_sections_inverted, dense=True)
+        for location, structure in card.structures:
+            board.place_structure(structure, location)
+        expected = Board.from_setup_card(card)
+        for clue in card.clues[3]:
+            assert board.clue_mask(clue).bits == expected.clue_mask(clue).bits
+            assert board.clue_mask(clue).bits == clue.resolve_mask(board) ^ (board.full_mask if clue.neg else 0)
+
+    def test_slot_of(self):
+        board = Board.from_layout(0, dense=True)
+        for slot, hex in enumerate(BOARD_HEXES):
+            assert board.slot_of(hex.to_axial_coordinate_hex()) == slot
+            assert hex.to_cube_coordinate_hex() in board.full_hex_set()
+        assert board.slot_of(DoubledHeightCoordinateHex(-1, 1)) is None
+
+
+class TestTileStore:
+    def test_mapping(self):
+        tiles = TileStore()
+        assert len(tiles) == 0
+        hex = BOARD_HEXES[10]
+        tile = Tile(hex=hex, terrain=Terrain.FOREST, animal_territory=AnimalTerritory.BEAR)
+        tiles[hex] = tile
+        assert len(tiles) == 1
+        assert isinstance(tiles[hex], TileView)
+        assert tiles[hex] == tile
+        assert tile == tiles[hex.to_axial_coordinate_hex()]
+        assert hex in tiles
+        assert BOARD_HEXES[11] not in tiles
+        assert "hex" not in tiles
+        assert list(tiles) == [hex]
+        assert tiles.tile_at(10) == tile
+        assert tiles.tile_at(11) is None
+
+        del tiles[hex]
+        assert len(tiles) == 0
+        with pytest.raises(KeyError):
+            _ = tiles[hex]
+        with pytest.raises(KeyError):
+            del tiles[hex]
+        with pytest.raises(KeyError):
+            tiles[DoubledHeightCoordinateHex(-1, 1)] = tile
+        with pytest.raises(ValueError):
+            tiles[BOARD_HEXES[11]] = tile
+        assert BOARD_HEXES[11] not in tiles
+
+    def test_view_writes_through(self):
+        tiles = TileStore([Tile(hex=BOARD_HEXES[3], terrain=Terrain.WATER)])
+        view = tiles[BOARD_HEXES[3]]
+        structure = Structure(Shape.ABANDONED_SHACK, Color.BLUE)
+        view.structure = structure
+        view.animal_territory = AnimalTerritory.COUGAR
+        view.terrain = Terrain.SWAMP
+        assert tiles[BOARD_HEXES[3]] == Tile(BOARD_HEXES[3], Terrain.SWAMP, AnimalTerritory.COUGAR, structure)
+        view.structure = None
+        assert tiles[BOARD_HEXES[3]].structure is None
+        with pytest.raises(AttributeError):
+            view.hex = BOARD_HEXES[4]
+
+        copy = view.with_hex(view.hex)
+        assert type(copy) is Tile and copy == view
+        copy.terrain = Terrain.DESERT
+        assert view.terrain is Terrain.SWAMP
+
+    def test_compact_board_matches_dict_board(self):
+        random.seed(9)
+        for index in random.sample(range(NUM_LAYOUTS), 10):
+            compact = Board.from_layout(index, compact=True)
+            board = Board.from_layout(index)
+            assert isinstance(compact.tiles, TileStore)
+            assert compact.tiles == board.tiles
+            assert list(compact.tiles) == list(BOARD_HEXES)
+            assert compact.fingerprint() == board.fingerprint()
+
+    def test_compact_board_builds_no_tiles(self, monkeypatch):
+        def no_tiles(*_, **__):
+            raise AssertionError("Tile built")
+
+        monkeypatch.setattr(Tile, "__init__", no_tiles)
+        board = Board.from_board_sections([3, 1, 2, 6, 4, 5], [True, False, True, False, False, True], compact=True)
+        assert len(board.tiles) == len(BOARD_HEXES)
+        with pytest.raises(AssertionError):
+            Board.from_layout(0)
+
+    def test_compact_board_clues(self):
+        card = SETUP_CARDS[0]
+        board = Board.from_board_sections(card.board_sections, card.board_sections_inverted, compact=True)
+        for location, structure in card.structures:
+            board.place_structure(structure, location)
+        expected = Board.from_setup_card(card)
+        assert board.fingerprint() == expected.fingerprint()
+        for clue in card.clues[3]:
+            assert board.clue_mask(clue).bits == expected.clue_mask(clue).bits
+            assert board.clue_mask(clue).bits == clue.resolve_mask(board) ^ (board.full_mask if clue.neg else 0)
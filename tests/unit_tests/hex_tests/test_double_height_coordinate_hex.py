@@ -65,6 +65,16 @@ class TestDoubledHeightCoordinateHex:
         r = q + 2 * random.randint(-10, 11)
         assert DoubledHeightCoordinateHex.from_2d_coordinates(q, r) == DoubledHeightCoordinateHex(q, r)
 
+    def test_compact_2d_coordinates(self):
+        assert DoubledHeightCoordinateHex.origin().to_compact_2d_coordinates() == (0, 0)
+        assert DoubledHeightCoordinateHex(3, 5).to_compact_2d_coordinates() == (3, 2)
+        assert DoubledHeightCoordinateHex.from_compact_2d_coordinates(3, 2) == DoubledHeightCoordinateHex(3, 5)
+
+        for seed in range(20):
+            random_hex = get_random_DoubleHeightCoordinateHex(radius=20, random_seed=seed)
+            compact = random_hex.to_compact_2d_coordinates()
+            assert DoubledHeightCoordinateHex.from_compact_2d_coordinates(*compact) == random_hex
+
     def test_axial_conversion(self):
         assert DoubledHeightCoordinateHex.origin().to_axial_coordinate_hex() == AxialCoordinateHex.origin()
         assert (
@@ -65,6 +65,16 @@ class TestDoubledWidthCoordinateHex:
         r = q + 2 * random.randint(-10, 11)
         assert DoubledWidthCoordinateHex.from_2d_coordinates(q, r) == DoubledWidthCoordinateHex(q, r)
 
+    def test_compact_2d_coordinates(self):
+        assert DoubledWidthCoordinateHex.origin().to_compact_2d_coordinates() == (0, 0)
+        assert DoubledWidthCoordinateHex(5, 3).to_compact_2d_coordinates() == (2, 3)
+        assert DoubledWidthCoordinateHex.from_compact_2d_coordinates(2, 3) == DoubledWidthCoordinateHex(5, 3)
+
+        for seed in range(20):
+            random_hex = get_random_DoubleWidthCoordinateHex(radius=20, random_seed=seed)
+            compact = random_hex.to_compact_2d_coordinates()
+            assert DoubledWidthCoordinateHex.from_compact_2d_coordinates(*compact) == random_hex
+
     def test_axial_conversion(self):
         assert DoubledWidthCoordinateHex.origin().to_axial_coordinate_hex() == AxialCoordinateHex.origin()
         assert (
@@ -193,32 +193,31 @@ class TestEvenRowOffsetCoordinateHex:
         assert h == h2
         assert id(h) != id(h2)
 
-    # def test_neighbors(self):
-    #     origin_neighbors = self.origin.neighbors
-    #     assert len(origin_neighbors) == 6
-    #     assert set(origin_neighbors) == set(self.origin.neighbor_directions)
-    #
-    #     center = EvenRowOffsetCoordinateHex(3, 0)
-    #     assert center.neighbors == [
-    #         EvenRowOffsetCoordinateHex(4, 0),
-    #         EvenRowOffsetCoordinateHex(4, -1),
-    #         EvenRowOffsetCoordinateHex(3, -1),
-    #         EvenRowOffsetCoordinateHex(2, 0),
-    #         EvenRowOffsetCoordinateHex(3, 1),
-    #         EvenRowOffsetCoordinateHex(4, 1),
-    #     ]
-    #
-    #     center = EvenRowOffsetCoordinateHex(2, 3)
-    #     print(center.neighbors)
-    #     assert center.neighbors == [
-    #         EvenRowOffsetCoordinateHex(3, 3),
-    #         EvenRowOffsetCoordinateHex(2, 2),
-    #         EvenRowOffsetCoordinateHex(1, 2),
-    #         EvenRowOffsetCoordinateHex(1, 3),
-    #         EvenRowOffsetCoordinateHex(1, 4),
-    #         EvenRowOffsetCoordinateHex(2, 4),
-    #     ]
-    #
+    def test_neighbors(self):
+        origin_neighbors = self.origin.neighbors
+        assert len(origin_neighbors) == 6
+        assert set(origin_neighbors) == set(self.origin.neighbor_directions)
+
+        center = EvenRowOffsetCoordinateHex(3, 0)
+        assert center.neighbors == [
+            EvenRowOffsetCoordinateHex(4, 0),
+            EvenRowOffsetCoordinateHex(4, -1),
+            EvenRowOffsetCoordinateHex(3, -1),
+            EvenRowOffsetCoordinateHex(2, 0),
+            EvenRowOffsetCoordinateHex(3, 1),
+            EvenRowOffsetCoordinateHex(4, 1),
+        ]
+
+        center = EvenRowOffsetCoordinateHex(2, 3)
+        assert center.neighbors == [
+            EvenRowOffsetCoordinateHex(3, 3),
+            EvenRowOffsetCoordinateHex(2, 2),
+            EvenRowOffsetCoordinateHex(1, 2),
+            EvenRowOffsetCoordinateHex(1, 3),
+            EvenRowOffsetCoordinateHex(1, 4),
+            EvenRowOffsetCoordinateHex(2, 4),
+        ]
+
     # def test_reflection(self):
     #     assert EvenRowOffsetCoordinateHex(4, 8).reflect_over_hex(
     #         EvenRowOffsetCoordinateHex(3, 5)
@@ -226,12 +225,12 @@ class TestEvenRowOffsetCoordinateHex:
     #     assert EvenRowOffsetCoordinateHex(3, 3).reflect_over_hex() == EvenRowOffsetCoordinateHex(-3, -3)
     #     h = EvenRowOffsetCoordinateHex(1, 3)
     #     assert h.reflect_over_hex() == -h
-    #
-    # def test_distance(self):
-    #     h = get_random_EvenRowOffsetCoordinateHex(radius=20, random_seed=13)
-    #     assert all(h.distance(other) == 1 for other in h.neighbors)
-    #     assert h.distance(h) == 0
-    #     assert EvenRowOffsetCoordinateHex(2, 0).distance(EvenRowOffsetCoordinateHex(3, 5)) == 5
+
+    def test_distance(self):
+        h = get_random_EvenRowOffsetCoordinateHex(radius=20, random_seed=13)
+        assert all(h.distance(other) == 1 for other in h.neighbors)
+        assert h.distance(h) == 0
+        assert EvenRowOffsetCoordinateHex(2, 0).distance(EvenRowOffsetCoordinateHex(3, 5)) == 5
 
     def test_range(self):
         center = get_random_EvenRowOffsetCoordinateHex(radius=20, random_seed=11)
@@ -0,0 +1,91 @@
+import numpy as np
+import pytest
+
+from cryptid.board_layouts import BOARD_HEXES
+from cryptid.hex import (
+    AxialCoordinateHex,
+    CubeCoordinateHex,
+    DoubledHeightCoordinateHex,
+    DoubledWidthCoordinateHex,
+    EvenColumnOffsetCoordinateHex,
+    EvenRowOffsetCoordinateHex,
+    OddColumnOffsetCoordinateHex,
+    OddRowOffsetCoordinateHex,
+)
+from cryptid.hex_array import HexArray, distance_matrix
+
+HEX_TYPES = [
+    AxialCoordinateHex,
+    CubeCoordinateHex,
+    DoubledHeightCoordinateHex,
+    DoubledWidthCoordinateHex,
+    OddRowOffsetCoordinateHex,
+    EvenRowOffsetCoordinateHex,
+    OddColumnOffsetCoordinateHex,
+    EvenColumnOffsetCoordinateHex,
+]
+
+# every parity of q and r, including negatives
+AXIALS = [AxialCoordinateHex(q, r) for q in range(-5, 6) for r in range(-5, 6)]
+
+
+class TestHexArray:
+    @pytest.mark.parametrize("source_type", HEX_TYPES)
+    def test_conversions_match_scalar(self, source_type):
+        hexes = [source_type.from_axial_coordinate_hex(axial) for axial in AXIALS]
+        array = HexArray.from_hexes(hexes)
+        assert len(array) == len(hexes)
+        for target_type in HEX_TYPES:
+            converted = array.convert(target_type)
+            assert converted.hex_type is target_type
+            expected = [target_type.from_axial_coordinate_hex(hex.to_axial_coordinate_hex()) for hex in hexes]
+            assert [(hex.q, hex.r) for hex in converted.to_hexes()] == [(hex.q, hex.r) for hex in expected]
+            assert all(type(hex) is target_type for hex in converted)
+
+    def test_round_trip(self):
+        array = HexArray.from_hexes(BOARD_HEXES)
+        assert array.to_hexes() == list(BOARD_HEXES)
+        for hex_type in HEX_TYPES:
+            assert array.convert(hex_type).convert(DoubledHeightCoordinateHex).to_hexes() == list(BOARD_HEXES)
+        assert array[5] == BOARD_HEXES[5]
+
+    def test_keys(self):
+        array = HexArray.from_hexes([OddRowOffsetCoordinateHex.from_axial_coordinate_hex(axial) for axial in AXIALS])
+        assert array.keys().tolist() == [axial.key for axial in AXIALS]
+        assert HexArray.from_keys(array.keys(), OddRowOffsetCoordinateHex).to_hexes() == array.to_hexes()
+
+    def test_cube_s(self):
+        cubes = HexArray.from_hexes(AXIALS).convert(CubeCoordinateHex)
+        assert cubes.s.tolist() == [axial.to_cube_coordinate_hex().s for axial in AXIALS]
+        assert all(hex.s == -(hex.q + hex.r) for hex in cubes.to_hexes())
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            _ = HexArray.from_coordinates(DoubledHeightCoordinateHex, [0, 1], [0, 0])
+        with pytest.raises(ValueError):
+            _ = HexArray.from_coordinates(AxialCoordinateHex, [0, 1], [0])
+        with pytest.raises(TypeError):
+            _ = HexArray.from_hexes([AxialCoordinateHex(0, 0), CubeCoordinateHex(0, 0, 0)])
+        with pytest.raises(ValueError):
+            _ = HexArray.from_hexes([])
+        assert len(HexArray.from_hexes([], AxialCoordinateHex)) == 0
+        assert np.array_equal(HexArray.from_hexes([], AxialCoordinateHex).keys(), [])
+
+    @pytest.mark.parametrize("hex_type", HEX_TYPES)
+    def test_distances(self, hex_type):
+        hexes = [hex_type.from_axial_coordinate_hex(axial) for axial in AXIALS]
+        others = hexes[::7]
+        matrix = distance_matrix(hexes, others)
+        assert matrix.shape == (len(hexes), len(others))
+        assert matrix.tolist() == [[hex.distance(other) for other in others] for hex in hexes]
+
+        condensed = HexArray.from_hexes(others).condensed_distances()
+        assert condensed.tolist() == [
+            others[i].distance(others[j]) for i in range(len(others)) for j in range(i + 1, len(others))
+        ]
+
+    def test_distances_mixed_types(self):
+        double_height = HexArray.from_hexes(BOARD_HEXES)
+        double_width = double_height.convert(DoubledWidthCoordinateHex)
+        assert np.array_equal(double_height.distances(double_width), double_height.distances())
+        assert np.array_equal(double_width.distances(), double_height.distances())
@@ -1,14 +1,25 @@
-from dataclasses import fields
+import pickle
+from dataclasses import FrozenInstanceError, fields
+
+import pytest
 
 from cryptid.hex import (
+    HEX_POOL,
+    INTERN_LIMIT,
+    KEY_SHIFT,
     AxialCoordinateHex,
     CubeCoordinateHex,
     DoubledHeightCoordinateHex,
     DoubledWidthCoordinateHex,
     EvenColumnOffsetCoordinateHex,
     EvenRowOffsetCoordinateHex,
+    HexPool,
     OddColumnOffsetCoordinateHex,
     OddRowOffsetCoordinateHex,
+    full_validation_enabled,
+    pack_key,
+    set_full_validation,
+    unpack_key,
 )
 
 
@@ -145,3 +156,167 @@ class TestHexConversions:
         assert AxialCoordinateHex(0, 0) != EvenRowOffsetCoordinateHex(2, 2)
         assert AxialCoordinateHex(0, 0) != OddColumnOffsetCoordinateHex(1, 2)
         assert AxialCoordinateHex(0, 0) != EvenColumnOffsetCoordinateHex(1, 3)
+
+    def test_hexes_within_range_all_types(self):
+        center = AxialCoordinateHex(3, -2)
+        for radius in range(4):
+            expected = [
+                (center + AxialCoordinateHex(q, r)).to_2d_coordinates()
+                for q in range(-radius, radius + 1)
+                for r in range(max(-radius, -radius - q), min(radius, radius - q) + 1)
+            ]
+            for hex_type in [
+                AxialCoordinateHex,
+                CubeCoordinateHex,
+                DoubledHeightCoordinateHex,
+                DoubledWidthCoordinateHex,
+                OddRowOffsetCoordinateHex,
+                EvenRowOffsetCoordinateHex,
+                OddColumnOffsetCoordinateHex,
+                EvenColumnOffsetCoordinateHex,
+            ]:
+                hexes = hex_type.from_axial_coordinate_hex(center).hexes_within_range(radius)
+                assert all(type(h) is hex_type for h in hexes)
+                assert [h.to_axial_coordinate_hex().to_2d_coordinates() for h in hexes] == expected
+
+    def test_keys(self):
+        hex_types = [
+            AxialCoordinateHex,
+            CubeCoordinateHex,
+            DoubledHeightCoordinateHex,
+            DoubledWidthCoordinateHex,
+            OddRowOffsetCoordinateHex,
+            EvenRowOffsetCoordinateHex,
+            OddColumnOffsetCoordinateHex,
+            EvenColumnOffsetCoordinateHex,
+        ]
+        for q, r in [(0, 0), (1, 2), (5, -1), (-7, -3), (-1, 1 << (KEY_SHIFT - 2)), (3, -(1 << (KEY_SHIFT - 1)))]:
+            key = pack_key(q, r)
+            assert unpack_key(key) == (q, r)
+            axial = AxialCoordinateHex(q, r)
+            for hex_type in hex_types:
+                other = hex_type.from_axial_coordinate_hex(axial)
+                assert other.key == key
+                assert hash(other) == hash(axial)
+                assert hex_type.from_key(key) == other
+                assert type(hex_type.from_key(key)) is hex_type
+
+        # keys sort the same way as axial (q, r)
+        axials = [AxialCoordinateHex(q, r) for q in range(-3, 4) for r in range(-3, 4)]
+        assert sorted(axials, key=lambda h: h.key) == sorted(axials, key=lambda h: h.to_2d_coordinates())
+
+    def test_mixed_hex_types_as_dict_keys(self):
+        locations = {AxialCoordinateHex(1, 2): "a", DoubledHeightCoordinateHex(5, 3): "b"}
+        assert locations[CubeCoordinateHex(1, 2, -3)] == "a"
+        assert locations[OddRowOffsetCoordinateHex(2, 2)] == "a"
+        assert locations[AxialCoordinateHex(5, -1)] == "b"
+        assert locations[EvenColumnOffsetCoordinateHex(5, 2)] == "b"
+
+    def test_slots(self):
+        for hex in [AxialCoordinateHex(1, 2), CubeCoordinateHex(1, 2, -3), DoubledHeightCoordinateHex(1, 5)]:
+            assert not hasattr(hex, "__dict__")
+            with pytest.raises(FrozenInstanceError):
+                hex.q = 3
+            _ = hex.key
+            copied = pickle.loads(pickle.dumps(hex))
+            assert copied == hex
+            assert type(copied) is type(hex)
+
+    def test_intern_pool(self):
+        pool = HexPool()
+        first = DoubledHeightCoordinateHex(1, 5)
+        assert pool.intern(first) is first
+        assert pool.intern(DoubledHeightCoordinateHex(1, 5)) is first
+        # pooled per type of hex
+        axial = AxialCoordinateHex(1, 2)
+        assert pool.intern(axial) is axial
+        assert len(pool) == 2
+
+        far = AxialCoordinateHex(INTERN_LIMIT + 1, 0)
+        assert pool.intern(far) is far
+        assert pool.intern(AxialCoordinateHex(INTERN_LIMIT + 1, 0)) is not far
+        assert len(pool) == 2
+
+        pool.clear()
+        assert len(pool) == 0
+
+        assert DoubledWidthCoordinateHex(4, 2).interned() is HEX_POOL.intern(DoubledWidthCoordinateHex(4, 2))
+
+    def test_neighbors_all_types(self):
+        for center in [AxialCoordinateHex(3, -2), AxialCoordinateHex(0, 0), AxialCoordinateHex(-4, 5)]:
+            expected = [(center + direction).to_2d_coordinates() for direction in center.neighbor_directions]
+            for hex_type in self.hex_types():
+                neighbors = hex_type.from_axial_coordinate_hex(center).neighbors
+                assert [neighbor.to_axial_coordinate_hex().to_2d_coordinates() for neighbor in neighbors] == expected
+
+    def test_ring_and_spiral_all_types(self):
+        for hex_type in self.hex_types():
+            for center in [
+                hex_type.from_axial_coordinate_hex(AxialCoordinateHex(q, r)) for q, r in [(0, 0), (3, -2), (-1, 4)]
+            ]:
+                assert list(center.ring(0)) == [center]
+                for radius in range(1, 5):
+                    ring = list(center.ring(radius))
+                    assert len(ring) == 6 * radius
+                    assert len(set(ring)) == 6 * radius
+                    assert all(type(hex) is hex_type for hex in ring)
+                    assert all(center.distance(hex) == radius for hex in ring)
+                    # consecutive hexes on the ring are adjacent
+                    assert all(ring[i].distance(ring[i - 1]) == 1 for i in range(len(ring)))
+
+                spiral = list(center.spiral(3))
+                assert set(spiral) == set(center.hexes_within_range(3))
+                assert len(spiral) == len(set(spiral))
+                distances = [center.distance(hex) for hex in spiral]
+                assert distances == sorted(distances)
+
+    def test_unchecked_construction(self):
+        def build(hex_type):
+            center = hex_type.from_axial_coordinate_hex(AxialCoordinateHex(2, -3))
+            return [
+                center,
+                center + center,
+                center - center.neighbor(1),
+                3 * center,
+                *center.neighbors,
+                *center.hexes_within_range(2),
+            ]
+
+        for hex_type in self.hex_types():
+            assert not full_validation_enabled()
+            unchecked = build(hex_type)
+            assert set_full_validation(True) is False
+            try:
+                validated = build(hex_type)
+            finally:
+                assert set_full_validation(False) is True
+            assert [hex.to_2d_coordinates() for hex in unchecked] == [hex.to_2d_coordinates() for hex in validated]
+            assert all(type(hex) is hex_type for hex in unchecked)
+            assert [hex.key for hex in unchecked] == [hex.key for hex in validated]
+            assert pickle.loads(pickle.dumps(unchecked)) == validated
+
+        cube = AxialCoordinateHex(2, -3).to_cube_coordinate_hex()
+        assert cube.s == 1
+        assert (cube + cube).s == 2
+        assert DoubledHeightCoordinateHex.from_compact_2d_coordinates(3, 2) == DoubledHeightCoordinateHex(3, 5)
+
+        # the public constructors still validate
+        with pytest.raises(AssertionError):
+            DoubledHeightCoordinateHex(1, 2)
+        with pytest.raises(AssertionError):
+            DoubledWidthCoordinateHex.from_row_col(row=1, col=2)
+        with pytest.raises(AssertionError):
+            CubeCoordinateHex(1, 1, 1)
+
+    @staticmethod
+    def hex_types() -> list[type]:
+        return [
+            AxialCoordinateHex,
+            CubeCoordinateHex,
+            DoubledHeightCoordinateHex,
+            DoubledWidthCoordinateHex,
+            OddRowOffsetCoordinateHex,
+            EvenRowOffsetCoordinateHex,
+            OddColumnOffsetCoordinateHex,
+            EvenColumnOffsetCoordinateHex,
+        ]
@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+
+from cryptid.board_layouts import BOARD_HEXES
+from cryptid.hex import AxialCoordinateHex, DoubledHeightCoordinateHex, OddRowOffsetCoordinateHex
+from cryptid.hex_array import HexArray
+from cryptid.hex_transform import DIHEDRAL_GROUP, HexTransform
+
+AXIALS = [AxialCoordinateHex(q, r) for q in range(-4, 5) for r in range(-4, 5)]
+
+
+class TestHexTransform:
+    def test_dihedral_group(self):
+        assert len(set(DIHEDRAL_GROUP)) == 12
+        assert sum(transform.is_reflection for transform in DIHEDRAL_GROUP) == 6
+        # closed under composition
+        for first in DIHEDRAL_GROUP:
+            for second in DIHEDRAL_GROUP:
+                assert first @ second in DIHEDRAL_GROUP
+        assert HexTransform.rotation(6) == HexTransform.identity()
+        assert HexTransform.rotation(-1) == HexTransform.rotation(5)
+
+    def test_rotation_preserves_distance(self):
+        center = AxialCoordinateHex(2, -1)
+        rotation = HexTransform.rotation(1, center)
+        assert rotation.apply(center) == center
+        for hex in AXIALS:
+            assert center.distance(rotation.apply(hex)) == center.distance(hex)
+        # one step moves each neighbor to the previous one in neighbor_directions order
+        for direction in range(6):
+            assert rotation.apply(center.neighbor(direction)) == center.neighbor(direction - 1)
+
+    def test_reflections_match_scalar(self):
+        for hex in AXIALS:
+            assert HexTransform.reflection("q").apply(hex) == hex.reflect_over_q_axis()
+            assert HexTransform.reflection("r").apply(hex) == hex.reflect_over_r_axis()
+            assert HexTransform.reflection("s").apply(hex) == hex.reflect_over_s_axis()
+            assert HexTransform.rotation(3).apply(hex) == hex.reflect_over_hex()
+            assert HexTransform.rotation(3, AxialCoordinateHex(1, 2)).apply(hex) == hex.reflect_over_hex(
+                AxialCoordinateHex(1, 2)
+            )
+        with pytest.raises(ValueError):
+            _ = HexTransform.reflection("x")
+
+    def test_composition(self):
+        first = HexTransform.reflection("s", AxialCoordinateHex(1, 0))
+        second = HexTransform.rotation(2).then(HexTransform.translation(AxialCoordinateHex(3, -5)))
+        composed = first.then(second)
+        for hex in AXIALS:
+            assert composed.apply(hex) == second.apply(first.apply(hex))
+        homogeneous = composed.array
+        assert np.array_equal(homogeneous, second.array @ first.array)
+        assert homogeneous[2].tolist() == [0, 0, 1]
+
+    def test_apply_array(self):
+        transform = HexTransform.rotation(1, AxialCoordinateHex(3, 3)).then(HexTransform.reflection("r"))
+        for hexes in [list(BOARD_HEXES), [OddRowOffsetCoordinateHex.from_axial_coordinate_hex(h) for h in AXIALS]]:
+            transformed = transform.apply_array(HexArray.from_hexes(hexes)).to_hexes()
+            assert transformed == [transform.apply(hex) for hex in hexes]
+            assert all(type(new) is type(old) for new, old in zip(transformed, hexes))
+
+    def test_apply_keeps_type(self):
+        hex = DoubledHeightCoordinateHex(3, 5)
+        assert type(HexTransform.rotation(2).apply(hex)) is DoubledHeightCoordinateHex
@@ -0,0 +1,102 @@
+import math
+import random
+
+import numpy as np
+import pytest
+
+from cryptid.board_layouts import BOARD_HEXES
+from cryptid.hex import (
+    AxialCoordinateHex,
+    CubeCoordinateHex,
+    DoubledHeightCoordinateHex,
+    DoubledWidthCoordinateHex,
+    EvenColumnOffsetCoordinateHex,
+    EvenRowOffsetCoordinateHex,
+    OddColumnOffsetCoordinateHex,
+    OddRowOffsetCoordinateHex,
+)
+from cryptid.hex_array import HexArray
+from cryptid.layout import FLAT, POINTY, Layout, cube_round, cube_round_arrays
+
+HEX_TYPES = [
+    AxialCoordinateHex,
+    CubeCoordinateHex,
+    DoubledHeightCoordinateHex,
+    DoubledWidthCoordinateHex,
+    OddRowOffsetCoordinateHex,
+    EvenRowOffsetCoordinateHex,
+    OddColumnOffsetCoordinateHex,
+    EvenColumnOffsetCoordinateHex,
+]
+
+AXIALS = [AxialCoordinateHex(q, r) for q in range(-5, 6) for r in range(-5, 6)]
+
+LAYOUTS = [
+    Layout(POINTY),
+    Layout(FLAT),
+    Layout(POINTY, size=(2.5, -2.5), origin=(10.0, -3.0)),
+    Layout(FLAT, size=(30.0, 20.0), origin=(-7.0, 4.5)),
+]
+
+
+class TestLayout:
+    def test_matches_drawing_conventions(self):
+        pointy = Layout(POINTY, size=(2, -2))
+        flat = Layout(FLAT, size=(2, -2))
+        for axial in AXIALS:
+            x, y = pointy.hex_to_pixel(axial)
+            assert x == pytest.approx(2 * (math.sqrt(3) * axial.q + math.sqrt(3) / 2 * axial.r))
+            assert y == pytest.approx(-1.5 * 2 * axial.r)
+            x, y = flat.hex_to_pixel(axial)
+            assert x == pytest.approx(1.5 * 2 * axial.q)
+            assert y == pytest.approx(-2 * (math.sqrt(3) * axial.r + math.sqrt(3) / 2 * axial.q))
+
+    @pytest.mark.parametrize("layout", LAYOUTS)
+    @pytest.mark.parametrize("hex_type", HEX_TYPES)
+    def test_round_trip(self, layout, hex_type):
+        hexes = [hex_type.from_axial_coordinate_hex(axial) for axial in AXIALS]
+        array = HexArray.from_hexes(hexes)
+        xs, ys = layout.hexes_to_pixels(array)
+        for hex, x, y in zip(hexes, xs, ys):
+            assert layout.hex_to_pixel(hex) == pytest.approx((x, y))
+            assert layout.pixel_to_hex(x, y, hex_type) == hex
+        assert layout.pixels_to_hexes(xs, ys, hex_type).to_hexes() == hexes
+
+    @pytest.mark.parametrize("layout", LAYOUTS)
+    def test_points_inside_hex(self, layout):
+        random.seed(17)
+        # the inscribed circle of a unit hex has radius sqrt(3) / 2
+        inner = math.sqrt(3) / 2 * 0.99
+        hexes, xs, ys = [], [], []
+        for axial in AXIALS:
+            cx, cy = layout.hex_to_pixel(axial)
+            for _ in range(5):
+                angle, radius = random.uniform(0, 2 * math.pi), random.uniform(0, inner)
+                hexes.append(axial)
+                xs.append(cx + radius * math.cos(angle) * abs(layout.size[0]))
+                ys.append(cy + radius * math.sin(angle) * abs(layout.size[1]))
+        assert [layout.pixel_to_hex(x, y) for x, y in zip(xs, ys)] == hexes
+        assert layout.pixels_to_hexes(xs, ys).to_hexes() == hexes
+
+    def test_cube_round(self):
+        random.seed(3)
+        q = np.array([random.uniform(-20, 20) for _ in range(1000)])
+        r = np.array([random.uniform(-20, 20) for _ in range(1000)])
+        rq, rr = cube_round_arrays(q, r)
+        assert [cube_round(a, b) for a, b in zip(q.tolist(), r.tolist())] == list(zip(rq.tolist(), rr.tolist()))
+        # the rounded hex is never further than the hexes around it
+        for a, b, hq, hr in zip(q.tolist(), r.tolist(), rq.tolist(), rr.tolist()):
+            best = min(
+                (max(abs(a - nq), abs(b - nr), abs(a + b - nq - nr)), (nq, nr))
+                for nq in range(hq - 1, hq + 2)
+                for nr in range(hr - 1, hr + 2)
+            )
+            assert max(abs(a - hq), abs(b - hr), abs(a + b - hq - hr)) <= best[0] + 1e-9
+
+    def test_pixels_to_slots(self):
+        layout = Layout(POINTY, size=(3, 3), origin=(1, 2))
+        xs, ys = layout.hexes_to_pixels(HexArray.from_hexes(BOARD_HEXES))
+        assert layout.pixels_to_slots(xs, ys).tolist() == list(range(len(BOARD_HEXES)))
+        off_board = [DoubledHeightCoordinateHex(-1, 1), DoubledHeightCoordinateHex(0, 18), AxialCoordinateHex(12, 0)]
+        xs, ys = layout.hexes_to_pixels(HexArray.from_hexes([hex.to_axial_coordinate_hex() for hex in off_board]))
+        assert layout.pixels_to_slots(xs, ys).tolist() == [-1, -1, -1]
@@ -0,0 +1,180 @@
+import random
+
+import numpy as np
+import pytest
+
+from cryptid import clue_engine
+from cryptid.board import Board
+from cryptid.clue import (
+    BLUE_CLUES,
+    BROWN_CLUES,
+    GREEN_CLUES,
+    PURPLE_CLUES,
+    RED_CLUES,
+    Clue,
+)
+from cryptid.setup_card import SETUP_CARDS
+from cryptid.tile import AnimalTerritory, Color, Shape, Structure, Terrain
+
+
+def random_board(seed: int) -> Board:
+    random.seed(seed)
+    order = [1, 2, 3, 4, 5, 6]
+    random.shuffle(order)
+    board = Board.from_board_sections(order, [random.random() < 0.5 for _ in range(6)])
+    locations = random.sample(board.slots, 8)
+    for location, shape, color in zip(locations, [*Shape] * 4, [color for color in Color for _ in range(2)]):
+        board.place_structure(Structure(shape, color), location)
+    return board
+
+
+@pytest.fixture(params=[0, 1, 2, 3])
+def board(request) -> Board:
+    if request.param == 0:
+        return Board.from_setup_card(SETUP_CARDS[0])
+    return random_board(request.param)
+
+
+class TestBoardArrays:
+    def test_from_board(self, board):
+        arrays = board.arrays
+        assert arrays is board.arrays
+        for index, hex in enumerate(board.slots):
+            tile = board.tiles[hex]
+            assert arrays.terrain[index] == clue_engine.TERRAIN_CODES[tile.terrain]
+            if tile.animal_territory is None:
+                assert arrays.animal_territory[index] == clue_engine.NO_FEATURE
+            else:
+                assert arrays.animal_territory[index] == clue_engine.ANIMAL_TERRITORY_CODES[tile.animal_territory]
+            if tile.structure is None:
+                assert arrays.structure_shape[index] == clue_engine.NO_FEATURE
+                assert arrays.structure_color[index] == clue_engine.NO_FEATURE
+            else:
+                assert arrays.structure_shape[index] == clue_engine.SHAPE_CODES[tile.structure.shape]
+                assert arrays.structure_color[index] == clue_engine.COLOR_CODES[tile.structure.color]
+
+    def test_place_structure_refreshes_arrays(self):
+        board = Board.from_board_sections([1, 2, 3, 4, 5, 6])
+        assert np.all(board.arrays.structure_shape == clue_engine.NO_FEATURE)
+        board.place_structure(Structure(Shape.ABANDONED_SHACK, Color.GREEN), board.slots[10])
+        assert board.arrays.structure_shape[10] == clue_engine.SHAPE_CODES[Shape.ABANDONED_SHACK]
+        assert board.arrays.structure_color[10] == clue_engine.COLOR_CODES[Color.GREEN]
+
+
+class TestNeighborhoodIndices:
+    def test_shape(self, board):
+        for radius, size in [(0, 1), (1, 7), (2, 19), (3, 37)]:
+            assert board.neighborhood(radius).shape == (108, size)
+
+    def test_matches_get_tiles_in_range(self, board):
+        for radius in [1, 2, 3]:
+            neighborhood = board.neighborhood(radius)
+            for index, hex in enumerate(board.slots):
+                expected = {board.slot_index[tile.hex] for tile in board.get_tiles_in_range(hex, radius)}
+                assert set(neighborhood[index]) - {len(board.slots)} == expected
+
+    def test_to_mask(self):
+        assert clue_engine.to_mask(np.zeros(108, dtype=np.bool_)) == 0
+        assert clue_engine.to_mask(np.ones(108, dtype=np.bool_)) == (1 << 108) - 1
+        values = np.zeros(108, dtype=np.bool_)
+        values[[0, 9, 107]] = True
+        assert clue_engine.to_mask(values) == (1 << 0) | (1 << 9) | (1 << 107)
+
+
+class TestVectorizedClues:
+    def test_matches_reference_resolve(self, board):
+        unique_clues = {
+            (type(clue), clue): clue
+            for book in [RED_CLUES, GREEN_CLUES, BLUE_CLUES, BROWN_CLUES, PURPLE_CLUES]
+            for clue in book[1:]
+        }
+        for clue in unique_clues.values():
+            assert clue.resolve_mask(board) == Clue.resolve_mask(clue, board), str(clue)
+
+    def test_on_terrains(self, board):
+        values = clue_engine.on_terrains(board.arrays, [Terrain.WATER, Terrain.SWAMP])
+        assert values.sum() == 43
+        assert np.array_equal(values, np.isin(board.arrays.terrain, [Terrain.WATER.code, Terrain.SWAMP.code]))
+
+    def test_feature_codes(self, board):
+        arrays = board.arrays
+        for index, hex in enumerate(board.slots):
+            tile = board.tiles[hex]
+            assert arrays.terrain_flags[index] == tile.terrain.flag
+            expected = clue_engine.NO_FEATURE if tile.structure is None else tile.structure.code
+            assert arrays.structure_codes[index] == expected
+
+
+class TestDistanceTransform:
+    @pytest.mark.parametrize(
+        "feature",
+        [*Terrain, *AnimalTerritory, *Shape, *Color, Terrain, AnimalTerritory, Shape, Color],
+    )
+    def test_matches_brute_force(self, board, feature):
+        sources = [
+            hex for index, hex in enumerate(board.slots) if clue_engine.feature_mask(board.arrays, feature)[index]
+        ]
+        distances = board.distance_to(feature)
+        for index, hex in enumerate(board.slots):
+            expected = min((hex.distance(source) for source in sources), default=clue_engine.UNREACHABLE)
+            assert distances[index] == expected
+
+    def test_slot_distances(self, board):
+        matrix = board.distance_matrix
+        assert matrix is Board.from_layout(0).distance_matrix
+        assert matrix.shape == (108, 108)
+        assert not matrix.flags.writeable
+        for index, hex in enumerate(board.slots):
+            assert matrix[index].tolist() == [hex.distance(other) for other in board.slots]
+
+        # mixed types of hex fall back to the axial kernel
+        slots = tuple(hex.to_axial_coordinate_hex() if index % 2 else hex for index, hex in enumerate(board.slots))
+        assert np.array_equal(clue_engine.slot_distances(slots), matrix)
+
+        # the matrix agrees with the breadth first distance transform behind distance_to
+        water = clue_engine.feature_mask(board.arrays, Terrain.WATER)
+        assert np.array_equal(matrix[:, water].min(axis=1), board.distance_to(Terrain.WATER))
+
+    def test_cached(self, board):
+        assert board.distance_to(Terrain.WATER) is board.distance_to(Terrain.WATER)
+        assert not board.distance_to(Terrain.WATER).flags.writeable
+
+    def test_matches_neighborhood_scan(self, board):
+        for radius in [1, 2, 3, 4]:
+            neighborhood = board.neighborhood(radius)
+            for terrain in Terrain:
+                assert np.array_equal(
+                    clue_engine.within_range_of_terrain(board.arrays, neighborhood, terrain),
+                    board.distance_to(terrain) <= radius,
+                )
+            for animal_territory in [*AnimalTerritory, None]:
+                assert np.array_equal(
+                    clue_engine.within_range_of_animal_territory(board.arrays, neighborhood, animal_territory),
+                    board.distance_to(animal_territory or AnimalTerritory) <= radius,
+                )
+            for shape in Shape:
+                assert np.array_equal(
+                    clue_engine.within_range_of_shape(board.arrays, neighborhood, shape),
+                    board.distance_to(shape) <= radius,
+                )
+            for color in Color:
+                assert np.array_equal(
+                    clue_engine.within_range_of_color(board.arrays, neighborhood, color),
+                    board.distance_to(color) <= radius,
+                )
+
+    def test_place_structure_invalidates(self):
+        board = Board.from_board_sections([1, 2, 3, 4, 5, 6])
+        water = board.distance_to(Terrain.WATER)
+        assert np.all(board.distance_to(Color.BLUE) == clue_engine.UNREACHABLE)
+        assert board.within_distance_mask(Shape.STANDING_STONE, 10) == 0
+
+        board.place_structure(Structure(Shape.STANDING_STONE, Color.BLUE), board.slots[0])
+        assert board.distance_to(Terrain.WATER) is water
+        assert board.distance_to(Color.BLUE)[0] == 0
+        assert board.distance_to(Color.BLUE)[1] == 1
+        assert board.within_distance_mask(Shape.STANDING_STONE, 30) == board.full_mask
+
+    def test_unknown_feature(self, board):
+        with pytest.raises(TypeError):
+            _ = board.distance_to("WATER")
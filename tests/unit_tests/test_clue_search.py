@@ -0,0 +1,92 @@
+import itertools
+
+import pytest
+
+from cryptid.board import Board
+from cryptid.clue import BLUE_CLUES, BROWN_CLUES, GREEN_CLUES, PURPLE_CLUES, RED_CLUES
+from cryptid.clue_search import ClueIndex, is_minimal
+from cryptid.generator import find_puzzles, unique_book_clues
+from cryptid.hex import DoubledHeightCoordinateHex
+from cryptid.setup_card import SETUP_CARDS
+from cryptid.solver import candidates, solve
+
+
+@pytest.fixture(scope="module")
+def board():
+    return Board.from_setup_card(SETUP_CARDS[0])
+
+
+@pytest.fixture(scope="module")
+def index(board):
+    return ClueIndex.build(board, unique_book_clues())
+
+
+class TestClueIndex:
+    def test_build(self, board, index):
+        assert len(set(index.masks)) == len(index.masks)
+        assert len(index.by_slot) == len(board.slots)
+        for slot, indices in enumerate(index.by_slot):
+            assert list(indices) == [i for i, mask in enumerate(index.masks) if mask >> slot & 1]
+        for mask, clues in zip(index.masks, index.clues):
+            assert all(board.clue_mask(clue).bits == mask for clue in clues)
+
+    def test_every_book_clue(self, board, index):
+        pool = [clue for book in [RED_CLUES, GREEN_CLUES, BLUE_CLUES, BROWN_CLUES, PURPLE_CLUES] for clue in book[1:]]
+        full_index = ClueIndex.build(board, pool)
+        assert full_index.masks == index.masks
+        assert sum(len(clues) for clues in full_index.clues) <= len(pool)
+
+    def test_clues_containing(self, board, index):
+        clues = unique_book_clues()
+        for hex in board.slots:
+            expected = [clue for clue in clues if hex in board.clue_mask(clue)]
+            assert sorted(map(str, index.clues_containing(hex))) == sorted(map(str, expected))
+        # clues that allow every tile are kept too
+        assert any(board.clue_mask(clue).bits == board.full_mask for clue in index.clues_containing(board.slots[0]))
+        with pytest.raises(KeyError):
+            index.clues_containing(DoubledHeightCoordinateHex(-1, 1))
+
+    def test_isolating_matches_brute_force(self, board, index):
+        hex = board.slots[40]
+        slot = board.slot_of(hex)
+        for k in [2, 3]:
+            for minimal in [True, False]:
+                expected = {
+                    combination
+                    for combination in itertools.combinations(range(len(index.masks)), k)
+                    if (not minimal or is_minimal([index.masks[i] for i in combination], board.full_mask))
+                    and board.full_mask & _intersection(index, combination) == 1 << slot
+                }
+                assert set(index.isolating_masks(hex, k, minimal=minimal)) == expected
+
+    def test_isolating_matches_find_puzzles(self, board, index):
+        clues = unique_book_clues()
+        expected = {
+            (frozenset(map(str, puzzle_clues)), cryptid) for puzzle_clues, cryptid in find_puzzles(board, clues, 3)
+        }
+        found = {
+            (frozenset(map(str, combination)), hex) for hex in board.slots for combination in index.isolating(hex, 3)
+        }
+        assert found == expected
+
+    def test_card_clues_are_found(self, board, index):
+        card = SETUP_CARDS[0]
+        cryptid = solve(card, 3, board)
+        card_clues = {str(clue) for clue in card.clues[3]}
+        combinations = list(index.isolating(cryptid, 3))
+        assert any({str(clue) for clue in combination} == card_clues for combination in combinations)
+        for combination in combinations:
+            assert list(candidates(board, combination)) == [cryptid.hex]
+
+    def test_limits(self, board, index):
+        hex = board.slots[40]
+        assert len(list(index.isolating_masks(hex, 4, max_combinations=3))) == 3
+        assert list(index.isolating_masks(hex, 0)) == []
+        assert list(index.isolating_masks(hex, 1)) == []
+
+
+def _intersection(index, combination):
+    output = -1
+    for i in combination:
+        output &= index.masks[i]
+    return output
@@ -70,6 +70,11 @@ class TestOnOneOfTwoTerrainClue:
         with pytest.raises(ValueError):
             _ = OnOneOfTwoTerrainClue(valid_terrains=[Terrain.WATER, Terrain.WATER])
 
+    def test_terrain_flags(self):
+        clue = OnOneOfTwoTerrainClue(valid_terrains=[Terrain.WATER, Terrain.DESERT])
+        assert clue.terrain_flags == Terrain.WATER.flag | Terrain.DESERT.flag
+        assert "terrain_flags" not in repr(clue)
+
     def test_hash(self):
         clue1 = OnOneOfTwoTerrainClue(valid_terrains=[Terrain.WATER, Terrain.DESERT])
         clue2 = OnOneOfTwoTerrainClue(valid_terrains=[Terrain.DESERT, Terrain.WATER])
@@ -0,0 +1,120 @@
+import itertools
+from dataclasses import replace
+
+from cryptid.board import Board
+from cryptid.generator import (
+    ADVANCED_STRUCTURES,
+    BASE_STRUCTURES,
+    GenerationStats,
+    Puzzle,
+    find_puzzles,
+    generate_puzzles,
+    make_shards,
+    unique_book_clues,
+)
+from cryptid.setup_card import SETUP_CARDS
+from cryptid.solver import candidates
+
+
+def puzzle_key(puzzle: Puzzle) -> tuple:
+    return puzzle.layout_index, str(puzzle.structures), tuple(str(clue) for clue in puzzle.clues), puzzle.cryptid
+
+
+class TestGenerator:
+    def test_unique_book_clues(self):
+        clues = unique_book_clues()
+        assert len({(type(clue), clue) for clue in clues}) == len(clues)
+        assert len(clues) < 5 * 96
+
+    def test_structures(self):
+        assert len(BASE_STRUCTURES) == 6
+        assert len(set(BASE_STRUCTURES)) == 6
+        assert len(ADVANCED_STRUCTURES) == 8
+
+    def test_find_puzzles(self):
+        board = Board.from_setup_card(SETUP_CARDS[0])
+        clues = unique_book_clues()
+        puzzles = list(find_puzzles(board, clues, 3))
+        assert len(puzzles) > 0
+        for puzzle_clues, cryptid in puzzles:
+            assert len(puzzle_clues) == 3
+            assert list(candidates(board, puzzle_clues)) == [cryptid]
+            # every clue is needed
+            for others in itertools.combinations(puzzle_clues, 2):
+                assert len(candidates(board, others)) > 1
+
+        # the card's own 3 player clues are one of the puzzles found
+        card_clues = {str(clue) for clue in SETUP_CARDS[0].clues[3]}
+        assert any({str(clue) for clue in puzzle_clues} == card_clues for puzzle_clues, _ in puzzles)
+
+    def test_find_puzzles_keeps_clues_with_the_same_mask(self):
+        board = Board.from_setup_card(SETUP_CARDS[0])
+        clues = unique_book_clues()
+        clue = next(find_puzzles(board, clues, 3))[0][0]
+        twin = replace(clue)
+        puzzles = [puzzle_clues for puzzle_clues, _ in find_puzzles(board, [*clues, twin], 3)]
+        with_clue = [puzzle_clues for puzzle_clues in puzzles if any(c is clue for c in puzzle_clues)]
+        with_twin = [puzzle_clues for puzzle_clues in puzzles if any(c is twin for c in puzzle_clues)]
+        assert len(with_clue) > 0
+        assert len(with_twin) == len(with_clue)
+
+    def test_find_puzzles_limit(self):
+        board = Board.from_setup_card(SETUP_CARDS[0])
+        assert len(list(find_puzzles(board, unique_book_clues(), 3, max_puzzles=5))) == 5
+        assert len(list(find_puzzles(board, unique_book_clues(), 1))) == 0
+
+    def test_not_minimal(self):
+        board = Board.from_setup_card(SETUP_CARDS[0])
+        clues = unique_book_clues()
+        # a clue with the same mask as one of a 3 clue puzzle, so 4 clue combinations can use both
+        pool = [*clues, replace(next(find_puzzles(board, clues, 3))[0][0])]
+        masks = [board.clue_mask(clue).bits for clue in pool]
+        # the pool has clues that rule out nothing, which can still complete a non minimal puzzle
+        assert board.full_mask in masks
+        expected = set()
+        for combination in itertools.combinations(range(len(pool)), 4):
+            intersection = board.full_mask
+            for i in combination:
+                intersection &= masks[i]
+            if intersection and intersection & (intersection - 1) == 0:
+                expected.add((combination, board.slots[intersection.bit_length() - 1]))
+        position = {id(clue): i for i, clue in enumerate(pool)}
+        found = [
+            (tuple(sorted(position[id(clue)] for clue in puzzle_clues)), cryptid)
+            for puzzle_clues, cryptid in find_puzzles(board, pool, 4, minimal=False)
+        ]
+        assert len(found) == len(set(found))
+        assert set(found) == expected
+
+    def test_make_shards_deterministic(self):
+        assert make_shards(5, seed=3) == make_shards(5, seed=3)
+        assert make_shards(5, seed=3) != make_shards(5, seed=4)
+
+    def test_generate_puzzles(self):
+        stats = GenerationStats()
+        puzzles = list(generate_puzzles(3, seed=5, max_workers=1, max_puzzles_per_board=20, stats=stats))
+        assert stats.boards == 3
+        assert stats.puzzles == len(puzzles)
+        assert 0 < len(puzzles) <= 60
+        assert stats.puzzles_per_second_per_core > 0
+        assert "puzzles/s/core" in str(stats)
+
+        for puzzle in puzzles:
+            board = puzzle.to_board()
+            assert len(puzzle.structures) == 6
+            assert len({location for location, _ in puzzle.structures}) == 6
+            assert list(candidates(board, puzzle.clues)) == [puzzle.cryptid]
+
+    def test_generate_puzzles_parallel(self):
+        serial = list(generate_puzzles(2, seed=9, max_workers=1, max_puzzles_per_board=10))
+        stats = GenerationStats()
+        parallel = list(generate_puzzles(2, seed=9, max_workers=2, max_puzzles_per_board=10, stats=stats))
+        assert stats.workers == 2
+        assert sorted(map(puzzle_key, serial)) == sorted(map(puzzle_key, parallel))
+
+    def test_generate_puzzles_closed_early(self):
+        stats = GenerationStats()
+        puzzles = generate_puzzles(20, seed=9, max_workers=2, max_puzzles_per_board=1, stats=stats)
+        next(puzzles)
+        puzzles.close()
+        assert stats.boards == 1
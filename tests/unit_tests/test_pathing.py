@@ -0,0 +1,89 @@
+import math
+import random
+
+import numpy as np
+import pytest
+
+from cryptid.board import Board
+from cryptid.board_layouts import BOARD_HEXES
+from cryptid.hex import AxialCoordinateHex, CubeCoordinateHex, DoubledHeightCoordinateHex, OddRowOffsetCoordinateHex
+from cryptid.pathing import PathTable, cost_codes, find_path, hex_line, path_costs_from
+from cryptid.tile import Terrain
+
+AVOID_WATER_AND_MOUNTAINS = {Terrain.WATER: math.inf, Terrain.MOUNTAIN: math.inf}
+WEIGHTED = {Terrain.WATER: 5.0, Terrain.MOUNTAIN: 3.0, Terrain.SWAMP: 2.0, Terrain.DESERT: 0.5}
+
+
+@pytest.fixture(params=[0, 1000, 20000])
+def board(request) -> Board:
+    return Board.from_layout(request.param)
+
+
+class TestHexLine:
+    def test_line(self):
+        for hex_type in [AxialCoordinateHex, CubeCoordinateHex, DoubledHeightCoordinateHex, OddRowOffsetCoordinateHex]:
+            start = hex_type.from_axial_coordinate_hex(AxialCoordinateHex(-2, 1))
+            for end in start.hexes_within_range(6):
+                line = hex_line(start, end)
+                assert len(line) == start.distance(end) + 1
+                assert line[0] == start and line[-1] == end
+                assert all(type(hex) is hex_type for hex in line)
+                assert all(line[i].distance(line[i - 1]) == 1 for i in range(1, len(line)))
+
+    def test_straight_lines(self):
+        origin = AxialCoordinateHex(0, 0)
+        for direction in origin.neighbor_directions:
+            assert hex_line(origin, 4 * direction) == [i * direction for i in range(5)]
+        assert hex_line(origin, origin) == [origin]
+
+
+class TestPathing:
+    def test_uniform_costs_match_distance(self, board):
+        table = board.path_table()
+        assert np.array_equal(table.costs, board.distance_matrix)
+        random.seed(19)
+        for start, goal in [random.sample(BOARD_HEXES, 2) for _ in range(20)]:
+            path = find_path(board, start, goal)
+            assert path.cost == start.distance(goal)
+            assert len(path.hexes) == start.distance(goal) + 1
+
+    @pytest.mark.parametrize("costs", [AVOID_WATER_AND_MOUNTAINS, WEIGHTED])
+    def test_search_modes_agree(self, board, costs):
+        table = board.path_table(costs)
+        step_costs = dict(zip(Terrain, [costs.get(terrain, 1.0) for terrain in Terrain]))
+        random.seed(23)
+        for start in random.sample(BOARD_HEXES, 5):
+            start_slot = board.slot_of(start)
+            from_start = path_costs_from(board, start, costs)
+            assert np.array_equal(from_start, table.costs[start_slot])
+            for goal_slot, goal in enumerate(BOARD_HEXES):
+                path = find_path(board, start, board.tiles[goal], costs)
+                table_path = table.path(start_slot, goal_slot)
+                if math.isinf(from_start[goal_slot]):
+                    assert path is None and table_path is None
+                    continue
+                assert path.cost == table_path.cost == from_start[goal_slot]
+                for found in [path, table_path]:
+                    assert found.hexes[0] == start and found.hexes[-1] == goal
+                    assert all(found.hexes[i].distance(found.hexes[i - 1]) == 1 for i in range(1, len(found.hexes)))
+                    assert sum(step_costs[board.tiles[hex].terrain] for hex in found.hexes[1:]) == found.cost
+
+    def test_avoid_terrain(self, board):
+        for start_slot, goal_slot in [(0, 107), (5, 60), (100, 3)]:
+            path = board.path_table(AVOID_WATER_AND_MOUNTAINS).path(start_slot, goal_slot)
+            if path is not None:
+                assert all(board.tiles[hex].terrain not in AVOID_WATER_AND_MOUNTAINS for hex in path.hexes[1:])
+
+    def test_path_table_cached(self, board):
+        table = board.path_table(WEIGHTED)
+        assert board.path_table(dict(WEIGHTED)) is table
+        assert board.path_table({**WEIGHTED, Terrain.FOREST: 1.0}) is table
+        assert board.path_table() is not table
+        assert isinstance(table, PathTable)
+        assert not table.costs.flags.writeable
+
+    def test_errors(self, board):
+        with pytest.raises(ValueError):
+            cost_codes({Terrain.WATER: -1})
+        with pytest.raises(KeyError):
+            find_path(board, BOARD_HEXES[0], DoubledHeightCoordinateHex(-1, 1))
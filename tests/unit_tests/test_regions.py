@@ -0,0 +1,79 @@
+import numpy as np
+import pytest
+
+from cryptid.board import Board
+from cryptid.clue_engine import NO_FEATURE
+from cryptid.regions import Regions, label_regions
+from cryptid.setup_card import SETUP_CARDS
+from cryptid.tile import AnimalTerritory, Color, Shape, Structure, Terrain
+
+
+def feature_of(tile, feature_type):
+    return tile.terrain if feature_type is Terrain else tile.animal_territory
+
+
+def flood_fill_regions(board: Board, feature_type) -> list[set]:
+    """
+    reference regions found with breadth first searches over the board tiles
+    """
+    seen, regions = set(), []
+    for hex in board.slots:
+        feature = feature_of(board.tiles[hex], feature_type)
+        if hex in seen or feature is None:
+            continue
+        region, frontier = {hex}, [hex]
+        while frontier:
+            for tile in board.get_tiles_in_range(frontier.pop(), 1):
+                if tile.hex not in region and feature_of(tile, feature_type) is feature:
+                    region.add(tile.hex)
+                    frontier.append(tile.hex)
+        seen |= region
+        regions.append(region)
+    return regions
+
+
+@pytest.fixture(params=[0, 5000, 40000])
+def board(request) -> Board:
+    return Board.from_layout(request.param)
+
+
+class TestRegions:
+    @pytest.mark.parametrize("feature_type", [Terrain, AnimalTerritory])
+    def test_matches_flood_fill(self, board, feature_type):
+        regions = board.regions(feature_type)
+        expected = flood_fill_regions(board, feature_type)
+        assert len(regions) == len(expected)
+        for region, hexes in enumerate(expected):
+            assert board.hex_set(hexes).bits == regions.mask(region)
+            assert regions.sizes[region] == len(hexes)
+            assert regions.features[region] is feature_of(board.tiles[next(iter(hexes))], feature_type)
+            # edges that lead off the board or out of the region
+            assert regions.perimeters[region] == sum(
+                6 - sum(neighbor in hexes for neighbor in hex.neighbors) for hex in hexes
+            )
+            touching = {
+                int(regions.labels[board.slot_of(neighbor)])
+                for hex in hexes
+                for neighbor in hex.neighbors
+                if neighbor not in hexes and board.slot_of(neighbor) is not None
+            }
+            assert set(regions.neighbors(region)) == touching - {-1}
+        assert np.array_equal(regions.adjacency, regions.adjacency.T)
+        assert sum(len(regions.regions_of(feature)) for feature in feature_type) == len(regions)
+
+    def test_labels(self):
+        # a line of 5 slots, the middle one without a feature
+        neighbors = ((1,), (0, 2), (1, 3), (2, 4), (3,))
+        codes = np.array([2, 2, NO_FEATURE, 2, 1], dtype=np.int8)
+        assert label_regions(codes, neighbors).tolist() == [0, 0, -1, 1, 2]
+
+    def test_cached(self):
+        card = SETUP_CARDS[0]
+        board = Board.from_board_sections(card.board_sections, card.board_sections_inverted)
+        regions = board.regions(Terrain)
+        assert board.regions(Terrain) is regions
+        board.place_structure(Structure(Shape.STANDING_STONE, Color.BLUE), board.slots[0])
+        assert board.regions(Terrain) is regions
+        assert board.regions(AnimalTerritory) is not regions
+        with pytest.raises(TypeError):
+            Regions.from_board(board, Shape)
@@ -0,0 +1,77 @@
+import pytest
+
+from cryptid.board import Board
+from cryptid.clue import OnOneOfTwoTerrainClue, WithinOneSpaceOfTerrainClue
+from cryptid.hex import DoubledHeightCoordinateHex
+from cryptid.setup_card import SETUP_CARDS, SetupCard
+from cryptid.solver import candidates, solve, solve_setup_cards
+from cryptid.tile import Terrain
+
+
+class TestSolver:
+    def test_solve(self):
+        card = SETUP_CARDS[0]
+        assert solve(card, 3).hex == DoubledHeightCoordinateHex(8, 2)
+        assert solve(card, 4).hex == DoubledHeightCoordinateHex(2, 4)
+        assert solve(card, 5).hex == DoubledHeightCoordinateHex(9, 15)
+
+    def test_solution_satisfies_clues(self):
+        card = SETUP_CARDS[0]
+        board = Board.from_setup_card(card)
+        for players in [3, 4, 5]:
+            tile = solve(card, players, board)
+            assert all(clue.check_space(tile, board) for clue in card.clues[players])
+
+    def test_candidates(self):
+        board = Board.from_setup_card(SETUP_CARDS[0])
+        assert candidates(board, []) == board.full_hex_set()
+
+        water = OnOneOfTwoTerrainClue(valid_terrains=[Terrain.WATER, Terrain.DESERT])
+        not_water = OnOneOfTwoTerrainClue(valid_terrains=[Terrain.WATER, Terrain.DESERT], negated=True)
+        assert len(candidates(board, [water])) == 43
+        assert len(candidates(board, [water, not_water])) == 0
+
+    def test_invalid_players(self):
+        with pytest.raises(ValueError, match="players"):
+            _ = solve(SETUP_CARDS[0], 2)
+
+    def test_not_unique(self):
+        card = SETUP_CARDS[0]
+        bad_card = SetupCard(
+            board_sections=card.board_sections,
+            board_sections_inverted=card.board_sections_inverted,
+            structures=card.structures,
+            clues_3_player=(
+                OnOneOfTwoTerrainClue(valid_terrains=[Terrain.WATER, Terrain.DESERT]),
+                WithinOneSpaceOfTerrainClue(terrain=Terrain.FOREST),
+                WithinOneSpaceOfTerrainClue(terrain=Terrain.SWAMP),
+            ),
+            clues_4_player=card.clues_4_player,
+            clues_5_player=card.clues_5_player,
+        )
+        with pytest.raises(ValueError, match="exactly 1 tile") as e:
+            _ = solve(bad_card, 3)
+        assert "remaining tiles" in str(e.value)
+
+        assert solve(bad_card, 4) == solve(card, 4)
+        with pytest.raises(ValueError, match="1 invalid setup card"):
+            _ = solve_setup_cards([card, bad_card])
+
+    def test_solve_setup_cards(self):
+        solutions = solve_setup_cards()
+        assert len(solutions) == 3 * len(SETUP_CARDS)
+        assert solutions[(0, 3)].hex == DoubledHeightCoordinateHex(8, 2)
+
+    def test_cached_masks(self, monkeypatch):
+        card = SETUP_CARDS[0]
+        board = Board.from_setup_card(card)
+        expected = solve(card, 5, board)
+        for clue in card.clues[5]:
+            assert board._clue_masks[(type(clue), clue)] is board.clue_mask(clue).bits
+
+        def uncached(*_):
+            raise AssertionError("clue mask evaluated again")
+
+        for clue in card.clues[5]:
+            monkeypatch.setattr(type(clue), "check_mask", uncached)
+        assert solve(card, 5, board) == expected
@@ -240,3 +240,17 @@ class TestTile:
 
         with pytest.raises(TypeError):
             _ = 5 - tileA
+
+    def test_tile_slots_and_equality(self):
+        tile = Tile(hex=DoubledHeightCoordinateHex(1, 5), terrain=Terrain.MOUNTAIN)
+        assert not hasattr(tile, "__dict__")
+        with pytest.raises(AttributeError):
+            tile.height = 3  # type: ignore[attr-defined]
+
+        moved = tile.with_hex(DoubledHeightCoordinateHex(2, 6))
+        assert moved.hex == DoubledHeightCoordinateHex(2, 6) and moved.terrain is tile.terrain
+        assert moved.with_hex(tile.hex) == tile
+        assert tile != Tile(hex=tile.hex, terrain=Terrain.FOREST)
+        assert tile != Tile(
+            hex=tile.hex, terrain=Terrain.MOUNTAIN, structure=Structure(Shape.ABANDONED_SHACK, Color.WHITE)
+        )
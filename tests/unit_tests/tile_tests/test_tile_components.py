@@ -1,4 +1,14 @@
-from cryptid.tile import AnimalTerritory, Color, Shape, Structure, Terrain
+from cryptid.tile import AnimalTerritory, Color, Shape, Structure, Terrain, flags
+
+
+class TestCodes:
+    def test_codes_and_flags(self):
+        for enum in [AnimalTerritory, Terrain, Color, Shape]:
+            assert [member.code for member in enum] == list(range(len(enum)))
+            assert [member.flag for member in enum] == [1 << code for code in range(len(enum))]
+            assert enum(list(enum)[-1].value).code == len(enum) - 1
+        assert flags([Terrain.WATER, Terrain.SWAMP]) == Terrain.WATER.flag | Terrain.SWAMP.flag
+        assert flags([]) == 0
 
 
 class TestAnimalTerritory:
@@ -49,3 +59,8 @@ class TestStructure:
             color=Color.BLUE,
         )
         assert str(struct) == "Structure(shape=STANDING_STONE, color=BLUE)"
+
+    def test_code(self):
+        structures = [Structure(shape, color) for shape in Shape for color in Color]
+        assert sorted(structure.code for structure in structures) == list(range(len(structures)))
+        assert all(Structure.from_code(structure.code) == structure for structure in structures)